@@ -4,45 +4,88 @@ import math
 import settings
 from business.entities.entity import MovableEntity
 from business.entities.interfaces import IBullet
+from business.handlers.collision_layers import CollisionLayer, CollisionLayers
+from business.world.column_store import VIEW_SLOTS, ColumnView
 from business.world.interfaces import IGameWorld
+from business.world.projectile_array import ProjectileArray
 from presentation.sprite import BulletSprite
 
 
-class Bullet(MovableEntity, IBullet):
-    """A bullet that moves towards a target direction."""
+class Bullet(ColumnView, MovableEntity, IBullet):
+    """A bullet that moves towards a target direction.
 
-    def __init__(self, src_x, src_y, dst_x, dst_y, speed):
-        super().__init__(src_x, src_y, speed, BulletSprite(src_x, src_y))
-        self.__dir_x, self.__dir_y = self.__calculate_direction(dst_x - src_x, dst_y - src_y)
-        self.__health: int = 1
-        self.__damage_amount: int = 5
-        self.__final_damage_amount: int = 0
+    The state of the bullet lives in a row of a ProjectileArray and the object is a thin
+    view over it. Its sprite is only created when it is first needed.
+    """
 
-    def __calculate_direction(self, dx, dy):
+    __slots__ = VIEW_SLOTS
+
+    def __init__(self, src_x, src_y, dst_x, dst_y, speed, damage: int = 5, store: ProjectileArray | None = None):
+        (store if store is not None else ProjectileArray(1)).add(
+            self, Bullet.initial_values(src_x, src_y, dst_x, dst_y, speed, damage))
+        super().__init__(src_x, src_y, speed, None)
+
+    @staticmethod
+    def initial_values(src_x, src_y, dst_x, dst_y, speed, damage: int = 5) -> dict:
+        """Returns the row of a bullet fired from a point towards another one.
+
+        Returns:
+            dict: The value of each column of the ProjectileArray.
+        """
+        dir_x, dir_y = Bullet.__calculate_direction(dst_x - src_x, dst_y - src_y)
+        return {
+            'pos_x': src_x,
+            'pos_y': src_y,
+            'previous_pos_x': src_x,
+            'previous_pos_y': src_y,
+            'dir_x': dir_x,
+            'dir_y': dir_y,
+            'speed': speed,
+            'damage': damage,
+            'final_damage': 0,
+            'health': 1,
+            'lifetime': settings.BULLET_LIFETIME,
+        }
+
+    @staticmethod
+    def __calculate_direction(dx, dy):
         distance = math.hypot(dx, dy)
         if distance != 0:
             return dx / distance, dy / distance
         return 0, 0
 
+    @property
+    def sprite(self) -> BulletSprite:
+        if self._sprite is None:
+            self._sprite = BulletSprite(self.pos_x, self.pos_y)
+        else:
+            # The store moves the bullets without touching their sprites
+            self._sprite.update_pos(self.pos_x, self.pos_y)
+        return self._sprite
+
     def take_damage(self, amount):
-        self.__health = max(0, self.__health - amount)
-        self.sprite.take_damage()
+        # No damage tint, a bullet is removed on its first hit
+        self._set('health', max(0, self.health - amount))
 
     def update(self, world: IGameWorld):
-        self.__final_damage_amount = self.__damage_amount * world.player.damage_amount
-        self.move(self.__dir_x, self.__dir_y)
+        """Updates this bullet alone. The world moves its bullets with ProjectileArray.step."""
+        self._set('final_damage', self._get('damage') * world.player.damage_amount)
+        self._set('previous_pos_x', self.pos_x)
+        self._set('previous_pos_y', self.pos_y)
+        self.move(self._get('dir_x'), self._get('dir_y'))
+        self._set('lifetime', self._get('lifetime') - 1)
 
     def __str__(self):
-        return f"Bullet(pos=({self._pos_x, self._pos_y}), dir=({self.__dir_x, self.__dir_y}))"
+        return f"Bullet(pos=({self._pos_x, self._pos_y}), dir=({self._get('dir_x'), self._get('dir_y')}))"
 
     def json_format(self):
         return {
             'pos_x': self.pos_x,
             'pos_y': self.pos_y,
-            'dir_x': self.__dir_x,
-            'dir_y': self.__dir_y,
-            'damage_amount': self.__damage_amount,
-            'health': self.__health,
+            'dir_x': self._get('dir_x'),
+            'dir_y': self._get('dir_y'),
+            'damage_amount': self._get('damage'),
+            'health': self.health,
             'speed': self.speed
         }
 
@@ -59,8 +102,19 @@ class Bullet(MovableEntity, IBullet):
 
     @property
     def damage_amount(self):
-        return self.__final_damage_amount
+        return self._get('final_damage')
 
     @property
     def health(self) -> int:
-        return self.__health
+        return self._get('health')
+
+    @property
+    def previous_pos_x(self) -> float:
+        return self._get('previous_pos_x')
+
+    @property
+    def previous_pos_y(self) -> float:
+        return self._get('previous_pos_y')
+
+
+CollisionLayers.register(Bullet, CollisionLayer.PLAYER_PROJECTILE, CollisionLayer.MONSTER)
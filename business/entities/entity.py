@@ -10,6 +10,10 @@ from presentation.sprite import Sprite
 class Entity(IHasPosition, IHasSprite):
     """Base class for all entities in the game."""
 
+    # No slots for the position: the column views proxy it to their store, and the player
+    # keeps it in its __dict__
+    __slots__ = ('_sprite',)
+
     def __init__(self, pos_x: float, pos_y: float, sprite: Sprite):
         self._pos_x: float = pos_x
         self._pos_y: float = pos_y
@@ -47,6 +51,9 @@ class Entity(IHasPosition, IHasSprite):
 class MovableEntity(Entity, ICanMove):
     """Base class for all entities that can move."""
 
+    # The speed is stored like the position
+    __slots__ = ()
+
     def __init__(self, pos_x: float, pos_y: float, speed: float, sprite: Sprite):
         super().__init__(pos_x, pos_y, sprite)
         self._pos_x: float = pos_x
@@ -65,6 +72,7 @@ class MovableEntity(Entity, ICanMove):
         self._pos_y += direction_y * self._speed
 
         self.sprite.update_pos(self._pos_x, self._pos_y)
+        self.sprite.face(direction_x)
 
     @property
     def speed(self) -> float:
@@ -74,6 +82,8 @@ class MovableEntity(Entity, ICanMove):
 class DamageableEntity(Entity, IDamageable):
     """ Base class for all entities that can be damaged. """
 
+    __slots__ = ('__health',)
+
     def __init__(self, pos_x: float, pos_y: float, sprite: Sprite, health: int):
         super().__init__(pos_x, pos_y, sprite)
         self.__health = health
@@ -1,22 +1,65 @@
 """Module for the ExperienceGem class."""
 
+import settings
 from business.entities.entity import Entity
 from business.entities.interfaces import IExperienceGem
-from presentation.sprite import ExperienceGemSprite, SpeedGemSprite, DamageGemSprite, DefenceGemSprite, HealthGemSprite
+from business.handlers.collision_layers import CollisionLayer, CollisionLayers
+from business.world.column_store import VIEW_SLOTS, ColumnView
+from business.world.gem_array import GemArray
+from presentation.sprite import Sprite, ExperienceGemSprite, SpeedGemSprite, DamageGemSprite, DefenceGemSprite, HealthGemSprite
+
+
+class Gem(ColumnView, Entity):
+    """Base class for the gems.
+
+    The state of a gem lives in a row of a GemArray and the object is a thin view over it.
+    A gem that is not in the world keeps its row in a store of its own.
+
+    Args:
+        amount (int): The experience the gem gives.
+        mergeable (bool): If the gem can be folded with the gems around it.
+        lifetime (int): Ticks of the world before the gem disappears, 0 to keep it.
+    """
+
+    __slots__ = VIEW_SLOTS
+
+    def __init__(self, pos_x: float, pos_y: float, sprite: Sprite, amount: int,
+                 mergeable: bool = False, lifetime: int = 0):
+        GemArray(1).add(self, {
+            'pos_x': pos_x,
+            'pos_y': pos_y,
+            'width': sprite.rect.width,
+            'height': sprite.rect.height,
+            'amount': amount,
+            'mergeable': mergeable,
+            'lifetime': lifetime if lifetime > 0 else -1,
+        })
+        super().__init__(pos_x, pos_y, sprite)
 
+    @property
+    def amount(self) -> int:
+        return self._get('amount')
+
+    @property
+    def sprite(self) -> Sprite:
+        # The store pulls the gems without touching their sprites
+        self._sprite.update_pos(self.pos_x, self.pos_y)
+        return self._sprite
 
-class ExperienceGem(Entity, IExperienceGem):
+
+class ExperienceGem(Gem, IExperienceGem):
     """Represents an experience gem in the game world."""
 
+    __slots__ = ()
+
     def __init__(self, pos_x: float, pos_y: float, amount: int):
-        super().__init__(pos_x, pos_y, ExperienceGemSprite(pos_x, pos_y))
-        self.__amount = amount
+        super().__init__(pos_x, pos_y, ExperienceGemSprite(pos_x, pos_y), amount, mergeable=True)
 
     def json_format(self):
         return {
             'pos_x': self.pos_x,
             'pos_y': self.pos_y,
-            'amount': self.__amount,
+            'amount': self.amount,
         }
 
     @staticmethod
@@ -28,28 +71,25 @@ class ExperienceGem(Entity, IExperienceGem):
 
         return ExperienceGem(src_x, src_y, amount)
 
-    @property
-    def amount(self) -> int:
-        return self.__amount
-
     def __str__(self):
-        return f"ExperienceGem(amount={self.__amount}, pos=({self.pos_x}, {self.pos_y}))"
+        return f"ExperienceGem(amount={self.amount}, pos=({self.pos_x}, {self.pos_y}))"
 
 
-class SpeedGem(Entity, IExperienceGem):
+class SpeedGem(Gem, IExperienceGem):
     """Gema temporal que incrementa la velocidad del jugador"""
 
+    __slots__ = ('__speed_boost', '__duration')
+
     def __init__(self, pos_x: float, pos_y: float, amount: int, speed_boost: int, duration: int):
-        super().__init__(pos_x, pos_y, SpeedGemSprite(pos_x, pos_y))
+        super().__init__(pos_x, pos_y, SpeedGemSprite(pos_x, pos_y), amount, lifetime=settings.GEM_BUFF_LIFETIME)
         self.__speed_boost = speed_boost
         self.__duration = duration
-        self.__amount = amount
 
     def json_format(self):
         return {
             'pos_x': self.pos_x,
             'pos_y': self.pos_y,
-            'amount': self.__amount,
+            'amount': self.amount,
             'boost': self.__speed_boost,
             'duration': self.__duration,
         }
@@ -69,29 +109,26 @@ class SpeedGem(Entity, IExperienceGem):
         """Applies a temporary speed boost to the player."""
         pass
 
-    @property
-    def amount(self) -> int:
-        return self.__amount
-
     def __str__(self):
         return (f"SpeedGem(amount={self.amount}, pos=({self.pos_x}, {self.pos_y}), "
                 f"speed_boost={self.__speed_boost}, duration={self.__duration})")
 
 
-class DamageGem(Entity, IExperienceGem):
+class DamageGem(Gem, IExperienceGem):
     """Gema temporal que incrementa el daño del jugador"""
 
+    __slots__ = ('__damage_boost', '__duration')
+
     def __init__(self, pos_x: float, pos_y: float, amount: int, damage_boost: int, duration: int):
-        super().__init__(pos_x, pos_y, DamageGemSprite(pos_x, pos_y))
+        super().__init__(pos_x, pos_y, DamageGemSprite(pos_x, pos_y), amount, lifetime=settings.GEM_BUFF_LIFETIME)
         self.__damage_boost = damage_boost
         self.__duration = duration
-        self.__amount = amount
 
     def json_format(self):
         return {
             'pos_x': self.pos_x,
             'pos_y': self.pos_y,
-            'amount': self.__amount,
+            'amount': self.amount,
             'boost': self.__damage_boost,
             'duration': self.__duration,
         }
@@ -111,29 +148,26 @@ class DamageGem(Entity, IExperienceGem):
         """Applies a temporary damage boost to the player."""
         pass
 
-    @property
-    def amount(self) -> int:
-        return self.__amount
-
     def __str__(self):
         return (f"DamageGem(amount={self.amount}, pos=({self.pos_x}, {self.pos_y}), "
                 f"damage_boost={self.__damage_boost}, duration={self.__duration})")
 
 
-class DefenceGem(Entity, IExperienceGem):
+class DefenceGem(Gem, IExperienceGem):
     """Gema temporal que incrementa la defensa del jugador"""
 
+    __slots__ = ('__defence_boost', '__duration')
+
     def __init__(self, pos_x: float, pos_y: float, amount: int, defence_boost: int, duration: int):
-        super().__init__(pos_x, pos_y, DefenceGemSprite(pos_x, pos_y))
+        super().__init__(pos_x, pos_y, DefenceGemSprite(pos_x, pos_y), amount, lifetime=settings.GEM_BUFF_LIFETIME)
         self.__defence_boost = defence_boost
         self.__duration = duration
-        self.__amount = amount
 
     def json_format(self):
         return {
             'pos_x': self.pos_x,
             'pos_y': self.pos_y,
-            'amount': self.__amount,
+            'amount': self.amount,
             'boost': self.__defence_boost,
             'duration': self.__duration,
         }
@@ -153,29 +187,26 @@ class DefenceGem(Entity, IExperienceGem):
         """Applies a temporary defence boost to the player."""
         pass
 
-    @property
-    def amount(self) -> int:
-        return self.__amount
-
     def __str__(self):
         return (f"DefenceGem(amount={self.amount}, pos=({self.pos_x}, {self.pos_y}), "
                 f"defence_boost={self.__defence_boost}, duration={self.__duration})")
 
 
-class HealthGem(Entity, IExperienceGem):
+class HealthGem(Gem, IExperienceGem):
     """Gema que incrementa la vida del jugador"""
 
+    __slots__ = ('__health_boost', '__duration')
+
     def __init__(self, pos_x: float, pos_y: float, amount: int, health_boost: int, duration: int):
-        super().__init__(pos_x, pos_y, HealthGemSprite(pos_x, pos_y))
+        super().__init__(pos_x, pos_y, HealthGemSprite(pos_x, pos_y), amount, lifetime=settings.GEM_BUFF_LIFETIME)
         self.__health_boost = health_boost
         self.__duration = duration
-        self.__amount = amount
 
     def json_format(self):
         return {
             'pos_x': self.pos_x,
             'pos_y': self.pos_y,
-            'amount': self.__amount,
+            'amount': self.amount,
             'boost': self.__health_boost,
             'duration': self.__duration,
         }
@@ -195,10 +226,13 @@ class HealthGem(Entity, IExperienceGem):
         """Applies a temporary defence boost to the player."""
         pass
 
-    @property
-    def amount(self) -> int:
-        return self.__amount
-
     def __str__(self):
         return (f"DefenceGem(amount={self.amount}, pos=({self.pos_x}, {self.pos_y}), "
                 f"defence_boost={self.__health_boost}, duration={self.__duration})")
+
+
+CollisionLayers.register(ExperienceGem, CollisionLayer.PICKUP, CollisionLayer.PLAYER)
+CollisionLayers.register(SpeedGem, CollisionLayer.PICKUP, CollisionLayer.PLAYER)
+CollisionLayers.register(DamageGem, CollisionLayer.PICKUP, CollisionLayer.PLAYER)
+CollisionLayers.register(DefenceGem, CollisionLayer.PICKUP, CollisionLayer.PLAYER)
+CollisionLayers.register(HealthGem, CollisionLayer.PICKUP, CollisionLayer.PLAYER)
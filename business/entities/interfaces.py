@@ -8,6 +8,8 @@ from presentation.sprite import Sprite
 class ICanDealDamage(ABC):
     """Interface for entities that can deal damage."""
 
+    __slots__ = ()
+
     @property
     @abstractmethod
     def damage_amount(self) -> int:
@@ -21,6 +23,8 @@ class ICanDealDamage(ABC):
 class IDamageable(ABC):
     """Interface for entities that can take damage."""
 
+    __slots__ = ()
+
     @property
     @abstractmethod
     def health(self) -> int:
@@ -42,6 +46,8 @@ class IDamageable(ABC):
 class IUpdatable(ABC):
     """Interface for entities that can be updated."""
 
+    __slots__ = ()
+
     @abstractmethod
     def update(self, world):
         """Update the state of the entity."""
@@ -50,6 +56,8 @@ class IUpdatable(ABC):
 class IHasSprite(ABC):
     """Interface for entities that have a sprite."""
 
+    __slots__ = ()
+
     @property
     @abstractmethod
     def sprite(self) -> Sprite:
@@ -63,6 +71,8 @@ class IHasSprite(ABC):
 class IHasPosition(IHasSprite):
     """Interface for entities that have a position."""
 
+    __slots__ = ()
+
     @property
     @abstractmethod
     def pos_x(self) -> float:
@@ -85,6 +95,8 @@ class IHasPosition(IHasSprite):
 class ICanMove(IHasPosition):
     """Interface for entities that can move."""
 
+    __slots__ = ()
+
     @property
     @abstractmethod
     def speed(self) -> float:
@@ -108,6 +120,9 @@ class ICanMove(IHasPosition):
 
 class IMonster(IUpdatable, ICanMove, IDamageable, ICanDealDamage):
     """Interface for monster entities."""
+
+    __slots__ = ()
+
     @property
     @abstractmethod
     def max_health(self) -> int:
@@ -157,6 +172,27 @@ class IMonster(IUpdatable, ICanMove, IDamageable, ICanDealDamage):
 
 class IBullet(IUpdatable, ICanMove, IDamageable, ICanDealDamage):
     """Interface for bullet entities."""
+
+    __slots__ = ()
+
+    @property
+    @abstractmethod
+    def previous_pos_x(self) -> float:
+        """The x-coordinate of the bullet before its last move.
+
+        Returns:
+            float: The previous x-coordinate of the bullet.
+        """
+
+    @property
+    @abstractmethod
+    def previous_pos_y(self) -> float:
+        """The y-coordinate of the bullet before its last move.
+
+        Returns:
+            float: The previous y-coordinate of the bullet.
+        """
+
     @abstractmethod
     def json_format(self):
         """ Json formatter
@@ -180,6 +216,8 @@ class IBullet(IUpdatable, ICanMove, IDamageable, ICanDealDamage):
 class IExperienceGem(IUpdatable, IHasPosition):
     """Interface for experience gem entities."""
 
+    __slots__ = ()
+
     @property
     @abstractmethod
     def amount(self) -> int:
@@ -211,6 +249,8 @@ class IExperienceGem(IUpdatable, IHasPosition):
 class IPlayer(IUpdatable, ICanMove, IDamageable, ICanDealDamage):
     """Interface for the player entity."""
 
+    __slots__ = ()
+
     @abstractmethod
     def pickup_gem(self, gem: IExperienceGem):
         """Picks up an experience gem.
@@ -255,6 +295,15 @@ class IPlayer(IUpdatable, ICanMove, IDamageable, ICanDealDamage):
             int: The max health.
         """
 
+    @property
+    @abstractmethod
+    def pickup_radius(self) -> int:
+        """The distance under which gems are pulled towards the player.
+
+        Returns:
+            int: The pickup radius, in pixels.
+        """
+
     @abstractmethod
     def json_format(self):
         """ Json formatter
@@ -329,6 +378,14 @@ class IPlayer(IUpdatable, ICanMove, IDamageable, ICanDealDamage):
         Args:
             autoheal (int): autoheal amount to be added
         """
+
+    @abstractmethod
+    def set_pickup_radius(self, pickup_radius: int):
+        """set pickup radius
+
+        Args:
+            pickup_radius (int): pickup radius to be added
+        """
     @abstractmethod
     def change_weapon(self, direction):
         """Cambia el arma del jugador
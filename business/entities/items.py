@@ -222,6 +222,35 @@ class AutoHealItem(Item):
         return self._image_path
 
 
+class MagnetItem(Item):
+    """Item that widens the radius the gems are pulled from."""
+
+    def __init__(self):
+        super().__init__(
+            name="Lodestone Ring",
+            description="Pulls experience gems from farther away.",
+            effect_type="pickup_radius",
+            upgrades=[25, 50, 75, 100, 150],
+            image_path="./assets/items/sprite-items/item3.png"
+        )
+
+    def apply_effect(self, player: Player):
+        if self._level < len(self._upgrades):
+            player.set_pickup_radius(self.get_effect_value())
+        else:
+            print(f"{self._name} has reached maximum improvement.")
+
+    @property
+    def description(self):
+        """Returns the description of the item."""
+        return self._description
+
+    @property
+    def image_path(self):
+        """Returns the image path of the item."""
+        return self._image_path
+
+
 class DictionaryClass:
     def __init__(self):
         # Ensure these items are correct instances of your classes
@@ -232,6 +261,7 @@ class DictionaryClass:
             "defence_item": DefenceItem(),
             "experience_item": ExperienceItem(),
             "autoheal_item": AutoHealItem(),
+            "magnet_item": MagnetItem(),
         }
         self._selected_items = {}  # Dictionary to store selected items
 
@@ -1,5 +1,7 @@
 """This module contains the Monster class, which represents a monster entity in the game."""
 
+import pygame
+
 import settings
 from typing import List
 
@@ -7,31 +9,65 @@ from business.entities.entity import MovableEntity
 from business.entities.interfaces import IDamageable, IHasPosition, IHasSprite, IMonster
 from business.handlers.cooldown_handler import CooldownHandler
 from business.handlers.collision_handler import CollisionHandler
+from business.handlers.collision_layers import CollisionLayer, CollisionLayers
+from business.world.column_store import VIEW_SLOTS, ColumnView
 from business.world.interfaces import IGameWorld, IPlayer
+from business.world.monster_array import MONSTER_ATTACK_COOLDOWN, MonsterArray
 from presentation.sprite import Sprite, ZombieSprite, SkeletonSprite, OrcSprite, WerewolfSprite
 
 
-class Monster(MovableEntity, IMonster):
-    """A monster entity in the game."""
+class Monster(ColumnView, MovableEntity, IMonster):
+    """A monster entity in the game.
+
+    The state of the monster lives in a row of a MonsterArray and the object is a thin view
+    over it. A monster that is not in the world keeps its state in a store of its own.
+    """
+
+    __slots__ = VIEW_SLOTS + ('__monster_type',)
 
     def __init__(self, src_x: int, src_y: int, sprite: Sprite, health: int, max_health: int, damage: int, attack_range: int, monster_type: str):
-        self.__level_multiplier = 1
+        MonsterArray(1).add(self, Monster.initial_values(src_x, src_y, health, max_health, damage, attack_range))
         super().__init__(src_x, src_y, 2, sprite)
-        self.__health: int = health * self.__level_multiplier
-        self.__max_health: int = max_health * self.__level_multiplier
-        self.__damage = damage * self.__level_multiplier
-        self.__attack_range = attack_range
-        self.__attack_cooldown = CooldownHandler(1000)
         self.__monster_type = monster_type
 
+    @staticmethod
+    def initial_values(src_x: int, src_y: int, health: int, max_health: int, damage: int, attack_range: int) -> dict:
+        """Returns the row of a monster that has just spawned.
+
+        Returns:
+            dict: The value of each column of the MonsterArray.
+        """
+        return {
+            'pos_x': src_x,
+            'pos_y': src_y,
+            'speed': 2,
+            'health': health,
+            'max_health': max_health,
+            'damage': damage,
+            'attack_range': attack_range,
+            'attack_ready_at': pygame.time.get_ticks() + MONSTER_ATTACK_COOLDOWN,
+            'level_multiplier': 1,
+            'facing': 1,
+        }
+
+    @property
+    def sprite(self) -> Sprite:
+        # The store moves and turns the monsters without touching their sprites
+        self._sprite.update_pos(self.pos_x, self.pos_y)
+        self._sprite.face(self._get('facing'))
+        return self._sprite
+
     def json_format(self):
         return {
-            'level_multiplier': self.__level_multiplier,
-            'health': self.__health,
-            'max_health': self.__max_health,
-            'damage': self.__damage,
-            'attack_range': self.__attack_range,
-            'attack_cooldown': self.__attack_cooldown.json_format(),
+            'level_multiplier': self._get('level_multiplier'),
+            'health': self.health,
+            'max_health': self.max_health,
+            'damage': self.damage_amount,
+            'attack_range': self._get('attack_range'),
+            'attack_cooldown': {
+                'last_action_time': self._get('attack_ready_at') - MONSTER_ATTACK_COOLDOWN,
+                'cooldown_time': MONSTER_ATTACK_COOLDOWN,
+            },
             'pos_x': self.pos_x,
             'pos_y': self.pos_y,
             'monster_type': self.__monster_type,
@@ -59,12 +95,13 @@ class Monster(MovableEntity, IMonster):
 
         return Monster(src_x, src_y, sprite, health, max_health, damage, attack_range, monster_type)
 
-    def attack(self, target: IPlayer, attack_cooldown: CooldownHandler):
+    def attack(self, target: IPlayer):
         """Attacks the target."""
-
-        if attack_cooldown.is_action_ready() and self._get_distance_to(target) < self.__attack_range:
+        now = pygame.time.get_ticks()
+        if self._get('attack_ready_at') <= now and \
+                self._get_distance_to(target) < self._get('attack_range'):
             target.take_damage(self.damage_amount)
-            attack_cooldown.put_on_cooldown()
+            self._set('attack_ready_at', now + MONSTER_ATTACK_COOLDOWN)
 
     def __get_direction_towards_the_player(self, world: IGameWorld):
         direction_x = world.player.pos_x - self.pos_x
@@ -79,29 +116,33 @@ class Monster(MovableEntity, IMonster):
 
     def levelup(self, world: IGameWorld, levelup_cooldown: CooldownHandler):
         if levelup_cooldown.is_action_ready():
-            self.__level_multiplier += (world.timer // 10)
+            level_multiplier = self._get('level_multiplier') + (world.timer // 10)
+            self._set('level_multiplier', level_multiplier)
 
-            self.__health *= self.__level_multiplier
-            self.__max_health *= self.__level_multiplier
-            self.__damage *= self.__level_multiplier
+            for column in ('health', 'max_health', 'damage'):
+                self._set(column, self._get(column) * level_multiplier)
 
             levelup_cooldown.put_on_cooldown()
 
     def update(self, world: IGameWorld):
+        """Updates this monster alone. The world moves its monsters with MonsterArray.step."""
 
         direction_x, direction_y = self.__get_direction_towards_the_player(
             world)
         
         if (direction_x, direction_y) == (0, 0):
             return
+        if direction_x != 0:
+            self._set('facing', direction_x)
 
-        self.move(direction_x, direction_y)
+        separation_x, separation_y = world.crowd.separation_force(self)
+        self.move(direction_x + separation_x * settings.SEPARATION_WEIGHT,
+                  direction_y + separation_y * settings.SEPARATION_WEIGHT)
 
-        if self.__health <= 0:
+        if self.health <= 0:
             world.remove_monster(self)
 
-        if self.__attack_cooldown.is_action_ready():
-            self.attack(world.player, self.__attack_cooldown)
+        self.attack(world.player)
 
         super().update(world)
 
@@ -109,21 +150,26 @@ class Monster(MovableEntity, IMonster):
         return f"Monster(hp={self.health}, pos={self.pos_x, self.pos_y})"
 
     def take_damage(self, amount):
-        self.__health = max(0, self.__health - amount)
+        self._set('health', max(0, self.health - amount))
         self.sprite.take_damage()
+        self.store.mark_damaged(self)
 
     @property
     def damage_amount(self):
-        return self.__damage
+        return self._get('damage')
 
     @property
     def health(self) -> int:
-        return self.__health
+        return self._get('health')
 
     @property
     def max_health(self) -> int:
-        return self.__max_health
+        return self._get('max_health')
 
     @property
     def monster_type(self) -> str:
         return self.__monster_type
+
+
+CollisionLayers.register(Monster, CollisionLayer.MONSTER,
+                         CollisionLayer.PLAYER | CollisionLayer.PLAYER_PROJECTILE)
@@ -1,16 +1,79 @@
 """This module contains the MonsterFactory class, which creates Monster instances."""
 
 from business.entities.monster import Monster
-from presentation.sprite import Sprite
+from business.world.monster_array import MonsterArray
+from presentation.sprite import Sprite, ZombieSprite, SkeletonSprite, OrcSprite, WerewolfSprite
+
+# Sprite class of each monster type
+MONSTER_SPRITES = {
+    "zombie": ZombieSprite,
+    "skeleton": SkeletonSprite,
+    "orc": OrcSprite,
+    "werewolf": WerewolfSprite,
+}
 
 class MonsterFactory:
-    """Factory for creating Monster instances with custom configurations."""
+    """Factory for creating Monster instances with custom configurations.
+
+    Dead monsters can be handed back with recycle. They are kept, with their sprites, in a
+    free list per type and spawned again instead of loading new sprites.
+    """
 
     def __init__(self, default_health=10, default_damage=1, default_attack_range=50, default_max_health = 10):
         self.default_health = default_health
         self.default_damage = default_damage
         self.default_attack_range = default_attack_range
         self.default_max_health = default_max_health
+        # Free list of dead monsters per type
+        self.__pools: dict[str, MonsterArray] = {}
+        # Monsters taken from the free lists, until the world adds them
+        self.__spawned = MonsterArray()
+
+    def spawn_monster(self, src_x: int, src_y: int, monster_type: str) -> Monster:
+        """Spawns a monster of a type, reusing a dead one when there is one.
+
+        Args:
+            src_x (int): The x-coordinate of the monster.
+            src_y (int): The y-coordinate of the monster.
+            monster_type (str): One of the MONSTER_SPRITES types.
+
+        Returns:
+            Monster: The monster, with the stats of a new one.
+        """
+        pool = self.__pools.get(monster_type)
+        if not pool:
+            return self.create_monster(src_x, src_y, MONSTER_SPRITES[monster_type](src_x, src_y), monster_type)
+
+        monster = pool.view(len(pool) - 1)
+        pool.transfer(monster, self.__spawned, Monster.initial_values(src_x, src_y, *self.__stats(monster_type)))
+        monster.sprite.reset()
+        return monster
+
+    def recycle(self, monster: Monster):
+        """Keeps a monster removed from the world to spawn it again.
+
+        Args:
+            monster (Monster): The dead monster, moved straight from its current store to
+                the free list of its type.
+        """
+        pool = self.__pools.get(monster.monster_type)
+        if pool is None:
+            pool = self.__pools[monster.monster_type] = MonsterArray()
+        monster.store.transfer(monster, pool)
+
+    def pooled(self, monster_type: str) -> int:
+        """Returns the number of dead monsters of a type waiting to be spawned again."""
+        return len(self.__pools.get(monster_type, ()))
+
+    def __stats(self, monster_type: str) -> tuple[int, int, int, int]:
+        """Returns the health, max health, damage and attack range of a monster type."""
+        if monster_type == "skeleton":
+            return 15, 15, 1, 50
+        if monster_type == "orc":
+            return 20, 20, 2, 60
+        if monster_type == "werewolf":
+            return 25, 25, 2, 60
+        return self.default_health, self.default_max_health, self.default_damage, self.default_attack_range
 
     def create_monster(self, src_x: int, src_y: int, sprite: Sprite, monster_type: str):
         """ Create monsters. """
@@ -27,24 +90,24 @@ class MonsterFactory:
 
     def create_zombie(self, src_x: int, src_y: int, sprite: Sprite, monster_type: str) -> Monster:
         """Creates zombie monster."""
-        monster = Monster(src_x, src_y, sprite, self.default_health, self.default_max_health, self.default_damage, self.default_attack_range, monster_type)
+        monster = Monster(src_x, src_y, sprite, *self.__stats("zombie"), monster_type)
 
         return monster
 
     def create_skeleton(self, src_x: int, src_y: int, sprite: Sprite, monster_type: str) -> Monster:
         """Creates skeleton monster."""
-        monster = Monster(src_x, src_y, sprite, 15, 15, 1, 50, monster_type)
+        monster = Monster(src_x, src_y, sprite, *self.__stats("skeleton"), monster_type)
 
         return monster
 
     def create_orc(self, src_x: int, src_y: int, sprite: Sprite, monster_type: str) -> Monster:
         """Creates orc monster."""
-        monster = Monster(src_x, src_y, sprite, 20, 20, 2, 60, monster_type)
+        monster = Monster(src_x, src_y, sprite, *self.__stats("orc"), monster_type)
 
         return monster
 
     def create_werewolf(self, src_x: int, src_y: int, sprite: Sprite, monster_type: str) -> Monster:
         """Creates werewolf monster."""
-        monster = Monster(src_x, src_y, sprite, 25, 25, 2, 60, monster_type)
+        monster = Monster(src_x, src_y, sprite, *self.__stats("werewolf"), monster_type)
 
         return monster
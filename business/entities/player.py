@@ -10,6 +10,7 @@ from business.world.interfaces import IGameWorld
 from presentation.sprite import Sprite, PlayerSprite
 from business.entities.weapons import PistolWeapon, ShotgunWeapon, MinigunWeapon
 from business.handlers.cooldown_handler import CooldownHandler
+from business.handlers.collision_layers import CollisionLayer, CollisionLayers
 
 
 class Player(MovableEntity, IPlayer, IDamageable, ICanDealDamage):
@@ -51,6 +52,7 @@ class Player(MovableEntity, IPlayer, IDamageable, ICanDealDamage):
         self.__defence_temp_increase: int = 0
         self.__defence: int = 0
         self.__autoheal: int = 0
+        self.__pickup_radius: int = settings.PLAYER_PICKUP_RADIUS
         self.__weapon = PistolWeapon()
         self.__weapon_type = "pistol"
         self.__weapons = [
@@ -77,6 +79,7 @@ class Player(MovableEntity, IPlayer, IDamageable, ICanDealDamage):
             'damage': self.__damage,
             'defensa': self.__defence,
             'autoheal': self.__autoheal,
+            'pickup_radius': self.__pickup_radius,
             'pos_x': self.pos_x,
             'pos_y': self.pos_y,
             'weapon_type': self.__weapon_type,
@@ -105,6 +108,7 @@ class Player(MovableEntity, IPlayer, IDamageable, ICanDealDamage):
         player.__damage = player_data.get('damage', player.__damage)
         player.__defence = player_data.get('defence', player.__defence)
         player.__autoheal = player_data.get('autoheal', player.__autoheal)
+        player.__pickup_radius = player_data.get('pickup_radius', player.__pickup_radius)
         player.__weapon_type = player_data.get(
             'weapon_type', player.__weapon_type)
 
@@ -142,6 +146,7 @@ class Player(MovableEntity, IPlayer, IDamageable, ICanDealDamage):
             'Daño': self.damage_amount,
             'Defensa': self.defence_amount,
             'Autocuración': self.__autoheal,
+            'Radio de Recogida': self.__pickup_radius,
         }
 
     @staticmethod
@@ -222,17 +227,14 @@ class Player(MovableEntity, IPlayer, IDamageable, ICanDealDamage):
             self.__level += 1
             self.__levelup_perks()
 
-    def __shoot_at_nearest_enemy(self, world: IGameWorld):
-        if not world.monsters:
+    def __shoot_at_target(self, world: IGameWorld):
+        # Solo se busca un objetivo cuando el arma puede disparar
+        if not self.__weapon.cooldown_handler.is_action_ready():
             return
 
-        monster = min(
-            world.monsters,
-            key=lambda monster: (
-                (monster.pos_x - self.pos_x) ** 2 +
-                (monster.pos_y - self.pos_y) ** 2
-            ),
-        )
+        monster = self.__weapon.acquire_target(world, self.pos_x, self.pos_y)
+        if monster is None:
+            return
 
         self.__weapon.shoot(world, self.pos_x, self.pos_y,
                             monster.pos_x, monster.pos_y)
@@ -271,7 +273,7 @@ class Player(MovableEntity, IPlayer, IDamageable, ICanDealDamage):
             # Actualizar el tiempo del último autoheal
             self._last_autoheal_time = current_time
 
-        self.__shoot_at_nearest_enemy(world)
+        self.__shoot_at_target(world)
         self.__last_shot_time = current_time
 
     def set_max_health(self, max_health: int):
@@ -292,6 +294,9 @@ class Player(MovableEntity, IPlayer, IDamageable, ICanDealDamage):
     def set_autoheal(self, autoheal: int):
         self.__autoheal += autoheal
 
+    def set_pickup_radius(self, pickup_radius: int):
+        self.__pickup_radius += pickup_radius
+
     @property
     def experience(self):
         return self.__experience
@@ -319,6 +324,10 @@ class Player(MovableEntity, IPlayer, IDamageable, ICanDealDamage):
     def max_health(self):
         return self.__max_health
 
+    @property
+    def pickup_radius(self):
+        return self.__pickup_radius
+
     @property
     def defence_amount(self):
         return self.__defence
@@ -330,3 +339,7 @@ class Player(MovableEntity, IPlayer, IDamageable, ICanDealDamage):
     @property
     def __shoot_cooldown(self):
         return Player.BASE_SHOOT_COOLDOWN
+
+
+CollisionLayers.register(Player, CollisionLayer.PLAYER,
+                         CollisionLayer.MONSTER | CollisionLayer.MONSTER_PROJECTILE | CollisionLayer.PICKUP)
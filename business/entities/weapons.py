@@ -1,24 +1,26 @@
 """Module of the weapons"""
-import pygame
 import math
 from abc import abstractmethod
+import numpy as np
 from business.world.interfaces import IGameWorld
 from business.handlers.cooldown_handler import CooldownHandler
-from business.entities.bullet import Bullet
+from business.world.targeting import TargetingStrategy
 
 
 class Weapon():
     """Represents the weapons"""
 
-    def __init__(self, bullet_name: str, shoot_cooldown: int, bullet_speed: float, bullet_damage: int, required_level: int, image_path: str):
+    def __init__(self, bullet_name: str, shoot_cooldown: int, bullet_speed: float, bullet_damage: int, required_level: int, image_path: str,
+                 targeting_strategy: str = TargetingStrategy.NEAREST, targeting_range: float | None = None):
         self.__bullet_name = bullet_name
         self.__shoot_cooldown = shoot_cooldown
         self.__bullet_speed = bullet_speed
         self.__bullet_damage = bullet_damage
         self.__required_level = required_level
-        self.__image_path = pygame.image.load(
-            image_path).convert_alpha()  # Ruta de la imagen
+        self.__image_path = image_path  # Ruta de la imagen
         self._cooldown_handler = CooldownHandler(shoot_cooldown)
+        self.__targeting_strategy = targeting_strategy
+        self.__targeting_range = targeting_range
 
     @property
     def bullet_name(self):
@@ -54,6 +56,24 @@ class Weapon():
     def required_level(self):
         return self.__required_level
 
+    @property
+    def targeting_strategy(self):
+        """Returns the strategy the weapon uses to pick its target"""
+        return self.__targeting_strategy
+
+    @property
+    def targeting_range(self):
+        """Returns the maximum distance to a target, None if there is no limit"""
+        return self.__targeting_range
+
+    def acquire_target(self, world: IGameWorld, src_x: float, src_y: float):
+        """Picks the monster to shoot at using the world targeting service.
+
+        Returns:
+            IMonster | None: The target, or None if there is no monster in range.
+        """
+        return world.targeting.find_target(src_x, src_y, self.__targeting_strategy, self.__targeting_range)
+
     @abstractmethod
     def shoot(self, world: IGameWorld):
         """Abstract method to shoot a bullet"""
@@ -63,24 +83,24 @@ class Weapon():
 class PistolWeapon(Weapon):
     """Class that represents a pistol weapon"""
 
-    def __init__(self):
+    def __init__(self, targeting_strategy: str = TargetingStrategy.NEAREST, targeting_range: float | None = None):
         super().__init__("PistolBullet", shoot_cooldown=500,
-                         bullet_speed=5.0, bullet_damage=10, required_level=1, image_path="assets/items/gun/pistol.png")
+                         bullet_speed=5.0, bullet_damage=10, required_level=1, image_path="assets/items/gun/pistol.png",
+                         targeting_strategy=targeting_strategy, targeting_range=targeting_range)
 
     def shoot(self, world: IGameWorld, src_x: float, src_y: float, target_x: float, target_y: float):
         if self._cooldown_handler.is_action_ready():
-            bullet = Bullet(src_x, src_y, target_x,
-                            target_y, self.bullet_speed)
-            world.add_bullet(bullet)
+            world.projectiles.emit(src_x, src_y, target_x - src_x, target_y - src_y, self.bullet_speed)
             self.cooldown_handler.put_on_cooldown()
 
 
 class ShotgunWeapon(Weapon):
     """Class that represents a shotgun weapon"""
 
-    def __init__(self):
+    def __init__(self, targeting_strategy: str = TargetingStrategy.NEAREST, targeting_range: float | None = None):
         super().__init__("ShotgunBullet", shoot_cooldown=600,
-                         bullet_speed=4.0, bullet_damage=10, required_level=4, image_path="assets/items/gun/shotgun.png")
+                         bullet_speed=4.0, bullet_damage=10, required_level=4, image_path="assets/items/gun/shotgun.png",
+                         targeting_strategy=targeting_strategy, targeting_range=targeting_range)
 
     def shoot(self, world: IGameWorld, src_x: float, src_y: float, target_x: float, target_y: float):
         if self.cooldown_handler.is_action_ready():
@@ -92,19 +112,10 @@ class ShotgunWeapon(Weapon):
                 base_dir_x /= base_distance
                 base_dir_y /= base_distance
 
-            for angle_offset in [-0.1, -0.05, 0, 0.05, 0.1]:
-                offset_dir_x = base_dir_x * \
-                    math.cos(angle_offset) - base_dir_y * \
-                    math.sin(angle_offset)
-                offset_dir_y = base_dir_x * \
-                    math.sin(angle_offset) + base_dir_y * \
-                    math.cos(angle_offset)
-
-                bullet = Bullet(src_x, src_y,
-                                src_x + offset_dir_x * self.bullet_speed,
-                                src_y + offset_dir_y * self.bullet_speed,
-                                self.bullet_speed)
-                world.add_bullet(bullet)
+            angle_offsets = np.array([-0.1, -0.05, 0, 0.05, 0.1])
+            offset_dirs_x = base_dir_x * np.cos(angle_offsets) - base_dir_y * np.sin(angle_offsets)
+            offset_dirs_y = base_dir_x * np.sin(angle_offsets) + base_dir_y * np.cos(angle_offsets)
+            world.projectiles.emit(src_x, src_y, offset_dirs_x, offset_dirs_y, self.bullet_speed)
 
             self.cooldown_handler.put_on_cooldown()
 
@@ -112,13 +123,12 @@ class ShotgunWeapon(Weapon):
 class MinigunWeapon(Weapon):
     """Class that represents a minigun weapon"""
 
-    def __init__(self):
+    def __init__(self, targeting_strategy: str = TargetingStrategy.NEAREST, targeting_range: float | None = None):
         super().__init__("MinigunBullet", shoot_cooldown=100,
-                         bullet_speed=6.0, bullet_damage=8, required_level=8, image_path="assets/items/gun/minigun.png")
+                         bullet_speed=6.0, bullet_damage=8, required_level=8, image_path="assets/items/gun/minigun.png",
+                         targeting_strategy=targeting_strategy, targeting_range=targeting_range)
 
     def shoot(self, world: IGameWorld, src_x: float, src_y: float, target_x: float, target_y: float):
         if self._cooldown_handler.is_action_ready():
-            bullet = Bullet(src_x, src_y, target_x,
-                            target_y, self.bullet_speed)
-            world.add_bullet(bullet)
+            world.projectiles.emit(src_x, src_y, target_x - src_x, target_y - src_y, self.bullet_speed)
             self.cooldown_handler.put_on_cooldown()
@@ -1,46 +1,169 @@
 """Module for the CollisionHandler class."""
 
-from typing import List
+from typing import Callable, List
 
-from business.entities.interfaces import IBullet, IExperienceGem, IHasSprite, IMonster, IPlayer
+import settings
+from business.entities.interfaces import IBullet, IHasSprite, IMonster, IPlayer
+from business.handlers.collision_layers import PROJECTILE_LAYERS, CollisionLayer, CollisionLayers
+from business.handlers.mask_collision import MaskCollision
+from business.handlers.numpy_collision import NumpyCollisionKernel
+from business.handlers.parallel_collision import ParallelCollisionKernel
+from business.handlers.spatial_hash import SpatialHashGrid
+from business.handlers.swept_collision import SweptCollision
 from business.world.interfaces import IGameWorld
 
 
 class CollisionHandler:
-    """Handles collisions between entities in the game world."""
+    """Handles collisions between entities in the game world.
+
+    Entities are grouped by their collision layer. Each registered response pairs a querying
+    layer with an indexed layer, and only the entities whose mask includes the indexed layer
+    are tested against it.
+    """
+
+    # (querying layer, indexed layer, response, pixel perfect), in the order they are resolved
+    __responses: list[tuple[CollisionLayer, CollisionLayer, Callable, bool]] = []
+
+    @staticmethod
+    def register_response(querying_layer: CollisionLayer, indexed_layer: CollisionLayer,
+                          response: Callable[[IHasSprite, IHasSprite, IGameWorld], None],
+                          pixel_perfect: bool = True):
+        """Registers what happens when an entity of a layer touches an entity of another layer.
+
+        Args:
+            querying_layer (CollisionLayer): The layer of the entities that look for collisions.
+                Projectile layers are tested along the path travelled during the tick.
+            indexed_layer (CollisionLayer): The layer of the entities they can collide with.
+            response (Callable): Called with (querying entity, indexed entity, world) on each hit.
+            pixel_perfect (bool): If the hit must be confirmed with the sprite masks.
+        """
+        CollisionHandler.__responses.append((querying_layer, indexed_layer, response, pixel_perfect))
+
+    @staticmethod
+    def bullet_hits_monster(bullet: IBullet, monster: IMonster, world: IGameWorld):
+        """Response of a player bullet hitting a monster."""
+        monster.take_damage(bullet.damage_amount)
+        bullet.take_damage(bullet.damage_amount)
 
     @staticmethod
-    def __collides_with(an_entity: IHasSprite, another_entity: IHasSprite):
-        return an_entity.sprite.rect.colliderect(another_entity.sprite.rect)
+    def monster_hits_player(player: IPlayer, monster: IMonster, world: IGameWorld):
+        """Response of the player touching a monster."""
+        player.take_damage(monster.damage_amount)
 
     @staticmethod
-    def __handle_bullets(bullets: List[IBullet], monsters: List[IMonster]):
-        for bullet in bullets:
-            for monster in monsters:
-                if CollisionHandler.__collides_with(bullet, monster):
-                    monster.take_damage(bullet.damage_amount)
-                    bullet.take_damage(bullet.damage_amount)
+    def projectile_hits_player(projectile: IBullet, player: IPlayer, world: IGameWorld):
+        """Response of a monster projectile hitting the player."""
+        player.take_damage(projectile.damage_amount)
+        projectile.take_damage(projectile.damage_amount)
 
     @staticmethod
-    def __handle_monsters(monsters: List[IMonster], player: IPlayer):
-        for monster in monsters:
-            if CollisionHandler.__collides_with(monster, player):
-                player.take_damage(monster.damage_amount)
+    def __group_by_layer(world: IGameWorld) -> dict[CollisionLayer, List[IHasSprite]]:
+        groups: dict[CollisionLayer, List[IHasSprite]] = {}
+        # Gems are not indexed: the world collects them from its gem columns
+        for entities in ([world.player], world.monsters, world.bullets):
+            for entity in entities:
+                # Entities that died earlier in the tick cannot be hit any more
+                if world.is_pending_removal(entity):
+                    continue
+                layer = CollisionLayers.layer_of(entity)
+                if layer:
+                    groups.setdefault(layer, []).append(entity)
+        return groups
 
     @staticmethod
-    def __handle_gems(gems: List[IExperienceGem], player: IPlayer, world: IGameWorld):
-        for gem in gems:
-            if CollisionHandler.__collides_with(gem, player):
-                player.pickup_gem(gem)
-                world.remove_experience_gem(gem)
+    def __responses_to_resolve(groups: dict[CollisionLayer, List[IHasSprite]]):
+        """Yields the responses whose layers are populated, with the entities allowed to query."""
+        for querying_layer, indexed_layer, response, pixel_perfect in CollisionHandler.__responses:
+            if not groups.get(indexed_layer):
+                continue
+            querying = [entity for entity in groups.get(querying_layer, ())
+                        if CollisionLayers.mask_of(entity) & indexed_layer]
+            if querying:
+                yield querying_layer, indexed_layer, response, pixel_perfect, querying
+
+    @staticmethod
+    def __is_hit(querying: IHasSprite, indexed: IHasSprite, is_projectile: bool, pixel_perfect: bool) -> bool:
+        """Narrowphase for a pair that passed the broadphase."""
+        if is_projectile:
+            return SweptCollision.bullet_hits(querying, indexed) and \
+                (not pixel_perfect or MaskCollision.bullet_hits(querying, indexed))
+        return querying.sprite.rect.colliderect(indexed.sprite.rect) and \
+            (not pixel_perfect or MaskCollision.masks_overlap(indexed, querying))
+
+    @staticmethod
+    def __handle_collisions_with_grid(world: IGameWorld):
+        groups = CollisionHandler.__group_by_layer(world)
+        grids: dict[CollisionLayer, SpatialHashGrid] = {}
+
+        for querying_layer, indexed_layer, response, pixel_perfect, querying in \
+                CollisionHandler.__responses_to_resolve(groups):
+            grid = grids.get(indexed_layer)
+            if grid is None:
+                grid = grids[indexed_layer] = SpatialHashGrid()
+                grid.insert_all(groups[indexed_layer])
+
+            is_projectile = bool(querying_layer & PROJECTILE_LAYERS)
+            pixel_perfect = pixel_perfect and settings.PIXEL_PERFECT_COLLISIONS
+            for entity in querying:
+                area = SweptCollision.swept_rect(entity) if is_projectile else entity.sprite.rect
+                for other in grid.query(area):
+                    if CollisionHandler.__is_hit(entity, other, is_projectile, pixel_perfect):
+                        response(entity, other, world)
+
+    @staticmethod
+    def __handle_collisions_with_numpy(world: IGameWorld, kernel):
+        groups = CollisionHandler.__group_by_layer(world)
+        boxes = {}
+
+        for querying_layer, indexed_layer, response, pixel_perfect, querying in \
+                CollisionHandler.__responses_to_resolve(groups):
+            indexed = groups[indexed_layer]
+            if indexed_layer not in boxes:
+                boxes[indexed_layer] = NumpyCollisionKernel.pack_rects(indexed)
+
+            is_projectile = bool(querying_layer & PROJECTILE_LAYERS)
+            querying_boxes = NumpyCollisionKernel.pack_rects(querying)
+            if is_projectile:
+                a_indices, b_indices = kernel.swept_pairs(
+                    querying_boxes, NumpyCollisionKernel.pack_segments(querying), boxes[indexed_layer])
+            else:
+                a_indices, b_indices = kernel.overlapping_pairs(querying_boxes, boxes[indexed_layer])
+
+            pixel_perfect = pixel_perfect and settings.PIXEL_PERFECT_COLLISIONS
+            for a_index, b_index in zip(a_indices.tolist(), b_indices.tolist()):
+                entity, other = querying[a_index], indexed[b_index]
+                if not pixel_perfect or CollisionHandler.__is_hit(entity, other, is_projectile, True):
+                    response(entity, other, world)
 
     @staticmethod
     def handle_collisions(world: IGameWorld):
         """Handles collisions between entities in the game world.
 
+        Projectiles are tested along the segment they travelled this tick, so fast bullets
+        cannot tunnel through monsters. The backend is chosen with settings.COLLISION_BACKEND:
+        - "grid": the indexed layers are bucketed in a spatial hash grid every tick, so each
+          querying entity is only tested against the entities in the cells it overlaps.
+        - "numpy": the rects are packed into NumPy arrays and every overlapping pair is computed
+          with vectorized interval tests.
+        - "parallel": like "numpy", but large tests are split in vertical stripes resolved by
+          worker processes over shared memory. The hits are applied in the main process.
+        When settings.PIXEL_PERFECT_COLLISIONS is enabled, pixel perfect responses are confirmed
+        against the cached sprite masks, only for the pairs that passed the rect tests.
+
         Args:
             world (IGameWorld): The game world.
         """
-        CollisionHandler.__handle_bullets(world.bullets, world.monsters)
-        CollisionHandler.__handle_monsters(world.monsters, world.player)
-        CollisionHandler.__handle_gems(world.experience_gems, world.player, world)
+        if settings.COLLISION_BACKEND == "numpy":
+            CollisionHandler.__handle_collisions_with_numpy(world, NumpyCollisionKernel)
+        elif settings.COLLISION_BACKEND == "parallel":
+            CollisionHandler.__handle_collisions_with_numpy(world, ParallelCollisionKernel)
+        else:
+            CollisionHandler.__handle_collisions_with_grid(world)
+
+
+CollisionHandler.register_response(
+    CollisionLayer.PLAYER_PROJECTILE, CollisionLayer.MONSTER, CollisionHandler.bullet_hits_monster)
+CollisionHandler.register_response(
+    CollisionLayer.PLAYER, CollisionLayer.MONSTER, CollisionHandler.monster_hits_player)
+CollisionHandler.register_response(
+    CollisionLayer.MONSTER_PROJECTILE, CollisionLayer.PLAYER, CollisionHandler.projectile_hits_player)
@@ -0,0 +1,58 @@
+"""Module for the collision layers of the entities."""
+
+from enum import IntFlag
+
+
+class CollisionLayer(IntFlag):
+    """Collision layers. An entity lives in one layer and its mask lists the layers it collides with."""
+
+    NONE = 0
+    PLAYER = 1
+    PLAYER_PROJECTILE = 2
+    MONSTER = 4
+    MONSTER_PROJECTILE = 8
+    PICKUP = 16
+
+
+# Layers whose entities are tested along the path travelled during the tick
+PROJECTILE_LAYERS = CollisionLayer.PLAYER_PROJECTILE | CollisionLayer.MONSTER_PROJECTILE
+
+
+class CollisionLayers:
+    """Registry of the collision layer and mask of each entity type."""
+
+    __registry: dict[type, tuple[CollisionLayer, CollisionLayer]] = {}
+
+    @staticmethod
+    def register(entity_type: type, layer: CollisionLayer, mask: CollisionLayer):
+        """Registers the layer and mask of an entity type and its subclasses.
+
+        Args:
+            entity_type (type): The entity class.
+            layer (CollisionLayer): The layer the entities of that type live in.
+            mask (CollisionLayer): The layers the entities of that type collide with.
+        """
+        CollisionLayers.__registry[entity_type] = (layer, mask)
+
+    @staticmethod
+    def __lookup(entity_type: type) -> tuple[CollisionLayer, CollisionLayer]:
+        entry = CollisionLayers.__registry.get(entity_type)
+        if entry is None:
+            entry = next(
+                (CollisionLayers.__registry[base] for base in entity_type.__mro__
+                 if base in CollisionLayers.__registry),
+                (CollisionLayer.NONE, CollisionLayer.NONE),
+            )
+            # Cache the subclass so the next lookup is a single dict access
+            CollisionLayers.__registry[entity_type] = entry
+        return entry
+
+    @staticmethod
+    def layer_of(entity) -> CollisionLayer:
+        """Returns the layer of an entity, NONE if its type was never registered."""
+        return CollisionLayers.__lookup(type(entity))[0]
+
+    @staticmethod
+    def mask_of(entity) -> CollisionLayer:
+        """Returns the mask of an entity, NONE if its type was never registered."""
+        return CollisionLayers.__lookup(type(entity))[1]
@@ -6,6 +6,8 @@ import pygame
 class CooldownHandler:
     """A handler for cooldowns."""
 
+    __slots__ = ('__last_action_time', '__cooldown_time')
+
     def __init__(self, cooldown_time: int):
         self.__last_action_time = pygame.time.get_ticks()
         self.__cooldown_time = cooldown_time
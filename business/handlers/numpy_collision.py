@@ -0,0 +1,176 @@
+"""Module for the NumpyCollisionKernel class."""
+
+import numpy as np
+
+# Upper bound for the number of cells of a single pair matrix, to keep memory bounded
+MAX_BLOCK_CELLS = 1 << 20
+
+
+class NumpyCollisionKernel:
+    """Vectorized AABB overlap tests over whole entity lists.
+
+    Boxes are packed in arrays of shape (n, 4) holding (left, top, right, bottom).
+    """
+
+    @staticmethod
+    def pack_rects(entities) -> np.ndarray:
+        """Packs the sprite rects of the entities into a box array.
+
+        Args:
+            entities (Sequence[IHasSprite]): The entities to pack.
+
+        Returns:
+            np.ndarray: A float array of shape (len(entities), 4).
+        """
+        rects = [entity.sprite.rect for entity in entities]
+        return np.array(
+            [(rect.left, rect.top, rect.right, rect.bottom) for rect in rects], dtype=np.float64
+        ).reshape(-1, 4)
+
+    @staticmethod
+    def overlapping_pairs(a_boxes: np.ndarray, b_boxes: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """Computes every overlapping pair between two box arrays.
+
+        It follows the semantics of pygame.Rect.colliderect: edges that only touch do
+        not overlap and empty boxes never collide.
+
+        Args:
+            a_boxes (np.ndarray): The first box array.
+            b_boxes (np.ndarray): The second box array.
+
+        Returns:
+            tuple[np.ndarray, np.ndarray]: The indices into a_boxes and b_boxes of each
+            overlapping pair, sorted by the index in a_boxes and then by the index in b_boxes.
+        """
+        empty = np.empty(0, dtype=np.intp)
+        if len(a_boxes) == 0 or len(b_boxes) == 0:
+            return empty, empty
+
+        b_left, b_top, b_right, b_bottom = (b_boxes[:, i] for i in range(4))
+        b_valid = (b_left < b_right) & (b_top < b_bottom)
+
+        block = max(1, MAX_BLOCK_CELLS // len(b_boxes))
+        a_indices, b_indices = [], []
+        for start in range(0, len(a_boxes), block):
+            a_block = a_boxes[start:start + block]
+            a_left, a_top, a_right, a_bottom = (a_block[:, i, None] for i in range(4))
+
+            hits = (
+                (a_left < b_right) & (b_left < a_right) &
+                (a_top < b_bottom) & (b_top < a_bottom) &
+                (a_left < a_right) & (a_top < a_bottom) & b_valid
+            )
+            rows, cols = np.nonzero(hits)
+            a_indices.append(rows + start)
+            b_indices.append(cols)
+
+        return np.concatenate(a_indices), np.concatenate(b_indices)
+
+    @staticmethod
+    def pack_segments(bullets) -> np.ndarray:
+        """Packs the last move of each bullet into a segment array.
+
+        Args:
+            bullets (Sequence[IBullet]): The bullets to pack.
+
+        Returns:
+            np.ndarray: A float array of shape (len(bullets), 4) holding
+            (previous_x, previous_y, current_x, current_y).
+        """
+        return np.array(
+            [(bullet.previous_pos_x, bullet.previous_pos_y, bullet.pos_x, bullet.pos_y) for bullet in bullets],
+            dtype=np.float64,
+        ).reshape(-1, 4)
+
+    @staticmethod
+    def segment_hits_boxes(segments: np.ndarray, boxes: np.ndarray) -> np.ndarray:
+        """Vectorized slab test between segments and boxes, row by row.
+
+        Args:
+            segments (np.ndarray): Segments of shape (n, 4) as (start_x, start_y, end_x, end_y).
+            boxes (np.ndarray): Boxes of shape (n, 4) as (left, top, right, bottom).
+
+        Returns:
+            np.ndarray: A bool array of shape (n,), True where some point of the segment
+            lies strictly inside the box of the same row.
+        """
+        t_enter = np.zeros(len(segments))
+        t_exit = np.ones(len(segments))
+        inside = np.ones(len(segments), dtype=bool)
+        for axis in range(2):
+            start = segments[:, axis]
+            delta = segments[:, axis + 2] - start
+            low, high = boxes[:, axis], boxes[:, axis + 2]
+
+            still = delta == 0
+            inside &= ~still | ((low < start) & (start < high))
+
+            with np.errstate(divide="ignore", invalid="ignore"):
+                t_low = (low - start) / delta
+                t_high = (high - start) / delta
+            t_near = np.where(still, 0.0, np.minimum(t_low, t_high))
+            t_far = np.where(still, 1.0, np.maximum(t_low, t_high))
+            t_enter = np.maximum(t_enter, t_near)
+            t_exit = np.minimum(t_exit, t_far)
+
+        return inside & (t_enter < t_exit)
+
+    @staticmethod
+    def __half_extents(boxes: np.ndarray) -> np.ndarray:
+        return np.column_stack((
+            (boxes[:, 2] - boxes[:, 0]) / 2,
+            (boxes[:, 3] - boxes[:, 1]) / 2,
+        ))
+
+    @staticmethod
+    def swept_boxes(bullet_boxes: np.ndarray, segments: np.ndarray) -> np.ndarray:
+        """Computes the boxes covering the current bullet boxes and their last move.
+
+        Args:
+            bullet_boxes (np.ndarray): The current bullet boxes, of shape (n, 4).
+            segments (np.ndarray): The last move of each bullet, see pack_segments.
+
+        Returns:
+            np.ndarray: A float array of shape (n, 4).
+        """
+        half_extents = NumpyCollisionKernel.__half_extents(bullet_boxes)
+        return np.column_stack((
+            np.minimum(bullet_boxes[:, 0], np.minimum(segments[:, 0], segments[:, 2]) - half_extents[:, 0]),
+            np.minimum(bullet_boxes[:, 1], np.minimum(segments[:, 1], segments[:, 3]) - half_extents[:, 1]),
+            np.maximum(bullet_boxes[:, 2], np.maximum(segments[:, 0], segments[:, 2]) + half_extents[:, 0]),
+            np.maximum(bullet_boxes[:, 3], np.maximum(segments[:, 1], segments[:, 3]) + half_extents[:, 1]),
+        )).reshape(-1, 4)
+
+    @staticmethod
+    def swept_pairs(bullet_boxes: np.ndarray, segments: np.ndarray,
+                    b_boxes: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """Computes every pair where a moving bullet touched a box during its last move.
+
+        Args:
+            bullet_boxes (np.ndarray): The current bullet boxes, of shape (n, 4).
+            segments (np.ndarray): The last move of each bullet, see pack_segments.
+            b_boxes (np.ndarray): The target boxes.
+
+        Returns:
+            tuple[np.ndarray, np.ndarray]: The indices of each hit pair, sorted like in
+            overlapping_pairs.
+        """
+        half_extents = NumpyCollisionKernel.__half_extents(bullet_boxes)
+        swept_boxes = NumpyCollisionKernel.swept_boxes(bullet_boxes, segments)
+
+        a_indices, b_indices = NumpyCollisionKernel.overlapping_pairs(swept_boxes, b_boxes)
+        if len(a_indices) == 0:
+            return a_indices, b_indices
+
+        current, targets = bullet_boxes[a_indices], b_boxes[b_indices]
+        overlapping = (
+            (current[:, 0] < targets[:, 2]) & (targets[:, 0] < current[:, 2]) &
+            (current[:, 1] < targets[:, 3]) & (targets[:, 1] < current[:, 3])
+        )
+        extents = half_extents[a_indices]
+        expanded = np.column_stack((
+            targets[:, 0] - extents[:, 0], targets[:, 1] - extents[:, 1],
+            targets[:, 2] + extents[:, 0], targets[:, 3] + extents[:, 1],
+        ))
+        hits = overlapping | NumpyCollisionKernel.segment_hits_boxes(segments[a_indices], expanded)
+        return a_indices[hits], b_indices[hits]
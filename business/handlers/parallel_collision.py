@@ -0,0 +1,149 @@
+"""Module for the ParallelCollisionKernel class."""
+
+import atexit
+import os
+from multiprocessing import Pool, shared_memory
+
+import numpy as np
+
+import settings
+from business.handlers.numpy_collision import NumpyCollisionKernel
+
+# Shared memory block each worker process is attached to, reused while its name does not change
+_attached: dict[str, shared_memory.SharedMemory] = {}
+
+
+def _attach(name: str) -> shared_memory.SharedMemory:
+    memory = _attached.get(name)
+    if memory is None:
+        for stale in _attached.values():
+            stale.close()
+        _attached.clear()
+        memory = _attached[name] = shared_memory.SharedMemory(name=name)
+    return memory
+
+
+def _test_stripe(task: tuple) -> tuple[np.ndarray, np.ndarray]:
+    """Runs in a worker process: tests one stripe of querying boxes against the indexed boxes.
+
+    Args:
+        task (tuple): (memory name, querying count, swept, indexed count, first querying row,
+            last querying row, left edge of the stripe, right edge of the stripe).
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]: The hit pairs, as rows of the sorted querying boxes
+        and rows of the indexed boxes.
+    """
+    name, querying_count, swept, indexed_count, start, stop, stripe_left, stripe_right = task
+    rows = querying_count * (2 if swept else 1) + indexed_count
+    block = np.ndarray((rows, 4), dtype=np.float64, buffer=_attach(name).buf)
+
+    querying_boxes = block[start:stop]
+    indexed_boxes = block[rows - indexed_count:]
+    in_stripe = np.nonzero((indexed_boxes[:, 0] < stripe_right) & (stripe_left < indexed_boxes[:, 2]))[0]
+
+    if swept:
+        segments = block[querying_count + start:querying_count + stop]
+        a_indices, b_indices = NumpyCollisionKernel.swept_pairs(
+            querying_boxes, segments, indexed_boxes[in_stripe])
+    else:
+        a_indices, b_indices = NumpyCollisionKernel.overlapping_pairs(querying_boxes, indexed_boxes[in_stripe])
+    # Copies, so nothing returned to the main process points into the shared block
+    return (a_indices + start).astype(np.int32), in_stripe[b_indices].astype(np.int32)
+
+
+class ParallelCollisionKernel:
+    """Splits the NumpyCollisionKernel tests across worker processes.
+
+    The querying boxes are sorted by their left edge and cut into vertical stripes, one task
+    per worker. The boxes are written once per call into a shared memory block the workers
+    read in place, and each worker only tests the indexed boxes that cross its stripe. The
+    workers send back the indices of the hit pairs, which the main process resolves.
+    """
+
+    __pool = None
+    __memory: shared_memory.SharedMemory | None = None
+
+    @staticmethod
+    def __workers() -> int:
+        return settings.COLLISION_WORKERS or os.cpu_count() or 1
+
+    @staticmethod
+    def __get_pool():
+        if ParallelCollisionKernel.__pool is None:
+            ParallelCollisionKernel.__pool = Pool(ParallelCollisionKernel.__workers())
+            atexit.register(ParallelCollisionKernel.shutdown)
+        return ParallelCollisionKernel.__pool
+
+    @staticmethod
+    def __get_block(rows: int) -> np.ndarray:
+        """Returns a view over the shared memory block, growing it when it is too small."""
+        size = max(rows * 4 * np.dtype(np.float64).itemsize, 1)
+        memory = ParallelCollisionKernel.__memory
+        if memory is None or memory.size < size:
+            if memory is not None:
+                memory.close()
+                memory.unlink()
+            # Grow by doubling, so a growing crowd does not reallocate every tick
+            memory = shared_memory.SharedMemory(create=True, size=max(size, 2 * (memory.size if memory else 0)))
+            ParallelCollisionKernel.__memory = memory
+        return np.ndarray((rows, 4), dtype=np.float64, buffer=memory.buf)
+
+    @staticmethod
+    def __pairs(querying_boxes: np.ndarray, segments: np.ndarray | None,
+                indexed_boxes: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        swept = segments is not None
+        querying_count, indexed_count = len(querying_boxes), len(indexed_boxes)
+        if querying_count == 0 or indexed_count == 0 or \
+                querying_count + indexed_count < settings.PARALLEL_COLLISION_MIN_ENTITIES:
+            if swept:
+                return NumpyCollisionKernel.swept_pairs(querying_boxes, segments, indexed_boxes)
+            return NumpyCollisionKernel.overlapping_pairs(querying_boxes, indexed_boxes)
+
+        bounds = NumpyCollisionKernel.swept_boxes(querying_boxes, segments) if swept else querying_boxes
+        order = np.argsort(bounds[:, 0], kind="stable")
+
+        block = ParallelCollisionKernel.__get_block(querying_count * (2 if swept else 1) + indexed_count)
+        block[:querying_count] = querying_boxes[order]
+        if swept:
+            block[querying_count:2 * querying_count] = segments[order]
+        block[len(block) - indexed_count:] = indexed_boxes
+
+        sorted_bounds = bounds[order]
+        name = ParallelCollisionKernel.__memory.name
+        stripes = np.array_split(np.arange(querying_count), ParallelCollisionKernel.__workers())
+        tasks = [
+            (name, querying_count, swept, indexed_count, int(stripe[0]), int(stripe[-1]) + 1,
+             float(sorted_bounds[stripe, 0].min()), float(sorted_bounds[stripe, 2].max()))
+            for stripe in stripes if len(stripe)
+        ]
+        results = ParallelCollisionKernel.__get_pool().map(_test_stripe, tasks)
+
+        a_indices = order[np.concatenate([a_stripe for a_stripe, _ in results])]
+        b_indices = np.concatenate([b_stripe for _, b_stripe in results]).astype(np.intp)
+        # Same order as the in-process kernel, so responses are applied deterministically
+        sort = np.lexsort((b_indices, a_indices))
+        return a_indices[sort], b_indices[sort]
+
+    @staticmethod
+    def overlapping_pairs(a_boxes: np.ndarray, b_boxes: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """Parallel version of NumpyCollisionKernel.overlapping_pairs, with the same results."""
+        return ParallelCollisionKernel.__pairs(a_boxes, None, b_boxes)
+
+    @staticmethod
+    def swept_pairs(bullet_boxes: np.ndarray, segments: np.ndarray,
+                    b_boxes: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """Parallel version of NumpyCollisionKernel.swept_pairs, with the same results."""
+        return ParallelCollisionKernel.__pairs(bullet_boxes, segments, b_boxes)
+
+    @staticmethod
+    def shutdown():
+        """Stops the worker processes and releases the shared memory block."""
+        if ParallelCollisionKernel.__pool is not None:
+            ParallelCollisionKernel.__pool.terminate()
+            ParallelCollisionKernel.__pool.join()
+            ParallelCollisionKernel.__pool = None
+        if ParallelCollisionKernel.__memory is not None:
+            ParallelCollisionKernel.__memory.close()
+            ParallelCollisionKernel.__memory.unlink()
+            ParallelCollisionKernel.__memory = None
@@ -0,0 +1,110 @@
+"""Module for the SpatialHashGrid class."""
+
+import settings
+
+
+class SpatialHashGrid:
+    """A uniform grid that buckets entities by the cells their rect overlaps.
+
+    It is used as a collision broadphase: instead of testing an entity against
+    every other entity, only the entities stored in the cells it overlaps are tested.
+    """
+
+    def __init__(self, cell_size: int = settings.COLLISION_CELL_SIZE):
+        self.__cell_size = cell_size
+        self.__cells: dict[tuple[int, int], list] = {}
+
+    def __cell_range(self, left: float, top: float, right: float, bottom: float):
+        """Returns the range of cell columns and rows covered by the given bounds."""
+        size = self.__cell_size
+        return (
+            range(int(left // size), int(max(left, right - 1) // size) + 1),
+            range(int(top // size), int(max(top, bottom - 1) // size) + 1),
+        )
+
+    def clear(self):
+        """Removes every entity from the grid."""
+        self.__cells.clear()
+
+    def insert(self, entity, rect):
+        """Stores an entity in every cell its rect overlaps.
+
+        Args:
+            entity: The entity to store.
+            rect (pygame.Rect): The bounds of the entity.
+        """
+        columns, rows = self.__cell_range(rect.left, rect.top, rect.right, rect.bottom)
+        for col in columns:
+            for row in rows:
+                cell = self.__cells.get((col, row))
+                if cell is None:
+                    self.__cells[(col, row)] = [entity]
+                else:
+                    cell.append(entity)
+
+    def insert_point(self, entity, pos_x: float, pos_y: float):
+        """Stores an entity in the cell that contains a point.
+
+        Args:
+            entity: The entity to store.
+            pos_x (float): The x-coordinate of the point.
+            pos_y (float): The y-coordinate of the point.
+        """
+        key = self.cell_of(pos_x, pos_y)
+        cell = self.__cells.get(key)
+        if cell is None:
+            self.__cells[key] = [entity]
+        else:
+            cell.append(entity)
+
+    def insert_all(self, entities):
+        """Stores every entity using the rect of its sprite.
+
+        Args:
+            entities (Iterable[IHasSprite]): The entities to store.
+        """
+        for entity in entities:
+            self.insert(entity, entity.sprite.rect)
+
+    def query(self, rect) -> list:
+        """Returns the entities stored in the cells overlapped by a rect.
+
+        Each entity is returned once, even if it spans several of those cells.
+
+        Args:
+            rect (pygame.Rect): The area to look up.
+
+        Returns:
+            list: The candidate entities, in insertion order per cell.
+        """
+        columns, rows = self.__cell_range(rect.left, rect.top, rect.right, rect.bottom)
+        found = []
+        seen = set()
+        for col in columns:
+            for row in rows:
+                for entity in self.__cells.get((col, row), ()):
+                    if id(entity) not in seen:
+                        seen.add(id(entity))
+                        found.append(entity)
+        return found
+
+    def query_cell(self, col: int, row: int):
+        """Returns the entities stored in a single cell.
+
+        Args:
+            col (int): The column of the cell.
+            row (int): The row of the cell.
+
+        Returns:
+            Sequence: The entities of the cell. It must not be modified.
+        """
+        return self.__cells.get((col, row), ())
+
+    def cell_of(self, pos_x: float, pos_y: float) -> tuple[int, int]:
+        """Returns the column and row of the cell that contains a point."""
+        return int(pos_x // self.__cell_size), int(pos_y // self.__cell_size)
+
+    @property
+    def cell_size(self) -> int:
+        """The side of a cell, in pixels."""
+        return self.__cell_size
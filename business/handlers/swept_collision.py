@@ -0,0 +1,117 @@
+"""Module for the SweptCollision class."""
+
+import pygame
+
+from business.entities.interfaces import IBullet, IHasSprite
+
+
+class SweptCollision:
+    """Continuous collision tests for fast moving bullets.
+
+    A bullet is treated as its sprite rect travelling along the segment between its
+    previous and current positions, so it cannot tunnel through a target between two ticks.
+    """
+
+    @staticmethod
+    def swept_rect(bullet: IBullet) -> pygame.Rect:
+        """Returns the area covered by a bullet rect during its last move.
+
+        Args:
+            bullet (IBullet): The bullet.
+
+        Returns:
+            pygame.Rect: The union of the bullet rect at its previous and current positions,
+            grown by a pixel to absorb the rounding of the positions.
+        """
+        rect = bullet.sprite.rect
+        previous_rect = rect.copy()
+        previous_rect.center = (int(bullet.previous_pos_x), int(bullet.previous_pos_y))
+        return rect.union(previous_rect).inflate(2, 2)
+
+    @staticmethod
+    def segment_box_interval(start_x: float, start_y: float, end_x: float, end_y: float,
+                             left: float, top: float, right: float, bottom: float):
+        """Computes the part of a segment that lies inside a box (slab test).
+
+        Args:
+            start_x (float): The x-coordinate of the start of the segment.
+            start_y (float): The y-coordinate of the start of the segment.
+            end_x (float): The x-coordinate of the end of the segment.
+            end_y (float): The y-coordinate of the end of the segment.
+            left, top, right, bottom (float): The bounds of the box.
+
+        Returns:
+            tuple[float, float] | None: The segment parameters, between 0 and 1, where the
+            segment enters and leaves the interior of the box, or None if it never does.
+        """
+        t_enter, t_exit = 0.0, 1.0
+        for start, delta, low, high in ((start_x, end_x - start_x, left, right),
+                                        (start_y, end_y - start_y, top, bottom)):
+            if delta == 0:
+                if not low < start < high:
+                    return None
+                continue
+            t_low = (low - start) / delta
+            t_high = (high - start) / delta
+            if t_low > t_high:
+                t_low, t_high = t_high, t_low
+            t_enter = max(t_enter, t_low)
+            t_exit = min(t_exit, t_high)
+            if t_enter >= t_exit:
+                return None
+        return t_enter, t_exit
+
+    @staticmethod
+    def segment_hits_box(start_x: float, start_y: float, end_x: float, end_y: float,
+                         left: float, top: float, right: float, bottom: float) -> bool:
+        """Checks if a segment goes through the interior of a box.
+
+        Args:
+            start_x (float): The x-coordinate of the start of the segment.
+            start_y (float): The y-coordinate of the start of the segment.
+            end_x (float): The x-coordinate of the end of the segment.
+            end_y (float): The y-coordinate of the end of the segment.
+            left, top, right, bottom (float): The bounds of the box.
+
+        Returns:
+            bool: True if some point of the segment lies strictly inside the box.
+        """
+        return SweptCollision.segment_box_interval(
+            start_x, start_y, end_x, end_y, left, top, right, bottom) is not None
+
+    @staticmethod
+    def bullet_interval(bullet: IBullet, target: IHasSprite):
+        """Computes the part of the last bullet move during which it overlapped a target.
+
+        Args:
+            bullet (IBullet): The bullet.
+            target (IHasSprite): The entity that may have been hit.
+
+        Returns:
+            tuple[float, float] | None: The move parameters, between 0 and 1, where the bullet
+            starts and stops overlapping the target rect, or None if it never did.
+        """
+        bullet_rect = bullet.sprite.rect
+        target_rect = target.sprite.rect
+        half_width = bullet_rect.width / 2
+        half_height = bullet_rect.height / 2
+        return SweptCollision.segment_box_interval(
+            bullet.previous_pos_x, bullet.previous_pos_y, bullet.pos_x, bullet.pos_y,
+            target_rect.left - half_width, target_rect.top - half_height,
+            target_rect.right + half_width, target_rect.bottom + half_height,
+        )
+
+    @staticmethod
+    def bullet_hits(bullet: IBullet, target: IHasSprite) -> bool:
+        """Checks if a bullet touched a target at any point of its last move.
+
+        Args:
+            bullet (IBullet): The bullet.
+            target (IHasSprite): The entity that may have been hit.
+
+        Returns:
+            bool: True if the bullet overlaps the target now or went through it this tick.
+        """
+        if bullet.sprite.rect.colliderect(target.sprite.rect):
+            return True
+        return SweptCollision.bullet_interval(bullet, target) is not None
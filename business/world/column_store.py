@@ -0,0 +1,251 @@
+"""Module for the ColumnStore class."""
+
+from collections.abc import Sequence
+from itertools import count
+
+import numpy as np
+
+# Handles are unique across every store, so an entity keeps its handle when it moves
+_handles = count(1)
+
+
+class ColumnStore:
+    """Rows of NumPy columns, each row viewed by an entity object.
+
+    Subclasses list their columns in COLUMNS, as a dict of name to dtype. The entities are
+    thin views over their row: they must provide bind(store, row), store and row. Rows are
+    kept packed, so removing an entity moves the last row into the freed one.
+
+    Every entity also gets an integer handle, stored in an extra handle column. The handle
+    never changes, so other systems can keep it and look the entity up in O(1).
+    """
+
+    COLUMNS: dict[str, type] = {}
+
+    def __init__(self, capacity: int = 64):
+        self.__count = 0
+        columns = {"handle": np.int64, **self.COLUMNS}
+        self.__columns = {name: np.zeros(max(1, capacity), dtype=dtype) for name, dtype in columns.items()}
+        self.__views: list = []
+        self.__rows: dict[int, int] = {}
+        self.__entities = EntitySequence(self.__views)
+
+    def __len__(self) -> int:
+        return self.__count
+
+    def __grow(self):
+        for name, column in self.__columns.items():
+            self.__columns[name] = np.concatenate((column, np.zeros_like(column)))
+
+    def column(self, name: str) -> np.ndarray:
+        """Returns the live values of a column, as a view that can be written in place.
+
+        Args:
+            name (str): One of the column names.
+
+        Returns:
+            np.ndarray: The column, with one value per entity of the store.
+        """
+        return self.__columns[name][:self.__count]
+
+    def get(self, row: int, name: str):
+        """Returns the value of a column for one entity."""
+        return self.__columns[name][row].item()
+
+    def set(self, row: int, name: str, value):
+        """Sets the value of a column for one entity."""
+        self.__columns[name][row] = value
+
+    def values(self, row: int) -> dict:
+        """Returns the value of every column for one entity."""
+        return {name: column[row].item() for name, column in self.__columns.items()}
+
+    def view(self, row: int):
+        """Returns the entity viewing a row."""
+        return self.__views[row]
+
+    def find(self, handle: int):
+        """Returns the entity with a handle, or None if it is not in the store."""
+        row = self.__rows.get(handle)
+        return None if row is None else self.__views[row]
+
+    def add(self, entity, values: dict | None = None):
+        """Appends a row for an entity and binds the entity to it.
+
+        Args:
+            entity: The entity view.
+            values (dict | None): The value of each column. Defaults to the values of the
+                row the entity is currently bound to, which is taken from its store. A new
+                handle is given when the values have none.
+        """
+        if values is None:
+            values = entity.store.__take(entity)
+        if "handle" not in values:
+            values = {**values, "handle": next(_handles)}
+        if self.__count == len(self.__columns[next(iter(self.__columns))]):
+            self.__grow()
+        row = self.__count
+        for name, column in self.__columns.items():
+            column[row] = values[name]
+        self.__count += 1
+        self.__views.append(entity)
+        self.__rows[values["handle"]] = row
+        entity.bind(self, row)
+
+    def remove(self, entity):
+        """Removes the row of an entity, which keeps its state in a store of its own.
+
+        Args:
+            entity: The entity view.
+
+        Raises:
+            ValueError: If the entity is not in the store.
+        """
+        values = self.__take(entity)
+        type(self)(1).add(entity, values)
+
+    def transfer(self, entity, store: "ColumnStore", values: dict | None = None):
+        """Moves the row of an entity to another store with the same columns.
+
+        Args:
+            entity: The entity view.
+            store (ColumnStore): The store receiving the entity.
+            values (dict | None): The new value of each column. Defaults to the current ones,
+                handle included.
+
+        Raises:
+            ValueError: If the entity is not in the store.
+        """
+        taken = self.__take(entity)
+        store.add(entity, taken if values is None else values)
+
+    def __take(self, entity) -> dict:
+        """Frees the row of an entity and returns the values it held."""
+        if entity.store is not self:
+            raise ValueError(f"{entity} is not in the store")
+        row = self.__rows.pop(entity.handle)
+        values = self.values(row)
+
+        last = self.__count - 1
+        if row != last:
+            for column in self.__columns.values():
+                column[row] = column[last]
+            moved = self.__views[last]
+            self.__views[row] = moved
+            self.__rows[moved.handle] = row
+            moved.bind(self, row)
+        self.__views.pop()
+        self.__count -= 1
+        return values
+
+    def clear(self):
+        """Removes every entity."""
+        for entity in list(self.__views):
+            self.remove(entity)
+
+    @property
+    def views(self) -> "EntitySequence":
+        """The entity views in row order, as a live read-only sequence that is never copied."""
+        return self.__entities
+
+
+class EntitySequence(Sequence):
+    """Read-only live sequence over the entities of a store.
+
+    It wraps the list of the store instead of copying it. Iterating is safe while the
+    store removes the entity being visited or entities not visited yet: the entity that
+    takes the freed row is still visited. Entities added during the iteration are visited
+    too.
+    """
+
+    __slots__ = ('__entities',)
+
+    def __init__(self, entities: list):
+        self.__entities = entities
+
+    def __len__(self) -> int:
+        return len(self.__entities)
+
+    def __getitem__(self, index):
+        return self.__entities[index]
+
+    def __iter__(self):
+        entities = self.__entities
+        row = 0
+        while row < len(entities):
+            entity = entities[row]
+            yield entity
+            # When the entity was removed, the row now holds one that was not visited yet
+            if row < len(entities) and entities[row] is entity:
+                row += 1
+
+
+# Slots a class using ColumnView must declare, the mixin cannot own them because the
+# entity base classes have slots of their own
+VIEW_SLOTS = ('_ColumnView__store', '_ColumnView__row')
+
+
+class ColumnView:
+    """Mixin for the entities that are views over a row of a ColumnStore.
+
+    The position and speed attributes of MovableEntity are proxied to the pos_x, pos_y and
+    speed columns, so the base entity code reads and writes the store. Classes using the
+    mixin list VIEW_SLOTS in their __slots__.
+    """
+
+    __slots__ = ()
+
+    def bind(self, store: ColumnStore, row: int):
+        """Makes the entity a view over a row of a store.
+
+        Args:
+            store (ColumnStore): The store holding the state of the entity.
+            row (int): The row of the entity in the store.
+        """
+        self.__store = store
+        self.__row = row
+
+    @property
+    def store(self) -> ColumnStore:
+        """The store holding the state of the entity."""
+        return self.__store
+
+    @property
+    def row(self) -> int:
+        """The row of the entity in its store."""
+        return self.__row
+
+    @property
+    def handle(self) -> int:
+        """The handle of the entity, which does not change when its row does."""
+        return self.__store.get(self.__row, "handle")
+
+    def _get(self, name: str):
+        return self.__store.get(self.__row, name)
+
+    def _set(self, name: str, value):
+        self.__store.set(self.__row, name, value)
+
+    @property
+    def _pos_x(self) -> float:
+        return self.__store.get(self.__row, "pos_x")
+
+    @_pos_x.setter
+    def _pos_x(self, value: float):
+        self.__store.set(self.__row, "pos_x", value)
+
+    @property
+    def _pos_y(self) -> float:
+        return self.__store.get(self.__row, "pos_y")
+
+    @_pos_y.setter
+    def _pos_y(self, value: float):
+        self.__store.set(self.__row, "pos_y", value)
+
+    @property
+    def _speed(self) -> float:
+        return self.__store.get(self.__row, "speed")
+
+    @_speed.setter
+    def _speed(self, value: float):
+        self.__store.set(self.__row, "speed", value)
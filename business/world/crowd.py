@@ -0,0 +1,180 @@
+"""Module for the CrowdSeparation class."""
+
+from collections.abc import Sequence
+from math import cos, sin
+
+import numpy as np
+
+import settings
+from business.entities.interfaces import IMonster
+from business.handlers.spatial_hash import SpatialHashGrid
+
+
+class CrowdSeparation:
+    """Keeps monster crowds spread out.
+
+    The monster positions are bucketed in a grid whose cells are as big as the separation
+    radius, so every neighbour of a monster lies in the 3x3 cells around it. Each monster
+    looks at a bounded number of neighbours, so the whole crowd costs O(n).
+    """
+
+    def __init__(self, radius: float = settings.SEPARATION_RADIUS,
+                 max_neighbours: int = settings.SEPARATION_MAX_NEIGHBOURS):
+        self.__radius = radius
+        self.__max_neighbours = max_neighbours
+        self.__grid = SpatialHashGrid(int(radius))
+        self.__monsters: list[IMonster] = []
+        self.__is_stale = False
+
+    @staticmethod
+    def __split_direction(monster: IMonster, other: IMonster) -> tuple[float, float]:
+        angle = ((id(monster) ^ id(other)) * 2654435761 % 6283) / 1000
+        sign = 1.0 if id(monster) < id(other) else -1.0
+        return sign * cos(angle), sign * sin(angle)
+
+    def update(self, monsters: Sequence[IMonster]):
+        """Sets the monsters to index for the current tick.
+
+        The index is only built on the first call to separation_force of the tick.
+
+        Args:
+            monsters (Sequence[IMonster]): The monsters of the world.
+        """
+        self.__monsters = monsters
+        self.__is_stale = True
+
+    def __rebuild(self):
+        self.__grid.clear()
+        for monster in self.__monsters:
+            self.__grid.insert_point(monster, monster.pos_x, monster.pos_y)
+        self.__is_stale = False
+
+    def separation_force(self, monster: IMonster) -> tuple[float, float]:
+        """Computes the push a monster gets away from its closest neighbours.
+
+        Each neighbour inside the radius pushes with a strength that fades linearly
+        from 1, when both monsters overlap, to 0 at the edge of the radius.
+
+        Args:
+            monster (IMonster): The monster to push.
+
+        Returns:
+            tuple[float, float]: The separation force, as (x, y).
+        """
+        if self.__is_stale:
+            self.__rebuild()
+        pos_x, pos_y = monster.pos_x, monster.pos_y
+        col, row = self.__grid.cell_of(pos_x, pos_y)
+        radius = self.__radius
+
+        force_x = force_y = 0.0
+        neighbours = 0
+        examined = 0
+        for neighbour_col in (col - 1, col, col + 1):
+            for neighbour_row in (row - 1, row, row + 1):
+                for other in self.__grid.query_cell(neighbour_col, neighbour_row):
+                    if other is monster:
+                        continue
+                    examined += 1
+                    if examined > 4 * self.__max_neighbours:
+                        return force_x, force_y
+
+                    delta_x, delta_y = pos_x - other.pos_x, pos_y - other.pos_y
+                    distance = (delta_x ** 2 + delta_y ** 2) ** 0.5
+                    if distance >= radius:
+                        continue
+                    if distance < 1:
+                        # Stacked monsters are split in opposite directions along an axis
+                        # that depends on the pair, so a whole stack does not cancel out
+                        delta_x, delta_y = CrowdSeparation.__split_direction(monster, other)
+                        distance = 1.0
+
+                    strength = 1 - distance / radius
+                    force_x += delta_x / distance * strength
+                    force_y += delta_y / distance * strength
+                    neighbours += 1
+                    if neighbours >= self.__max_neighbours:
+                        return force_x, force_y
+        return force_x, force_y
+
+    @staticmethod
+    def __rank_in_group(monsters: np.ndarray, count: int) -> np.ndarray:
+        """Returns the rank of each pair among the pairs of its monster, grouped by monster."""
+        sizes = np.bincount(monsters, minlength=count)
+        return np.arange(len(monsters)) - (np.cumsum(sizes) - sizes)[monsters]
+
+    def separation_forces(self, pos_x: np.ndarray,
+                          pos_y: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """Vectorized separation_force for a whole crowd given by its positions.
+
+        The positions are sorted by cell and the neighbour cells are looked up in dense
+        tables over the cells of the crowd bounding box. The candidates of each monster are
+        visited in the order of separation_force, with the same caps over the 3x3 cells
+        around it, so both give the same forces. Only stacked monsters are split along
+        other axes, which depend on the positions in the arrays.
+
+        Args:
+            pos_x (np.ndarray): The x-coordinates of the monsters.
+            pos_y (np.ndarray): The y-coordinates of the monsters.
+
+        Returns:
+            tuple[np.ndarray, np.ndarray]: The separation force of each monster, as (x, y).
+        """
+        count = len(pos_x)
+        force_x, force_y = np.zeros(count), np.zeros(count)
+        if count < 2:
+            return force_x, force_y
+
+        radius = self.__radius
+        cols = np.floor(pos_x / radius).astype(np.int64)
+        rows = np.floor(pos_y / radius).astype(np.int64)
+        # One padding cell on each side, so the keys of the neighbour cells never wrap around
+        cols -= cols.min() - 1
+        rows -= rows.min() - 1
+        height = int(rows.max()) + 2
+        keys = cols * height + rows
+        order = np.argsort(keys, kind="stable")
+        # Dense tables over the cells of the crowd bounding box: monsters per cell and first
+        # position of each cell in the sorted order
+        cell_sizes = np.bincount(keys, minlength=int(keys.max()) + height + 2)
+        cell_starts = np.cumsum(cell_sizes) - cell_sizes
+
+        # The candidates of each monster, grouped by monster and in the cell order of the
+        # scalar loops. No more than the examined cap, the monster included, are taken from
+        # its 3x3 cells.
+        examined_cap = 4 * self.__max_neighbours
+        offsets = np.array([col * height + row for col in (-1, 0, 1) for row in (-1, 0, 1)])
+        neighbour_keys = keys[:, None] + offsets[None, :]
+        taken_before = np.cumsum(cell_sizes[neighbour_keys], axis=1) - cell_sizes[neighbour_keys]
+        taken = np.clip(examined_cap + 1 - taken_before, 0, cell_sizes[neighbour_keys]).ravel()
+        start = cell_starts[neighbour_keys].ravel()
+
+        total = int(taken.sum())
+        first = np.repeat(np.cumsum(taken) - taken, taken)
+        monsters = np.repeat(np.repeat(np.arange(count), len(offsets)), taken)
+        others = order[np.repeat(start, taken) + np.arange(total) - first]
+        distinct = np.flatnonzero(monsters != others)
+        monsters, others = monsters[distinct], others[distinct]
+        examined = np.flatnonzero(CrowdSeparation.__rank_in_group(monsters, count) < examined_cap)
+        monsters, others = monsters[examined], others[examined]
+
+        delta_x, delta_y = pos_x[monsters] - pos_x[others], pos_y[monsters] - pos_y[others]
+        close = np.flatnonzero(delta_x * delta_x + delta_y * delta_y < radius * radius)
+        monsters, others = monsters[close], others[close]
+        ranks = CrowdSeparation.__rank_in_group(monsters, count)
+        kept = np.flatnonzero(ranks < self.__max_neighbours)
+        monsters, others = monsters[kept], others[kept]
+        delta_x, delta_y = delta_x[close][kept], delta_y[close][kept]
+        distance = np.hypot(delta_x, delta_y)
+
+        # Stacked monsters are split in opposite directions along an axis that depends on the pair
+        stacked = distance < 1
+        angle = ((monsters[stacked] ^ others[stacked]) * 2654435761 % 6283) / 1000
+        sign = np.where(monsters[stacked] < others[stacked], 1.0, -1.0)
+        delta_x[stacked], delta_y[stacked] = sign * np.cos(angle), sign * np.sin(angle)
+        distance[stacked] = 1.0
+
+        strength = (1 - distance / radius) / distance
+        force_x += np.bincount(monsters, weights=delta_x * strength, minlength=count)
+        force_y += np.bincount(monsters, weights=delta_y * strength, minlength=count)
+        return force_x, force_y
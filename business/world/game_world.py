@@ -1,7 +1,15 @@
 """This module contains the implementation of the game world."""
 import random
+from collections.abc import Sequence
+
+import settings
 from business.entities.interfaces import IBullet, IExperienceGem, IMonster, IPlayer
 from business.world.interfaces import IGameWorld, IMonsterSpawner, ITileMap
+from business.world.crowd import CrowdSeparation
+from business.world.monster_array import EVICTION_POLICIES, MonsterArray
+from business.world.gem_array import GemArray
+from business.world.projectile_array import ProjectileArray
+from business.world.targeting import TargetingService
 from business.handlers.cooldown_handler import CooldownHandler
 from business.entities.experience_gem import *
 from business.entities.monster import Monster
@@ -15,9 +23,9 @@ class GameWorld(IGameWorld):
     def __init__(self, spawner: IMonsterSpawner, tile_map: ITileMap, player: IPlayer):
         # Initialize the player and lists for monsters, bullets and gems
         self.__player: IPlayer = player
-        self.__monsters: list[IMonster] = []
-        self.__bullets: list[IBullet] = []
-        self.__experience_gems: list[IExperienceGem] = []
+        self.__monsters = MonsterArray()
+        self.__bullets = ProjectileArray()
+        self.__experience_gems = GemArray()
         self.__spawn_cooldown = CooldownHandler(2500)
         self.__monster_levelup_cooldown = CooldownHandler(10000)
 
@@ -27,19 +35,40 @@ class GameWorld(IGameWorld):
         # Initialize the monster spawner
         self.__monster_spawner: IMonsterSpawner = spawner
 
+        # Structural changes queued during the tick, applied by apply_pending_changes
+        self.__pending_changes: list[tuple] = []
+        self.__pending_removals: set[int] = set()
+        self.__pending_monsters = 0
+
+        # Monsters kept out by settings.MAX_LIVE_MONSTERS
+        if settings.MONSTER_EVICTION_POLICY not in EVICTION_POLICIES + ("refuse",):
+            raise ValueError(f"Unknown eviction policy: {settings.MONSTER_EVICTION_POLICY}")
+        self.__monster_budget = {'refused': 0, 'evicted': 0}
+
+        # Monster indexes shared by the weapons and the crowds, refreshed once per tick
+        self.__targeting = TargetingService()
+        self.__crowd = CrowdSeparation()
+
         # Timer
         self.__timer = 0
         self.__timer_cooldown = CooldownHandler(1000)
 
     def update(self):
+        monsters = self.__monsters.views
+        self.__targeting.update(monsters)
+        self.__crowd.update(monsters)
         self.player.update(self)
 
-        for monster in self.__monsters:
-            monster.update(self)
-            monster.levelup(self, self.__monster_levelup_cooldown)
+        for gem in self.__experience_gems.step(self.__player):
+            self.__player.pickup_gem(gem)
+            self.remove_experience_gem(gem)
+
+        self.__monsters.step(self)
+        # The level up cooldown is shared, so only the first monster finds it ready
+        if len(self.__monsters) > 0:
+            self.__monsters.views[0].levelup(self, self.__monster_levelup_cooldown)
 
-        for bullet in self.__bullets:
-            bullet.update(self)
+        self.__bullets.step(self)
 
         self.__monster_spawner.update(self)
 
@@ -47,14 +76,70 @@ class GameWorld(IGameWorld):
             self.__timer += 1
             self.__timer_cooldown.put_on_cooldown()
 
+    def __queue_addition(self, store, entity):
+        self.__pending_changes.append((store, entity, True))
+
+    def __queue_removal(self, store, entity) -> bool:
+        """Queues the removal of an entity, unless it is already queued."""
+        if entity.handle in self.__pending_removals:
+            return False
+        self.__pending_removals.add(entity.handle)
+        self.__pending_changes.append((store, entity, False))
+        return True
+
+    def apply_pending_changes(self):
+        """Applies the additions and removals queued during the tick, in order.
+
+        The gems are then kept under settings.GEM_CAP, and the buff gems that outlived
+        settings.GEM_BUFF_LIFETIME are removed.
+        """
+        for store, entity, is_addition in self.__pending_changes:
+            if is_addition:
+                store.add(entity)
+            # Entities removed before their addition was applied never reached the store
+            elif entity.store is store:
+                if store is self.__monsters:
+                    # The spawner moves the monster straight from the store to its free list
+                    self.__monster_spawner.recycle(entity)
+                else:
+                    store.remove(entity)
+        self.__pending_changes.clear()
+        self.__pending_removals.clear()
+        self.__pending_monsters = 0
+
+        # Under "refuse" the monsters already alive stay, even when the budget is lowered
+        excess = len(self.__monsters) - settings.MAX_LIVE_MONSTERS
+        if excess > 0 and settings.MONSTER_EVICTION_POLICY != "refuse":
+            for monster in self.__monsters.evictions(excess, settings.MONSTER_EVICTION_POLICY, self.__player):
+                self.__monster_spawner.recycle(monster)
+            self.__monster_budget['evicted'] += excess
+
+        gems = self.__experience_gems
+        for gem in gems.expired():
+            gems.remove(gem)
+        if len(gems) > settings.GEM_CAP:
+            for gem in gems.merge(settings.GEM_CAP, settings.GEM_MERGE_CELL_SIZE):
+                gems.remove(gem)
+
+    def is_pending_removal(self, entity) -> bool:
+        return bool(self.__pending_removals) and getattr(entity, "handle", None) in self.__pending_removals
+
     def add_monster(self, monster: IMonster):
         if not self.__spawn_cooldown:
             return
 
-        self.__monsters.append(monster)
+        if settings.MONSTER_EVICTION_POLICY == "refuse" and \
+                len(self.__monsters) + self.__pending_monsters >= settings.MAX_LIVE_MONSTERS:
+            self.__monster_spawner.recycle(monster)
+            self.__monster_budget['refused'] += 1
+            return
+
+        self.__pending_monsters += 1
+        self.__queue_addition(self.__monsters, monster)
 
     def remove_monster(self, monster: IMonster):
-        self.__monsters.remove(monster)
+        if not self.__queue_removal(self.__monsters, monster):
+            return
 
         # Genera un número aleatorio entre 0 y 100
         probability = random.uniform(0, 100)
@@ -77,20 +162,36 @@ class GameWorld(IGameWorld):
                 HealthGem(monster.pos_x, monster.pos_y, 1, health_boost=25, duration=5))
 
     def add_experience_gem(self, gem: IExperienceGem):
-        self.__experience_gems.append(gem)
+        self.__queue_addition(self.__experience_gems, gem)
 
     def remove_experience_gem(self, gem: IExperienceGem):
-        self.__experience_gems.remove(gem)
+        self.__queue_removal(self.__experience_gems, gem)
 
     def add_bullet(self, bullet: IBullet):
-        self.__bullets.append(bullet)
+        self.__queue_addition(self.__bullets, bullet)
 
     def remove_bullet(self, bullet: IBullet):
-        self.__bullets.remove(bullet)
+        self.__queue_removal(self.__bullets, bullet)
+
+    def find_entity(self, handle: int):
+        for store in (self.__monsters, self.__bullets, self.__experience_gems):
+            entity = store.find(handle)
+            if entity is not None:
+                return entity
+        return None
 
     def clear_all_entities(self):
         """Clears all entities from the world."""
         self.__player = None  # type: ignore
+        # The monsters alive or waiting to be added go back to the spawner free lists
+        for store, entity, is_addition in self.__pending_changes:
+            if is_addition and store is self.__monsters:
+                self.__monster_spawner.recycle(entity)
+        for monster in list(self.__monsters.views):
+            self.__monster_spawner.recycle(monster)
+        self.__pending_changes.clear()
+        self.__pending_removals.clear()
+        self.__pending_monsters = 0
         self.__monsters.clear()
         self.__bullets.clear()
         self.__experience_gems.clear()
@@ -132,6 +233,8 @@ class GameWorld(IGameWorld):
 
                 self.add_experience_gem(gem)
 
+        self.apply_pending_changes()
+
         # Set timer
         self.__timer = game_data['timer']
 
@@ -140,16 +243,36 @@ class GameWorld(IGameWorld):
         return self.__player
 
     @property
-    def monsters(self) -> list[IMonster]:
-        return self.__monsters[:]
+    def monsters(self) -> Sequence[IMonster]:
+        return self.__monsters.views
+
+    @property
+    def bullets(self) -> Sequence[IBullet]:
+        return self.__bullets.views
+
+    @property
+    def projectiles(self) -> ProjectileArray:
+        return self.__bullets
+
+    @property
+    def experience_gems(self) -> Sequence[IExperienceGem]:
+        return self.__experience_gems.views
+
+    @property
+    def gems(self) -> GemArray:
+        return self.__experience_gems
+
+    @property
+    def monster_budget(self) -> dict[str, int]:
+        return dict(self.__monster_budget)
 
     @property
-    def bullets(self) -> list[IBullet]:
-        return self.__bullets[:]
+    def targeting(self) -> TargetingService:
+        return self.__targeting
 
     @property
-    def experience_gems(self) -> list[IExperienceGem]:
-        return self.__experience_gems[:]
+    def crowd(self) -> CrowdSeparation:
+        return self.__crowd
 
     @property
     def timer(self) -> int:
@@ -0,0 +1,108 @@
+"""Module for the GemArray class."""
+
+import numpy as np
+
+import settings
+from business.world.column_store import ColumnStore
+
+# Name and type of each column of the store
+COLUMNS = {
+    "pos_x": np.float64,
+    "pos_y": np.float64,
+    "width": np.int64,
+    "height": np.int64,
+    "amount": np.int64,
+    "mergeable": np.bool_,
+    "lifetime": np.int64,  # Ticks left before the gem disappears, -1 for the gems that stay
+}
+
+
+class GemArray(ColumnStore):
+    """Column store holding the position and size of every gem of the world.
+
+    The gem objects are thin views over their row. The magnet pull, the pickup test, the
+    merging and the expiry run over the columns, so only the gems that are actually
+    collected, merged or expired reach Python code.
+    """
+
+    COLUMNS = COLUMNS
+
+    def step(self, player) -> list:
+        """Pulls the gems inside the pickup radius towards the player.
+
+        It also counts down the lifetime of the gems, so the lifetimes stop while the world
+        is not updated, during a pause for instance.
+
+        Args:
+            player (IPlayer): The player collecting the gems.
+
+        Returns:
+            list[IExperienceGem]: The gems the player touches after the pull.
+        """
+        if len(self) == 0:
+            return []
+        lifetime = self.column("lifetime")
+        lifetime[lifetime > 0] -= 1
+        pos_x, pos_y = self.column("pos_x"), self.column("pos_y")
+
+        delta_x, delta_y = player.pos_x - pos_x, player.pos_y - pos_y
+        distance = np.hypot(delta_x, delta_y)
+        pulled = (distance < player.pickup_radius) & (distance > 0)
+        step = np.minimum(settings.GEM_MAGNET_SPEED, distance[pulled]) / distance[pulled]
+        pos_x[pulled] += delta_x[pulled] * step
+        pos_y[pulled] += delta_y[pulled] * step
+
+        # Same test as pygame.Rect.colliderect between the gem and player sprite rects
+        width, height = self.column("width"), self.column("height")
+        left = np.trunc(pos_x) - width // 2
+        top = np.trunc(pos_y) - height // 2
+        player_rect = player.sprite.rect
+        touching = (
+            (left < player_rect.right) & (player_rect.left < left + width) &
+            (top < player_rect.bottom) & (player_rect.top < top + height)
+        )
+        return [self.view(row) for row in np.flatnonzero(touching).tolist()]
+
+    def expired(self) -> list:
+        """Returns the gems whose lifetime is over.
+
+        Returns:
+            list[IExperienceGem]: The gems to remove from the world.
+        """
+        expired = self.column("lifetime") == 0
+        return [self.view(row) for row in np.flatnonzero(expired).tolist()]
+
+    def merge(self, cap: int, cell_size: float) -> list:
+        """Folds the mergeable gems of each grid cell into one until at most cap gems are left.
+
+        The amount of every folded gem is added to the gem kept in its cell, so no experience
+        is lost. The cells double in size after each pass that leaves too many gems.
+
+        Args:
+            cap (int): The number of gems to stay under.
+            cell_size (float): The side of the cells of the first pass.
+
+        Returns:
+            list[IExperienceGem]: The folded gems, to remove from the world.
+        """
+        pos_x, pos_y = self.column("pos_x"), self.column("pos_y")
+        amount, mergeable = self.column("amount"), self.column("mergeable")
+        folded = np.zeros(len(self), dtype=bool)
+
+        while len(self) - np.count_nonzero(folded) > cap:
+            rows = np.flatnonzero(mergeable & ~folded)
+            if len(rows) < 2:
+                break
+            cell_x = np.floor(pos_x[rows] / cell_size).astype(np.int64)
+            cell_y = np.floor(pos_y[rows] / cell_size).astype(np.int64)
+            cell_y -= cell_y.min()
+            _, first, cells = np.unique(cell_x * (cell_y.max() + 1) + cell_y, return_index=True, return_inverse=True)
+
+            # The first gem of each cell takes the amount of the whole cell
+            totals = np.bincount(cells, weights=amount[rows]).astype(np.int64)
+            folded[rows] = True
+            folded[rows[first]] = False
+            amount[rows[first]] = totals
+            cell_size *= 2
+
+        return [self.view(row) for row in np.flatnonzero(folded).tolist()]
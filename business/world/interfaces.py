@@ -1,9 +1,18 @@
 """This module contains interfaces for the game world."""
 
 from abc import ABC, abstractmethod
+from collections.abc import Sequence
+from typing import TYPE_CHECKING
 
 from business.entities.interfaces import IBullet, IExperienceGem, IMonster, IPlayer
 
+if TYPE_CHECKING:
+    # Only for the annotations, the interfaces do not depend on the implementations
+    from business.world.crowd import CrowdSeparation
+    from business.world.gem_array import GemArray
+    from business.world.projectile_array import ProjectileArray
+    from business.world.targeting import TargetingService
+
 
 class IGameWorld(ABC):
     """Interface for the game world.
@@ -59,6 +68,38 @@ class IGameWorld(ABC):
             bullet (IBullet): The bullet to remove.
         """
 
+    @abstractmethod
+    def apply_pending_changes(self):
+        """Applies the additions and removals of entities queued during the tick.
+
+        The add and remove methods only queue their change, so the entities can be added
+        and removed while the world is being iterated. The game calls this once per tick,
+        after the deaths are handled.
+        """
+
+    @abstractmethod
+    def is_pending_removal(self, entity) -> bool:
+        """Checks if the removal of an entity is queued for the end of the tick.
+
+        Args:
+            entity: The entity to check.
+
+        Returns:
+            bool: True if the entity is leaving the world at the end of the tick.
+        """
+
+    @abstractmethod
+    def find_entity(self, handle: int):
+        """Finds a monster, bullet or gem of the world by its handle.
+
+        Args:
+            handle (int): The handle of the entity.
+
+        Returns:
+            IMonster | IBullet | IExperienceGem | None: The entity, or None if it is not in
+                the world any more.
+        """
+
     @abstractmethod
     def update(self):
         """Updates the state of the world and all updatable entities within it."""
@@ -74,29 +115,74 @@ class IGameWorld(ABC):
 
     @property
     @abstractmethod
-    def monsters(self) -> list[IMonster]:
+    def monsters(self) -> Sequence[IMonster]:
         """Gets the list of monsters in the world.
 
         Returns:
-            list[IMonster]: A copy of the list of monsters in the world.
+            Sequence[IMonster]: A live read-only view of the monsters in the world.
         """
 
     @property
     @abstractmethod
-    def bullets(self) -> list[IBullet]:
+    def bullets(self) -> Sequence[IBullet]:
         """Gets the list of bullets in the world.
 
         Returns:
-            list[IBullet]: A copy of the list of bullets in the world.
+            Sequence[IBullet]: A live read-only view of the bullets in the world.
         """
 
     @property
     @abstractmethod
-    def experience_gems(self) -> list[IExperienceGem]:
+    def experience_gems(self) -> Sequence[IExperienceGem]:
         """Gets the list of experience gems in the world.
 
         Returns:
-            list[IExperienceGem]: A copy of the list of experience gems in the world.
+            Sequence[IExperienceGem]: A live read-only view of the experience gems in the world.
+        """
+
+    @property
+    @abstractmethod
+    def gems(self) -> "GemArray":
+        """Gets the store holding the position of the gems.
+
+        Returns:
+            GemArray: The experience gems of the world, as NumPy columns.
+        """
+
+    @property
+    @abstractmethod
+    def projectiles(self) -> "ProjectileArray":
+        """Gets the store the weapons emit their bullets into.
+
+        Returns:
+            ProjectileArray: The bullets of the world, as NumPy columns.
+        """
+
+    @property
+    @abstractmethod
+    def monster_budget(self) -> dict[str, int]:
+        """Gets the counters of the monsters kept out by settings.MAX_LIVE_MONSTERS.
+
+        Returns:
+            dict[str, int]: The number of spawns 'refused' and of monsters 'evicted' so far.
+        """
+
+    @property
+    @abstractmethod
+    def targeting(self) -> "TargetingService":
+        """Gets the service the weapons use to pick their targets.
+
+        Returns:
+            TargetingService: The targeting service, indexed over the monsters of the current tick.
+        """
+
+    @property
+    @abstractmethod
+    def crowd(self) -> "CrowdSeparation":
+        """Gets the neighbour index the monsters use to keep apart.
+
+        Returns:
+            CrowdSeparation: The crowd separation, indexed over the monsters of the current tick.
         """
 
     @property
@@ -146,6 +232,18 @@ class IMonsterSpawner(IUpdatable):
             world (IGameWorld): The game world in which to spawn the monster.
         """
 
+    @abstractmethod
+    def recycle(self, monster: IMonster):
+        """Takes back a monster removed from the world, to spawn it again later.
+
+        The monster is still in the store it was removed from, or waiting to be added from
+        the spawner's own store. It must be moved out of that store, straight into the
+        storage of the spawner.
+
+        Args:
+            monster (IMonster): The removed monster.
+        """
+
 
 class ITileMap(ABC):
     """Interface for a tile map.
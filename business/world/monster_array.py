@@ -0,0 +1,180 @@
+"""Module for the MonsterArray class."""
+
+import numpy as np
+import pygame
+
+import settings
+from business.world.column_store import ColumnStore
+
+MONSTER_ATTACK_COOLDOWN = 1000  # Milliseconds between two attacks of the same monster
+EVICTION_POLICIES = ("farthest", "weakest", "oldest")  # Policies MonsterArray.evictions can rank by
+RELOCATION_ATTEMPTS = 16  # Random points of the ring tried per relocated monster and tick
+
+# Name and type of each column of the store
+COLUMNS = {
+    "pos_x": np.float64,
+    "pos_y": np.float64,
+    "speed": np.float64,
+    "health": np.int64,
+    "max_health": np.int64,
+    "damage": np.int64,
+    "attack_range": np.int64,
+    "attack_ready_at": np.int64,
+    "level_multiplier": np.int64,
+    "facing": np.int8,  # 1 when the monster faces right, -1 when it faces left
+}
+
+
+class MonsterArray(ColumnStore):
+    """Column store holding the state of every monster of the world.
+
+    The Monster objects are thin views over their row, so the whole horde moves, dies and
+    attacks in a single vectorized step. Monsters that wander too far from the player are
+    moved back to a ring just outside the view, so every live monster keeps the pressure on.
+    """
+
+    COLUMNS = COLUMNS
+
+    def __init__(self, capacity: int = 64):
+        super().__init__(capacity)
+        # Monsters whose sprite is showing the damage tint, the only sprites that need an update
+        self.__damaged: set = set()
+
+    def remove(self, monster):
+        super().remove(monster)
+        self.__damaged.discard(monster)
+
+    def transfer(self, monster, store, values=None):
+        super().transfer(monster, store, values)
+        self.__damaged.discard(monster)
+
+    def mark_damaged(self, monster):
+        """Keeps a monster sprite updated until its damage tint fades."""
+        self.__damaged.add(monster)
+
+    @staticmethod
+    def relocation_radius() -> float:
+        """The distance to the center of the view at which the far monsters reappear.
+
+        Returns:
+            float: Half the diagonal of the screen plus settings.MONSTER_RELOCATION_MARGIN.
+        """
+        return np.hypot(settings.SCREEN_WIDTH, settings.SCREEN_HEIGHT) / 2 + settings.MONSTER_RELOCATION_MARGIN
+
+    @staticmethod
+    def view_center(player) -> tuple[float, float]:
+        """The center of the view following the player.
+
+        The camera stops scrolling at the edges of the world, so near them the player is not
+        in the middle of the view. This is the same clamp as Camera.update.
+
+        Args:
+            player (IPlayer): The player the camera follows.
+
+        Returns:
+            tuple[float, float]: The center of the view, in world coordinates.
+        """
+        left = max(0, min(int(player.pos_x) - settings.SCREEN_WIDTH // 2, settings.WORLD_WIDTH - settings.SCREEN_WIDTH))
+        top = max(0, min(int(player.pos_y) - settings.SCREEN_HEIGHT // 2, settings.WORLD_HEIGHT - settings.SCREEN_HEIGHT))
+        return left + settings.SCREEN_WIDTH / 2, top + settings.SCREEN_HEIGHT / 2
+
+    def __relocate(self, rows: np.ndarray, center_x: float, center_y: float):
+        """Moves monsters to random points of the ring just outside the view.
+
+        Only the points of the ring inside the world are kept. A monster for which none of
+        the tried points is, keeps its position until the next tick.
+        """
+        angle = np.random.uniform(0, 2 * np.pi, (len(rows), RELOCATION_ATTEMPTS))
+        radius = self.relocation_radius()
+        candidate_x = center_x + radius * np.cos(angle)
+        candidate_y = center_y + radius * np.sin(angle)
+        inside = (candidate_x >= 0) & (candidate_x <= settings.WORLD_WIDTH) & \
+            (candidate_y >= 0) & (candidate_y <= settings.WORLD_HEIGHT)
+
+        found = np.flatnonzero(inside.any(axis=1))
+        attempt = inside[found].argmax(axis=1)
+        self.column("pos_x")[rows[found]] = candidate_x[found, attempt]
+        self.column("pos_y")[rows[found]] = candidate_y[found, attempt]
+
+    def evictions(self, count: int, policy: str, player) -> list:
+        """Picks the monsters to evict when the world holds too many of them.
+
+        Args:
+            count (int): The number of monsters to evict.
+            policy (str): "farthest" from the player, "weakest" or "oldest" first.
+            player (IPlayer): The player, for the distances.
+
+        Returns:
+            list[IMonster]: The monsters to evict.
+
+        Raises:
+            ValueError: If the policy is unknown.
+        """
+        if policy == "farthest":
+            priority = -np.hypot(self.column("pos_x") - player.pos_x, self.column("pos_y") - player.pos_y)
+        elif policy == "weakest":
+            priority = self.column("health")
+        elif policy == "oldest":
+            # Handles grow with every spawn, recycled monsters included
+            priority = self.column("handle")
+        else:
+            raise ValueError(f"Unknown eviction policy: {policy}")
+
+        count = min(count, len(self))
+        if count <= 0:
+            return []
+        rows = np.argpartition(priority, count - 1)[:count]
+        return [self.view(row) for row in rows.tolist()]
+
+    def step(self, world):
+        """Moves every monster towards the player and resolves their deaths and attacks.
+
+        It does for the whole store what Monster.update does for a single monster.
+
+        Args:
+            world (IGameWorld): The game world.
+        """
+        if len(self) == 0:
+            return
+        columns = {name: self.column(name) for name in COLUMNS}
+        pos_x, pos_y = columns["pos_x"], columns["pos_y"]
+        player = world.player
+
+        direction_x = np.sign(player.pos_x - pos_x)
+        direction_y = np.sign(player.pos_y - pos_y)
+        # Monsters standing on the player do nothing this tick
+        active = (direction_x != 0) | (direction_y != 0)
+        # The monsters face the player rather than the crowd pushing them around
+        columns["facing"][direction_x != 0] = direction_x[direction_x != 0]
+
+        separation_x, separation_y = world.crowd.separation_forces(pos_x, pos_y)
+        direction_x += separation_x * settings.SEPARATION_WEIGHT
+        direction_y += separation_y * settings.SEPARATION_WEIGHT
+        magnitude = np.hypot(direction_x, direction_y)
+        scale = np.where(active & (magnitude > 0), columns["speed"] / np.where(magnitude > 0, magnitude, 1), 0)
+        pos_x += direction_x * scale
+        pos_y += direction_y * scale
+
+        dead = active & (columns["health"] <= 0)
+        now = pygame.time.get_ticks()
+        distance = np.hypot(pos_x - player.pos_x, pos_y - player.pos_y)
+        attacking = active & ~dead & (columns["attack_ready_at"] <= now) & (distance < columns["attack_range"])
+
+        for row in np.flatnonzero(attacking).tolist():
+            player.take_damage(int(columns["damage"][row]))
+        columns["attack_ready_at"][attacking] = now + MONSTER_ATTACK_COOLDOWN
+
+        if settings.MONSTER_LEASH_DISTANCE > 0:
+            center_x, center_y = self.view_center(player)
+            far = np.flatnonzero(~dead & (np.hypot(pos_x - center_x, pos_y - center_y) > settings.MONSTER_LEASH_DISTANCE))
+            if len(far) > 0:
+                self.__relocate(far, center_x, center_y)
+
+        for monster in list(self.__damaged):
+            monster.sprite.update()
+            if not monster.sprite.is_in_damage_countdown:
+                self.__damaged.discard(monster)
+
+        # Rows move when monsters are removed, so the views are collected first
+        for monster in [self.view(row) for row in np.flatnonzero(dead).tolist()]:
+            world.remove_monster(monster)
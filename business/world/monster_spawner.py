@@ -6,10 +6,9 @@ import settings
 # import pygame
 
 import settings
-from business.entities.monster import Monster
+from business.entities.interfaces import IMonster
 from business.world.interfaces import IGameWorld, IMonsterSpawner
 from business.handlers.cooldown_handler import CooldownHandler
-from presentation.sprite import ZombieSprite, SkeletonSprite, OrcSprite, WerewolfSprite
 from business.entities.monster_factory import MonsterFactory
 
 BASE_COOLDOWN = 800
@@ -33,22 +32,12 @@ class MonsterSpawner(IMonsterSpawner):
         pos_x = random.randint(0, settings.WORLD_WIDTH)
         pos_y = random.randint(0, settings.WORLD_HEIGHT)
         monster_type = random.randint(0, 3)
+        mob_type = ("zombie", "skeleton", "orc", "werewolf")[monster_type]
 
-        if monster_type == 0:
-            mob_type = "zombie"
-            sprite = ZombieSprite(pos_x, pos_y)
-            monster = self.__monster_factory.create_monster(pos_x, pos_y, sprite, mob_type)
-        if monster_type == 1:
-            mob_type = "skeleton"
-            sprite = SkeletonSprite(pos_x, pos_y)
-            monster = self.__monster_factory.create_monster(pos_x, pos_y, sprite, mob_type)
-        if monster_type == 2:
-            mob_type = "orc"
-            sprite = OrcSprite(pos_x, pos_y)
-            monster = self.__monster_factory.create_monster(pos_x, pos_y, sprite, mob_type)
-        if monster_type == 3:
-            mob_type = "werewolf"
-            sprite = WerewolfSprite(pos_x, pos_y)
-            monster = self.__monster_factory.create_monster(pos_x, pos_y, sprite, mob_type)
+        # Dead monsters of the same type are reused, with their sprites
+        monster = self.__monster_factory.spawn_monster(pos_x, pos_y, mob_type)
 
         world.add_monster(monster)
+
+    def recycle(self, monster: IMonster):
+        self.__monster_factory.recycle(monster)
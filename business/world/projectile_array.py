@@ -0,0 +1,101 @@
+"""Module for the ProjectileArray class."""
+
+import numpy as np
+
+import settings
+from business.world.column_store import ColumnStore
+
+# Name and type of each column of the store
+COLUMNS = {
+    "pos_x": np.float64,
+    "pos_y": np.float64,
+    "previous_pos_x": np.float64,
+    "previous_pos_y": np.float64,
+    "dir_x": np.float64,
+    "dir_y": np.float64,
+    "speed": np.float64,
+    "damage": np.int64,
+    "final_damage": np.int64,
+    "health": np.int64,
+    "lifetime": np.int64,
+}
+
+
+class ProjectileArray(ColumnStore):
+    """Column store holding the state of every bullet of the world.
+
+    The Bullet objects are thin views over their row. Weapons emit into the store and all
+    the bullets are advanced in a single vectorized step. Removed bullets are moved to a
+    pool, with their sprites, and emitted again instead of creating new ones.
+    """
+
+    COLUMNS = COLUMNS
+
+    def __init__(self, capacity: int = 64):
+        super().__init__(capacity)
+        self.__pool: ProjectileArray | None = None
+
+    def remove(self, entity):
+        if self.__pool is None:
+            self.__pool = ProjectileArray()
+        self.transfer(entity, self.__pool)
+
+    @property
+    def pooled(self) -> int:
+        """The number of removed bullets waiting to be emitted again."""
+        return 0 if self.__pool is None else len(self.__pool)
+
+    def emit(self, src_x: float, src_y: float, dir_x, dir_y, speed: float, damage: int = 5):
+        """Fires one bullet per direction from the same point.
+
+        Args:
+            src_x (float): The x-coordinate the bullets start from.
+            src_y (float): The y-coordinate the bullets start from.
+            dir_x (float | Sequence[float]): The x-coordinate of each direction. They do not
+                need to be normalized.
+            dir_y (float | Sequence[float]): The y-coordinate of each direction.
+            speed (float): The distance the bullets travel per tick.
+            damage (int): The base damage of the bullets, scaled by the player damage.
+        """
+        # Imported here, the bullet module imports this one
+        from business.entities.bullet import Bullet  # pylint: disable=import-outside-toplevel
+
+        pool = self.__pool
+        for bullet_dir_x, bullet_dir_y in zip(np.atleast_1d(dir_x).tolist(), np.atleast_1d(dir_y).tolist()):
+            dst_x, dst_y = src_x + bullet_dir_x, src_y + bullet_dir_y
+            if pool:
+                pool.transfer(pool.view(len(pool) - 1), self,
+                              Bullet.initial_values(src_x, src_y, dst_x, dst_y, speed, damage))
+            else:
+                Bullet(src_x, src_y, dst_x, dst_y, speed, damage, store=self)
+
+    def step(self, world):
+        """Moves every bullet along its direction.
+
+        It does for the whole store what Bullet.update does for a single bullet.
+
+        Args:
+            world (IGameWorld): The game world.
+        """
+        if len(self) == 0:
+            return
+        pos_x, pos_y = self.column("pos_x"), self.column("pos_y")
+        self.column("final_damage")[:] = self.column("damage") * world.player.damage_amount
+        self.column("previous_pos_x")[:] = pos_x
+        self.column("previous_pos_y")[:] = pos_y
+        pos_x += self.column("dir_x") * self.column("speed")
+        pos_y += self.column("dir_y") * self.column("speed")
+        self.column("lifetime")[:] -= 1
+
+    def finished(self) -> list:
+        """Returns the bullets that hit something, left the world or outlived their lifetime.
+
+        Returns:
+            list[IBullet]: The bullets to remove from the world.
+        """
+        pos_x, pos_y = self.column("pos_x"), self.column("pos_y")
+        finished = (
+            (self.column("health") <= 0) | (self.column("lifetime") <= 0) |
+            (pos_x < 0) | (pos_x > settings.WORLD_WIDTH) | (pos_y < 0) | (pos_y > settings.WORLD_HEIGHT)
+        )
+        return [self.view(row) for row in np.flatnonzero(finished).tolist()]
@@ -0,0 +1,133 @@
+"""Module for the TargetingService class."""
+
+import random
+from collections.abc import Sequence
+
+import settings
+from business.entities.interfaces import IMonster
+from business.handlers.spatial_hash import SpatialHashGrid
+
+
+class TargetingStrategy:
+    """Names of the strategies a weapon can use to pick its target."""
+
+    NEAREST = "nearest"
+    STRONGEST = "strongest"
+    LOWEST_HP = "lowest_hp"
+    RANDOM = "random"
+
+
+class TargetingService:
+    """Shared index over the monster positions used by the weapons to pick targets.
+
+    The world marks the index as stale once per tick and it is only rebuilt on the
+    first query of that tick, so ticks where no weapon is ready cost nothing.
+    """
+
+    def __init__(self, cell_size: int = settings.TARGETING_CELL_SIZE):
+        self.__grid = SpatialHashGrid(cell_size)
+        self.__monsters: list[IMonster] = []
+        self.__is_stale = True
+        self.__bounds = (0, 0, -1, -1)
+
+    def update(self, monsters: Sequence[IMonster]):
+        """Sets the monsters to index for the current tick.
+
+        Args:
+            monsters (Sequence[IMonster]): The monsters of the world.
+        """
+        self.__monsters = monsters
+        self.__is_stale = True
+
+    def __rebuild(self):
+        self.__grid.clear()
+        min_col = min_row = max_col = max_row = None
+        for monster in self.__monsters:
+            self.__grid.insert_point(monster, monster.pos_x, monster.pos_y)
+            col, row = self.__grid.cell_of(monster.pos_x, monster.pos_y)
+            if min_col is None:
+                min_col, min_row, max_col, max_row = col, row, col, row
+            else:
+                min_col, max_col = min(min_col, col), max(max_col, col)
+                min_row, max_row = min(min_row, row), max(max_row, row)
+
+        self.__bounds = (0, 0, -1, -1) if min_col is None else (min_col, min_row, max_col, max_row)
+        self.__is_stale = False
+
+    def __ring(self, col: int, row: int, radius: int):
+        """Yields the cells at a Chebyshev distance of exactly radius from a cell."""
+        if radius == 0:
+            yield self.__grid.query_cell(col, row)
+            return
+        for ring_col in range(col - radius, col + radius + 1):
+            yield self.__grid.query_cell(ring_col, row - radius)
+            yield self.__grid.query_cell(ring_col, row + radius)
+        for ring_row in range(row - radius + 1, row + radius):
+            yield self.__grid.query_cell(col - radius, ring_row)
+            yield self.__grid.query_cell(col + radius, ring_row)
+
+    def __nearest(self, pos_x: float, pos_y: float, max_range: float | None) -> IMonster | None:
+        col, row = self.__grid.cell_of(pos_x, pos_y)
+        min_col, min_row, max_col, max_row = self.__bounds
+        last_radius = max(col - min_col, max_col - col, row - min_row, max_row - row)
+        cell_size = self.__grid.cell_size
+
+        best, best_distance = None, float("inf") if max_range is None else max_range ** 2
+        for radius in range(last_radius + 1):
+            # Every monster outside the rings seen so far is at least radius cells away
+            if best is not None and best_distance <= (max(0, radius - 1) * cell_size) ** 2:
+                break
+            if max_range is not None and (radius - 1) * cell_size > max_range:
+                break
+            for cell in self.__ring(col, row, radius):
+                for monster in cell:
+                    distance = (monster.pos_x - pos_x) ** 2 + (monster.pos_y - pos_y) ** 2
+                    if distance < best_distance:
+                        best, best_distance = monster, distance
+        return best
+
+    def __in_range(self, pos_x: float, pos_y: float, max_range: float | None) -> list[IMonster]:
+        if max_range is None:
+            return list(self.__monsters)
+
+        first_col, first_row = self.__grid.cell_of(pos_x - max_range, pos_y - max_range)
+        last_col, last_row = self.__grid.cell_of(pos_x + max_range, pos_y + max_range)
+        found = []
+        for col in range(first_col, last_col + 1):
+            for row in range(first_row, last_row + 1):
+                for monster in self.__grid.query_cell(col, row):
+                    if (monster.pos_x - pos_x) ** 2 + (monster.pos_y - pos_y) ** 2 <= max_range ** 2:
+                        found.append(monster)
+        return found
+
+    def find_target(self, pos_x: float, pos_y: float, strategy: str = TargetingStrategy.NEAREST,
+                    max_range: float | None = None) -> IMonster | None:
+        """Picks a monster to shoot at.
+
+        Args:
+            pos_x (float): The x-coordinate of the shooter.
+            pos_y (float): The y-coordinate of the shooter.
+            strategy (str): One of the TargetingStrategy names.
+            max_range (float | None): The maximum distance to the target, None for no limit.
+
+        Returns:
+            IMonster | None: The chosen monster, or None if there is no monster in range.
+        """
+        if self.__is_stale:
+            self.__rebuild()
+        if not self.__monsters:
+            return None
+
+        if strategy == TargetingStrategy.NEAREST:
+            return self.__nearest(pos_x, pos_y, max_range)
+
+        candidates = self.__in_range(pos_x, pos_y, max_range)
+        if not candidates:
+            return None
+        if strategy == TargetingStrategy.STRONGEST:
+            return max(candidates, key=lambda monster: monster.health)
+        if strategy == TargetingStrategy.LOWEST_HP:
+            return min(candidates, key=lambda monster: monster.health)
+        if strategy == TargetingStrategy.RANDOM:
+            return random.choice(candidates)
+        raise ValueError(f"Unknown targeting strategy: {strategy}")
@@ -178,6 +178,7 @@ class Game:
                 self.__world.update()
                 CollisionHandler.handle_collisions(self.__world)
                 DeathHandler.check_deaths(self.__world)
+                self.__world.apply_pending_changes()
                 self.__display.render_frame()
 
                 self.__clock.tick(settings.FPS)
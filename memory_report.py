@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""Reports the memory used by each monster, bullet and gem of the world.
+
+Usage: python memory_report.py [count ...]
+
+The Python and NumPy allocations are measured with tracemalloc. The pixels of the pygame
+surfaces are allocated by SDL, out of reach of tracemalloc, so they are reported apart.
+"""
+import os
+import sys
+import tracemalloc
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+# pylint: disable=wrong-import-position
+import pygame
+
+from business.entities.experience_gem import ExperienceGem
+from business.entities.monster import Monster
+from business.world.gem_array import GemArray
+from business.world.monster_array import MonsterArray
+from business.world.projectile_array import ProjectileArray
+from presentation.sprite import ZombieSprite
+
+DEFAULT_COUNTS = (1000, 10000)
+
+
+def spawn_monsters(count):
+    """Fills a monster store like the world does"""
+    store = MonsterArray()
+    for i in range(count):
+        store.add(Monster(i, i, ZombieSprite(i, i), 10, 10, 1, 50, "zombie"))
+    return store
+
+
+def spawn_bullets(count):
+    """Fills a projectile store like the weapons do"""
+    store = ProjectileArray()
+    for i in range(count):
+        store.emit(i, i, 1, 0, 10)
+    return store
+
+
+def spawn_gems(count):
+    """Fills a gem store like the dying monsters do"""
+    store = GemArray()
+    for i in range(count):
+        store.add(ExperienceGem(i, i, 1))
+    return store
+
+
+def surface_bytes(store):
+    """Returns the pixel bytes of the distinct surfaces drawn by the entities of a store"""
+    surfaces = {}
+    for entity in store.views:
+        image = entity.sprite.image
+        surfaces[id(image)] = image.get_width() * image.get_height() * image.get_bytesize()
+    return sum(surfaces.values())
+
+
+def measure(spawn, count):
+    """Returns the Python bytes and the surface bytes per entity"""
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    store = spawn(count)
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+
+    python_bytes = sum(stat.size_diff for stat in after.compare_to(before, "filename"))
+    return python_bytes / count, surface_bytes(store) / count
+
+
+def main():
+    """Prints the memory report"""
+    pygame.init()  # pylint: disable=E1101
+    pygame.display.set_mode((1, 1))
+    counts = [int(count) for count in sys.argv[1:]] or DEFAULT_COUNTS
+
+    print(f"{'entity':<10}{'count':>8}{'python B/entity':>18}{'surface B/entity':>18}")
+    for name, spawn in (("monster", spawn_monsters), ("bullet", spawn_bullets), ("gem", spawn_gems)):
+        for count in counts:
+            python_bytes, pixel_bytes = measure(spawn, count)
+            print(f"{name:<10}{count:>8}{python_bytes:>18.0f}{pixel_bytes:>18.0f}")
+
+    pygame.quit()  # pylint: disable=E1101
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""Module for the Animation and AnimationClock classes."""
+
+import pygame
+
+
+class AnimationClock:
+    """The one clock every animation reads its current frame from.
+
+    It ticks once per rendered frame, so the sprites drawn in a frame all agree on the
+    time and none of them keeps a timer of its own.
+    """
+
+    __ticks = 0
+
+    @staticmethod
+    def tick():
+        """Moves the clock one rendered frame forward."""
+        AnimationClock.__ticks += 1
+
+    @staticmethod
+    def ticks() -> int:
+        """The rendered frames since the game started.
+
+        Returns:
+            int: The number of ticks.
+        """
+        return AnimationClock.__ticks
+
+
+class Animation:
+    """The frames of a sprite sheet, sliced and scaled once and shared by every sprite."""
+
+    def __init__(self, frames: list[pygame.Surface], frame_ticks: int):
+        self.__frames = frames
+        self.__frame_ticks = max(1, frame_ticks)
+
+    @property
+    def frames(self) -> list[pygame.Surface]:
+        """The frames of the animation.
+
+        Returns:
+            list[pygame.Surface]: The frames, in the order they are shown.
+        """
+        return self.__frames
+
+    def frame(self) -> pygame.Surface:
+        """Returns the frame to draw at the current tick of the animation clock.
+
+        Returns:
+            pygame.Surface: The shared frame.
+        """
+        return self.__frames[AnimationClock.ticks() // self.__frame_ticks % len(self.__frames)]
+
+    @staticmethod
+    def slice(sheet: pygame.Surface, columns: int, frame_ticks: int) -> "Animation":
+        """Cuts a sprite sheet laid out in one row into the frames of an animation.
+
+        Args:
+            sheet (pygame.Surface): The sheet, already scaled. The frames are subsurfaces of it.
+            columns (int): The number of frames in the row.
+            frame_ticks (int): The ticks each frame stays on screen.
+
+        Returns:
+            Animation: The animation.
+        """
+        width, height = sheet.get_width() // columns, sheet.get_height()
+        frames = [sheet.subsurface(pygame.Rect(column * width, 0, width, height)) for column in range(columns)]
+        return Animation(frames, frame_ticks)
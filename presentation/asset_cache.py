@@ -0,0 +1,140 @@
+"""Module for the AssetCache class."""
+
+from typing import Iterable
+
+import pygame
+
+import settings
+from presentation.animation import Animation
+from presentation.texture_atlas import TextureAtlas
+
+
+class AssetCache:
+    """Process-wide cache of the surfaces loaded from the asset files.
+
+    Each asset is read from disk once and each (path, size, alpha) is scaled once. Every
+    sprite of an asset then shares the same surface, so the cached surfaces must never be
+    drawn on: copy them first. The tinted variants of a surface are cached the same way.
+
+    The assets packed at startup are regions of a texture atlas instead of surfaces of
+    their own. The animations are sliced from those surfaces once, and flipped once.
+    """
+
+    __surfaces: dict[tuple, pygame.Surface] = {}
+    # Keyed by (surface, color), surfaces hash by identity
+    __tinted: dict[tuple, pygame.Surface] = {}
+    __atlas: TextureAtlas | None = None
+    __animations: dict[tuple, Animation] = {}
+
+    @staticmethod
+    def image(path: str, size: tuple[float, float] | None = None, alpha: bool = True) -> pygame.Surface:
+        """Returns the shared surface of an asset.
+
+        Args:
+            path (str): The path of the image file.
+            size (tuple[float, float] | None): The size to scale the image to, truncated to
+                whole pixels. None keeps the size of the file.
+            alpha (bool): If the surface is converted to the display format with per pixel
+                alpha, which needs the display to be initialized.
+
+        Returns:
+            pygame.Surface: The surface, shared with every other caller.
+        """
+        if size is not None:
+            size = (int(size[0]), int(size[1]))
+        key = (path, size, alpha)
+        surface = AssetCache.__surfaces.get(key)
+        if surface is None:
+            if size is None:
+                surface = pygame.image.load(path)
+                if alpha:
+                    surface = surface.convert_alpha()
+            else:
+                surface = pygame.transform.scale(AssetCache.image(path, None, alpha), size)
+            AssetCache.__surfaces[key] = surface
+        return surface
+
+    @staticmethod
+    def animation(path: str, frame_size: tuple[float, float], columns: int = 1,
+                  frame_ticks: int = settings.ANIMATION_FRAME_TICKS, flipped: bool = False) -> Animation:
+        """Returns the shared animation of a sprite sheet.
+
+        Args:
+            path (str): The path of the sheet, with its frames laid out in one row.
+            frame_size (tuple[float, float]): The size to scale each frame to.
+            columns (int): The number of frames in the sheet.
+            frame_ticks (int): The ticks of the animation clock each frame stays on screen.
+            flipped (bool): If the frames are mirrored horizontally.
+
+        Returns:
+            Animation: The animation, shared with every other caller.
+        """
+        width, height = int(frame_size[0]), int(frame_size[1])
+        key = (path, (width, height), columns, frame_ticks, flipped)
+        animation = AssetCache.__animations.get(key)
+        if animation is None:
+            if flipped:
+                frames = AssetCache.animation(path, frame_size, columns, frame_ticks).frames
+                animation = Animation([pygame.transform.flip(frame, True, False) for frame in frames], frame_ticks)
+            else:
+                sheet = AssetCache.image(path, (width * columns, height))
+                animation = Animation.slice(sheet, columns, frame_ticks)
+            AssetCache.__animations[key] = animation
+        return animation
+
+    @staticmethod
+    def pack(assets: Iterable[tuple[str, tuple[float, float]]], page_size: tuple[int, int] = settings.ATLAS_PAGE_SIZE):
+        """Loads and scales assets into a texture atlas.
+
+        The later calls to image for these assets return their regions of the atlas. Needs
+        the display to be initialized.
+
+        Args:
+            assets (Iterable[tuple[str, tuple[float, float]]]): The path and size of each asset.
+            page_size (tuple[int, int]): The size of the atlas pages.
+
+        Returns:
+            TextureAtlas: The atlas holding the assets.
+        """
+        if AssetCache.__atlas is None:
+            AssetCache.__atlas = TextureAtlas(page_size)
+        atlas = AssetCache.__atlas
+
+        images = {}
+        for path, size in assets:
+            key = (path, (int(size[0]), int(size[1])), True)
+            if key not in images:
+                images[key] = pygame.transform.scale(pygame.image.load(path).convert_alpha(), key[1])
+        for key, image in sorted(images.items(), key=lambda item: -item[1].get_height()):
+            AssetCache.__surfaces[key] = atlas.add(key, image)
+        return atlas
+
+    @staticmethod
+    def tinted(image: pygame.Surface, color: tuple[int, int, int]) -> pygame.Surface:
+        """Returns the shared copy of a surface multiplied by a color.
+
+        Black pixels of the tinted copy are transparent, like the damage flash always did.
+
+        Args:
+            image (pygame.Surface): The surface to tint, which is left untouched.
+            color (tuple[int, int, int]): The color to multiply the pixels by.
+
+        Returns:
+            pygame.Surface: The tinted surface, shared with every other caller.
+        """
+        key = (image, color)
+        surface = AssetCache.__tinted.get(key)
+        if surface is None:
+            surface = image.copy()
+            surface.fill(color, special_flags=pygame.BLEND_MULT)  # pylint: disable=E1101
+            surface.set_colorkey((0, 0, 0))
+            AssetCache.__tinted[key] = surface
+        return surface
+
+    @staticmethod
+    def clear():
+        """Drops every cached surface, for instance after the display mode changes."""
+        AssetCache.__surfaces.clear()
+        AssetCache.__tinted.clear()
+        AssetCache.__atlas = None
+        AssetCache.__animations.clear()
@@ -1,6 +1,7 @@
 """ Module that contains representation of buttons in the pause menu. """
 import pygame
 import settings
+from presentation.asset_cache import AssetCache
 
 
 class Button():
@@ -61,6 +62,8 @@ class Container:
 class ItemCard:
     """Clase que representa una tarjeta de ítem con imagen, nombre y descripción."""
 
+    IMAGE_SIZE = (50, 50)
+
     def __init__(self, x, y, width, height, item_name, description, image_path, is_new=False):
         self.x = x
         self.y = y
@@ -71,10 +74,8 @@ class ItemCard:
         self.image_path = image_path
         self.is_new = is_new
 
-        # Cargar la imagen del ítem
-        self.image = pygame.image.load(image_path)
-        # Redimensionar la imagen si es necesario
-        self.image = pygame.transform.scale(self.image, (50, 50))
+        # La imagen del ítem, compartida y ya redimensionada
+        self.image = AssetCache.image(image_path, ItemCard.IMAGE_SIZE)
 
         # Definir las fuentes
         self.font_name = pygame.font.Font(None, 36)
@@ -1,15 +1,23 @@
 """Module for displaying the game world."""
 
+import numpy as np
 import pygame
 import settings
 from business.world.game_world import GameWorld
 from presentation.camera import Camera
 from presentation.interfaces import IDisplay
+from presentation.animation import AnimationClock
+from presentation.asset_cache import AssetCache
+from presentation.sprite import ASSET_SPRITES, BulletSprite
 from presentation.tileset import Tileset
 from business.entities.interfaces import IMonster
 from business.entities.weapons import PistolWeapon, ShotgunWeapon, MinigunWeapon
+from business.entities.items import DictionaryClass
 from presentation.design_elements import *
 
+LOCK_ICON = "./assets/items/gun/candado.png"
+INVENTORY_SLOT_SIZE = (64, 64)
+
 
 class Display(IDisplay):
     """Class for displaying the game world."""
@@ -27,6 +35,7 @@ class Display(IDisplay):
         self.__ground_tileset = self.__load_ground_tileset()
         self.__world: GameWorld = None  # type: ignore
         self.weapons = self.__initialize_weapons()
+        self.__pack_assets()
 
     def __initialize_weapons(self):
         """Load and return the available weapons."""
@@ -36,6 +45,14 @@ class Display(IDisplay):
             MinigunWeapon()
         ]
 
+    def __pack_assets(self):
+        """Packs the entity and item art into the texture atlas, at the size it is drawn."""
+        assets = [(sprite.ASSET, (sprite.SIZE[0] * sprite.COLUMNS, sprite.SIZE[1])) for sprite in ASSET_SPRITES]
+        assets += [(weapon.image_path, INVENTORY_SLOT_SIZE) for weapon in self.weapons]
+        assets.append((LOCK_ICON, INVENTORY_SLOT_SIZE))
+        assets += [(item.image_path, ItemCard.IMAGE_SIZE) for item in DictionaryClass().items_dict.values()]
+        AssetCache.pack(assets)
+
     def __load_ground_tileset(self):
         return Tileset(
             "./assets/ground_tileset.png", settings.TILE_WIDTH, settings.TILE_HEIGHT, 1, 1
@@ -88,17 +105,13 @@ class Display(IDisplay):
 
     def __draw_inventory_slots(self, player_level):
         # Define el tamaño y la posición de los slots de inventario
-        slot_width = 64
-        slot_height = 64
+        slot_width, slot_height = INVENTORY_SLOT_SIZE
         padding = 10
         start_x = (settings.SCREEN_WIDTH - (3 * slot_width + 2 * padding)) // 2
         y_position = settings.SCREEN_HEIGHT - slot_height - 100
 
-        # Cargar el icono de bloqueo una vez y escalarlo
-        lock_icon_path = "assets/items/gun/candado.png"
-        lock_icon = pygame.image.load(lock_icon_path).convert_alpha()
-        lock_icon = pygame.transform.scale(
-            lock_icon, (slot_width, slot_height))
+        # El icono de bloqueo ya está escalado en el atlas
+        lock_icon = AssetCache.image(LOCK_ICON, INVENTORY_SLOT_SIZE)
 
         for i in range(len(self.weapons)):  # Iterar según la cantidad de armas
             x_position = start_x + i * (slot_width + padding)
@@ -110,9 +123,8 @@ class Display(IDisplay):
 
             # Verificar si el arma tiene el atributo 'required_level
             if player_level >= self.weapons[i].required_level:
-                # Escalar la imagen del arma para ajustarse al tamaño del slot
-                image = pygame.transform.scale(
-                    self.weapons[i].image_path, (slot_width, slot_height))
+                # La imagen del arma ya está escalada al tamaño del slot
+                image = AssetCache.image(self.weapons[i].image_path, INVENTORY_SLOT_SIZE)
                 # Dibujar la imagen del arma en el slot
                 self.__screen.blit(image, slot_rect.topleft)
             else:
@@ -182,18 +194,41 @@ class Display(IDisplay):
     def load_world(self, world: GameWorld):
         self.__world = world
 
+    def __draw_bullets(self):
+        # Every bullet shares the same image, so they are culled and blitted from the projectile columns
+        projectiles = self.__world.projectiles
+        image = BulletSprite.shared_image()
+        width, height = image.get_size()
+        left = projectiles.column("pos_x").astype(int) - width // 2 - self.camera.camera_rect.left
+        top = projectiles.column("pos_y").astype(int) - height // 2 - self.camera.camera_rect.top
+        visible = (left < settings.SCREEN_WIDTH) & (left + width > 0) & \
+            (top < settings.SCREEN_HEIGHT) & (top + height > 0)
+        self.__screen.blits(
+            [(image, position) for position in zip(left[visible].tolist(), top[visible].tolist())],
+            doreturn=False,
+        )
+
     def render_frame(self):
+        # Every animated sprite of this frame reads the same tick
+        AnimationClock.tick()
+
         # Update the camera to follow the player
         self.camera.update(self.__world.player.sprite.rect)
 
         # Render the ground tiles
         self.__render_ground_tiles()
 
-        # Draw all the experience gems
-        for gem in self.__world.experience_gems:
-            if self.camera.camera_rect.colliderect(gem.sprite.rect):
-                adjusted_rect = self.camera.apply(gem.sprite.rect)
-                self.__screen.blit(gem.sprite.image, adjusted_rect)
+        # Draw the experience gems on screen, culled from the gem columns
+        gems = self.__world.gems
+        camera_rect = self.camera.camera_rect
+        left = gems.column("pos_x").astype(int) - gems.column("width") // 2
+        top = gems.column("pos_y").astype(int) - gems.column("height") // 2
+        visible = (left < camera_rect.right) & (camera_rect.left < left + gems.column("width")) & \
+            (top < camera_rect.bottom) & (camera_rect.top < top + gems.column("height"))
+        for row in np.flatnonzero(visible).tolist():
+            gem = gems.view(row)
+            adjusted_rect = self.camera.apply(gem.sprite.rect)
+            self.__screen.blit(gem.sprite.image, adjusted_rect)
 
         # Draw all monsters
         for monster in self.__world.monsters:
@@ -203,10 +238,7 @@ class Display(IDisplay):
                 self.__screen.blit(monster.sprite.image, adjusted_rect)
 
         # Draw the bullets
-        for bullet in self.__world.bullets:
-            if self.camera.camera_rect.colliderect(bullet.sprite.rect):
-                adjusted_rect = self.camera.apply(bullet.sprite.rect)
-                self.__screen.blit(bullet.sprite.image, adjusted_rect)
+        self.__draw_bullets()
 
         # Draw the player
         self.__draw_player()
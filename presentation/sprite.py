@@ -3,12 +3,17 @@
 import pygame
 
 import settings
+from presentation.asset_cache import AssetCache
 from presentation.tileset import Tileset
 
 
 class Sprite(pygame.sprite.Sprite):
     """A class representing a sprite."""
 
+    # Collision masks shared by every sprite drawing the same image, keyed by that image
+    __masks: dict[tuple, pygame.mask.Mask] = {}
+    DAMAGE_COLOR = (255, 0, 0)
+
     def __init__(self, image: pygame.Surface, image_path, rect: pygame.Rect, *groups):
         self._image: pygame.Surface = image
         self._image_path = image_path
@@ -36,6 +41,31 @@ class Sprite(pygame.sprite.Sprite):
         """
         return self._rect
 
+    @property
+    def mask(self) -> pygame.mask.Mask:
+        """The collision mask of the sprite.
+
+        The mask is built from the untinted image once per asset and shared by all
+        the sprites of that asset, so the damage tint never changes it.
+
+        Returns:
+            pygame.mask.Mask: The mask of the opaque pixels of the sprite.
+        """
+        image = self._mask_image()
+        mask = Sprite.__masks.get(image)
+        if mask is None:
+            mask = pygame.mask.from_surface(image)
+            Sprite.__masks[image] = mask
+        return mask
+
+    def _mask_image(self) -> pygame.Surface:
+        """The image the collision mask is built from.
+
+        Returns:
+            pygame.Surface: The original image of the sprite.
+        """
+        return self.__original_image
+
     def update_pos(self, pos_x: float, pos_y: float):
         """Update the position of the sprite.
 
@@ -45,14 +75,22 @@ class Sprite(pygame.sprite.Sprite):
         """
         self._rect.center = (int(pos_x), int(pos_y))
 
+    def face(self, direction_x: float):
+        """Turns the sprite towards the direction it moves in.
+
+        Sprites without a mirrored image always face the same way.
+
+        Args:
+            direction_x (float): The horizontal direction, 0 keeps the current facing.
+        """
+
     def __restore_image(self):
-        self._image = self.__original_image.copy()
+        # The original image is shared with the other sprites of the asset and never drawn on
+        self._image = self.__original_image
 
     def __change_color(self, color: tuple[int, int, int]):
-        self._image = self.__original_image.copy()  # Make a copy of the original image
-        # Change color pylint: disable=E1101
-        self._image.fill(color, special_flags=pygame.BLEND_MULT)
-        self._image.set_colorkey((0, 0, 0))  # Set transparency if necessary
+        # The tinted image is computed once per image and color, and shared
+        self._image = AssetCache.tinted(self.__original_image, color)
 
     def __decrease_damage_countdown(self):
         self.__is_in_damage_countdown -= 1
@@ -60,9 +98,23 @@ class Sprite(pygame.sprite.Sprite):
             self.__is_in_damage_countdown = 0
             self.__restore_image()
 
+    @property
+    def is_in_damage_countdown(self) -> bool:
+        """If the sprite is still showing the damage tint.
+
+        Returns:
+            bool: True until the tint fades.
+        """
+        return self.__is_in_damage_countdown > 0
+
+    def reset(self):
+        """Drops the damage tint, for a sprite reused by a new entity."""
+        self._image = self.__original_image
+        self.__is_in_damage_countdown = 0
+
     def take_damage(self):
         """Take damage."""
-        self.__change_color((255, 0, 0))
+        self.__change_color(Sprite.DAMAGE_COLOR)
         self.__is_in_damage_countdown = 30
 
     def update(self, *args, **kwargs):
@@ -88,212 +140,186 @@ class Sprite(pygame.sprite.Sprite):
         }
 
 
-class PlayerSprite(Sprite):
+class AssetSprite(Sprite):
+    """A sprite animated from a sprite sheet, each frame scaled to the SIZE of its class.
+
+    The frames are shared by every sprite of the class and picked from the global animation
+    clock, so drawing an animated sprite costs an index lookup. A sheet of one column is a
+    still image. The sheets face right, the mirrored frames are used when moving left.
+    """
+
+    ASSET: str
+    SIZE: tuple[float, float]
+    COLUMNS = 1  # Frames of the sheet, laid out in one row
+
+    def __init__(self, pos_x: float, pos_y: float):
+        self.__animations = (
+            AssetCache.animation(self.ASSET, self.SIZE, self.COLUMNS),
+            AssetCache.animation(self.ASSET, self.SIZE, self.COLUMNS, flipped=True),
+        )
+        self.__facing_left = False
+        image: pygame.Surface = self.__animations[0].frames[0]
+        rect: pygame.Rect = image.get_rect(center=(int(pos_x), int(pos_y)))
+        super().__init__(image, self.ASSET, rect)
+
+    @property
+    def image(self) -> pygame.Surface:
+        """The current frame of the sprite, tinted while it shows the damage.
+
+        Returns:
+            pygame.Surface: The shared frame.
+        """
+        frame = self.__animations[self.__facing_left].frame()
+        if self.is_in_damage_countdown:
+            return AssetCache.tinted(frame, Sprite.DAMAGE_COLOR)
+        return frame
+
+    def face(self, direction_x: float):
+        if direction_x != 0:
+            self.__facing_left = direction_x < 0
+
+    def _mask_image(self) -> pygame.Surface:
+        return self.__animations[self.__facing_left].frames[0]
+
+    def reset(self):
+        super().reset()
+        self.__facing_left = False
+
+
+class PlayerSprite(AssetSprite):
     """A class representing the player sprite."""
 
     ASSET_IDLE = "./assets/entities/player/player.png"
+    ASSET = ASSET_IDLE
+    SIZE = settings.TILE_DIMENSION
 
     TILE_WIDTH = 64
     TILE_HEIGHT = 64
     IDLE_COLUMNS = 4
     RUN_COLUMNS = 6
-
-    def __init__(self, pos_x: float, pos_y: float):
-        image: pygame.Surface = pygame.image.load(
-            PlayerSprite.ASSET_IDLE).convert_alpha()
-        image = pygame.transform.scale(image, settings.TILE_DIMENSION)
-        rect: pygame.Rect = image.get_rect(center=(int(pos_x), int(pos_y)))
-
-        super().__init__(image, PlayerSprite.ASSET_IDLE, rect)
+    # The shipped player.png is a single 15x18 frame, not the IDLE_COLUMNS sheet
+    COLUMNS = 1
 
 
-class ZombieSprite(Sprite):
+class ZombieSprite(AssetSprite):
     """A class representing the zombie sprite."""
 
     ASSET = "./assets/entities/monsters/zombie/zombie.png"
     TILE_WIDTH = 20
     TILE_HEIGHT = 26
     SIZE_MULTIPLIER = 4
-
-    def __init__(self, pos_x: float, pos_y: float):
-        image: pygame.Surface = pygame.image.load(
-            ZombieSprite.ASSET).convert_alpha()
-        image = pygame.transform.scale(
-            image, (ZombieSprite.TILE_WIDTH * ZombieSprite.SIZE_MULTIPLIER, ZombieSprite.TILE_HEIGHT * ZombieSprite.SIZE_MULTIPLIER))
-        rect: pygame.Rect = image.get_rect(center=(int(pos_x), int(pos_y)))
-
-        super().__init__(image, ZombieSprite.ASSET, rect)
+    SIZE = (TILE_WIDTH * SIZE_MULTIPLIER, TILE_HEIGHT * SIZE_MULTIPLIER)
 
 
-class SkeletonSprite(Sprite):
+class SkeletonSprite(AssetSprite):
     """A class representing the skeleton sprite."""
 
     ASSET = "./assets/entities/monsters/skeleton/skeleton.png"
     TILE_WIDTH = 22
     TILE_HEIGHT = 32
     SIZE_MULTIPLIER = 4
-
-    def __init__(self, pos_x: float, pos_y: float):
-        image: pygame.Surface = pygame.image.load(
-            SkeletonSprite.ASSET).convert_alpha()
-        image = pygame.transform.scale(image, (SkeletonSprite.TILE_WIDTH * SkeletonSprite.SIZE_MULTIPLIER,
-                                       SkeletonSprite.TILE_HEIGHT * SkeletonSprite.SIZE_MULTIPLIER))
-        rect: pygame.Rect = image.get_rect(center=(int(pos_x), int(pos_y)))
-        super().__init__(image, SkeletonSprite.ASSET, rect)
+    SIZE = (TILE_WIDTH * SIZE_MULTIPLIER, TILE_HEIGHT * SIZE_MULTIPLIER)
 
 
-class OrcSprite(Sprite):
+class OrcSprite(AssetSprite):
     """A class representing the orc sprite."""
 
     ASSET = "./assets/entities/monsters/orc/orc.png"
     TILE_WIDTH = 22
     TILE_HEIGHT = 16
     SIZE_MULTIPLIER = 5
-
-    def __init__(self, pos_x: float, pos_y: float):
-        image: pygame.Surface = pygame.image.load(
-            OrcSprite.ASSET).convert_alpha()
-        image = pygame.transform.scale(
-            image, (OrcSprite.TILE_WIDTH * OrcSprite.SIZE_MULTIPLIER, OrcSprite.TILE_HEIGHT * OrcSprite.SIZE_MULTIPLIER))
-        rect: pygame.Rect = image.get_rect(center=(int(pos_x), int(pos_y)))
-        super().__init__(image, OrcSprite.ASSET, rect)
+    SIZE = (TILE_WIDTH * SIZE_MULTIPLIER, TILE_HEIGHT * SIZE_MULTIPLIER)
 
 
-class WerewolfSprite(Sprite):
+class WerewolfSprite(AssetSprite):
     """A class representing the werewolf sprite."""
 
     ASSET = "./assets/entities/monsters/werewolf/werewolf.png"
     TILE_WIDTH = 36
     TILE_HEIGHT = 32
     SIZE_MULTIPLIER = 3
-
-    def __init__(self, pos_x: float, pos_y: float):
-        image: pygame.Surface = pygame.image.load(
-            WerewolfSprite.ASSET).convert_alpha()
-        image = pygame.transform.scale(image, (WerewolfSprite.TILE_WIDTH * WerewolfSprite.SIZE_MULTIPLIER,
-                                       WerewolfSprite.TILE_HEIGHT * WerewolfSprite.SIZE_MULTIPLIER))
-        rect: pygame.Rect = image.get_rect(center=(int(pos_x), int(pos_y)))
-        super().__init__(image, WerewolfSprite.ASSET, rect)
+    SIZE = (TILE_WIDTH * SIZE_MULTIPLIER, TILE_HEIGHT * SIZE_MULTIPLIER)
 
 
 class BulletSprite(Sprite):
     """A class representing the bullet sprite."""
 
+    # Drawn once and shared by every bullet
+    __image: pygame.Surface | None = None
+
     def __init__(self, pos_x: float, pos_y: float):
-        image = pygame.Surface(
-            (5, 5), pygame.SRCALPHA)  # pylint: disable=E1101
-        pygame.draw.circle(image, (255, 255, 0), (2, 2), 5)
+        image = BulletSprite.shared_image()
         rect: pygame.Rect = image.get_rect(center=(int(pos_x), int(pos_y)))
 
         super().__init__(image, None, rect)
 
+    @staticmethod
+    def shared_image() -> pygame.Surface:
+        """The image every bullet is drawn with.
+
+        Returns:
+            pygame.Surface: The bullet image.
+        """
+        if BulletSprite.__image is None:
+            image = pygame.Surface(
+                (5, 5), pygame.SRCALPHA)  # pylint: disable=E1101
+            pygame.draw.circle(image, (255, 255, 0), (2, 2), 5)
+            BulletSprite.__image = image
+        return BulletSprite.__image
+
 
-class ExperienceGemSprite(Sprite):
+class ExperienceGemSprite(AssetSprite):
     """A class representing the experience gem sprite."""
 
     ASSET = "./assets/items/gems/experience_gem.png"
     TILE_WIDTH = 64
     TILE_HEIGHT = 64
     SIZE_MULTIPLIER = 0.75
+    SIZE = (TILE_WIDTH * SIZE_MULTIPLIER, TILE_HEIGHT * SIZE_MULTIPLIER)
 
-    def __init__(self, pos_x: float, pos_y: float):
-        image: pygame.Surface = pygame.image.load(
-            ExperienceGemSprite.ASSET).convert_alpha()
-        image = pygame.transform.scale(image, (ExperienceGemSprite.TILE_WIDTH * ExperienceGemSprite.SIZE_MULTIPLIER,
-                                       ExperienceGemSprite.TILE_HEIGHT * ExperienceGemSprite.SIZE_MULTIPLIER))
-        rect: pygame.Rect = image.get_rect(center=(int(pos_x), int(pos_y)))
-        super().__init__(image, ExperienceGemSprite.ASSET, rect)
 
-
-class HealthGemSprite(Sprite):
+class HealthGemSprite(AssetSprite):
     """A class representing the health gem sprite."""
 
     ASSET = "./assets/items/gems/health_gem.png"
     TILE_WIDTH = 64
     TILE_HEIGHT = 64
     SIZE_MULTIPLIER = 0.75
-
-    def __init__(self, pos_x: float, pos_y: float):
-        image: pygame.Surface = pygame.image.load(
-            HealthGemSprite.ASSET).convert_alpha()
-        image = pygame.transform.scale(
-            image,
-            (
-                int(HealthGemSprite.TILE_WIDTH *
-                    HealthGemSprite.SIZE_MULTIPLIER),
-                int(HealthGemSprite.TILE_HEIGHT *
-                    HealthGemSprite.SIZE_MULTIPLIER)
-            )
-        )
-        rect: pygame.Rect = image.get_rect(center=(int(pos_x), int(pos_y)))
-        super().__init__(image, SpeedGemSprite.ASSET, rect)
+    SIZE = (TILE_WIDTH * SIZE_MULTIPLIER, TILE_HEIGHT * SIZE_MULTIPLIER)
 
 
-class SpeedGemSprite(Sprite):
+class SpeedGemSprite(AssetSprite):
     """A class representing the speed gem sprite."""
 
     ASSET = "./assets/items/gems/speed_gem.png"
     TILE_WIDTH = 64
     TILE_HEIGHT = 64
     SIZE_MULTIPLIER = 0.75
-
-    def __init__(self, pos_x: float, pos_y: float):
-        image: pygame.Surface = pygame.image.load(
-            SpeedGemSprite.ASSET).convert_alpha()
-        image = pygame.transform.scale(
-            image,
-            (
-                int(SpeedGemSprite.TILE_WIDTH * SpeedGemSprite.SIZE_MULTIPLIER),
-                int(SpeedGemSprite.TILE_HEIGHT * SpeedGemSprite.SIZE_MULTIPLIER)
-            )
-        )
-        rect: pygame.Rect = image.get_rect(center=(int(pos_x), int(pos_y)))
-        super().__init__(image, SpeedGemSprite.ASSET, rect)
+    SIZE = (TILE_WIDTH * SIZE_MULTIPLIER, TILE_HEIGHT * SIZE_MULTIPLIER)
 
 
-class DamageGemSprite(Sprite):
+class DamageGemSprite(AssetSprite):
     """A class representing the damage gem sprite."""
 
     ASSET = "./assets/items/gems/damage_gem.png"
     TILE_WIDTH = 64
     TILE_HEIGHT = 64
     SIZE_MULTIPLIER = 0.75
-
-    def __init__(self, pos_x: float, pos_y: float):
-        image: pygame.Surface = pygame.image.load(
-            DamageGemSprite.ASSET).convert_alpha()
-        image = pygame.transform.scale(
-            image,
-            (
-                int(DamageGemSprite.TILE_WIDTH *
-                    DamageGemSprite.SIZE_MULTIPLIER),
-                int(DamageGemSprite.TILE_HEIGHT *
-                    DamageGemSprite.SIZE_MULTIPLIER)
-            )
-        )
-        rect: pygame.Rect = image.get_rect(center=(int(pos_x), int(pos_y)))
-        super().__init__(image, DamageGemSprite.ASSET, rect)
+    SIZE = (TILE_WIDTH * SIZE_MULTIPLIER, TILE_HEIGHT * SIZE_MULTIPLIER)
 
 
-class DefenceGemSprite(Sprite):
+class DefenceGemSprite(AssetSprite):
     """A class representing the defence gem sprite."""
 
     ASSET = "./assets/items/gems/defence_gem.png"
     TILE_WIDTH = 64
     TILE_HEIGHT = 64
     SIZE_MULTIPLIER = 0.75
+    SIZE = (TILE_WIDTH * SIZE_MULTIPLIER, TILE_HEIGHT * SIZE_MULTIPLIER)
 
-    def __init__(self, pos_x: float, pos_y: float):
-        image: pygame.Surface = pygame.image.load(
-            DefenceGemSprite.ASSET).convert_alpha()
-        image = pygame.transform.scale(
-            image,
-            (
-                int(DefenceGemSprite.TILE_WIDTH *
-                    DefenceGemSprite.SIZE_MULTIPLIER),
-                int(DefenceGemSprite.TILE_HEIGHT *
-                    DefenceGemSprite.SIZE_MULTIPLIER)
-            )
-        )
-        rect: pygame.Rect = image.get_rect(center=(int(pos_x), int(pos_y)))
-        super().__init__(image, DefenceGemSprite.ASSET, rect)
+
+# The sprites whose image is packed into the texture atlas at startup
+ASSET_SPRITES = (
+    PlayerSprite, ZombieSprite, SkeletonSprite, OrcSprite, WerewolfSprite,
+    ExperienceGemSprite, HealthGemSprite, SpeedGemSprite, DamageGemSprite, DefenceGemSprite,
+)
@@ -0,0 +1,84 @@
+"""Module for the TextureAtlas class."""
+
+import pygame
+
+
+class TextureAtlas:
+    """Packs many small images into a few large surfaces.
+
+    The images are laid out on shelves: rows of images filled left to right, a new row
+    opening under the tallest image of the previous one and a new page when the page is
+    full. Each image is then a subsurface of its page, so every sprite drawn from the atlas
+    blits from the same few source surfaces.
+    """
+
+    def __init__(self, page_size: tuple[int, int]):
+        self.__page_size = page_size
+        self.__pages: list[pygame.Surface] = []
+        self.__regions: dict = {}
+        # Top left corner of the next image and height of the current shelf
+        self.__cursor_x = 0
+        self.__cursor_y = 0
+        self.__shelf_height = 0
+
+    @property
+    def pages(self) -> list[pygame.Surface]:
+        """The surfaces holding the packed images.
+
+        Returns:
+            list[pygame.Surface]: The pages, in the order they were opened.
+        """
+        return self.__pages
+
+    def region(self, key) -> pygame.Surface | None:
+        """Returns the region of a packed image.
+
+        Args:
+            key (Hashable): The key the image was packed with.
+
+        Returns:
+            pygame.Surface | None: The subsurface of the page, None if the key is not packed.
+        """
+        return self.__regions.get(key)
+
+    def add(self, key, image: pygame.Surface) -> pygame.Surface:
+        """Copies an image into the atlas.
+
+        Packing the images from the tallest to the shortest wastes the least room.
+
+        Args:
+            key (Hashable): The key to find the image with.
+            image (pygame.Surface): The image, with per pixel alpha.
+
+        Returns:
+            pygame.Surface: The subsurface of the page holding the image.
+
+        Raises:
+            ValueError: If the image does not fit in a page.
+        """
+        region = self.__regions.get(key)
+        if region is not None:
+            return region
+
+        width, height = image.get_size()
+        page_width, page_height = self.__page_size
+        if width > page_width or height > page_height:
+            raise ValueError(f"A {width}x{height} image does not fit in a {page_width}x{page_height} atlas page")
+
+        if self.__cursor_x + width > page_width:
+            self.__cursor_x, self.__cursor_y = 0, self.__cursor_y + self.__shelf_height
+            self.__shelf_height = 0
+        if not self.__pages or self.__cursor_y + height > page_height:
+            self.__pages.append(pygame.Surface(self.__page_size, pygame.SRCALPHA))  # pylint: disable=E1101
+            self.__cursor_x, self.__cursor_y, self.__shelf_height = 0, 0, 0
+
+        rect = pygame.Rect(self.__cursor_x, self.__cursor_y, width, height)
+        page = self.__pages[-1]
+        # The page is fully transparent, so the max of both copies the pixels without blending
+        page.blit(image, rect, special_flags=pygame.BLEND_RGBA_MAX)  # pylint: disable=E1101
+        region = page.subsurface(rect)
+
+        self.__cursor_x += width
+        self.__shelf_height = max(self.__shelf_height, height)
+        self.__regions[key] = region
+        return region
@@ -22,6 +22,41 @@ WORLD_WIDTH = WORLD_COLUMNS * TILE_WIDTH
 WORLD_HEIGHT = WORLD_ROWS * TILE_HEIGHT
 WORLD_DIMENSION = (WORLD_WIDTH, WORLD_HEIGHT)
 
+# Collisions
+COLLISION_BACKEND = "grid"  # "grid" (spatial hash), "numpy" (vectorized AABB kernel) or "parallel"
+COLLISION_CELL_SIZE = TILE_WIDTH  # Side of a spatial hash cell, in pixels
+PIXEL_PERFECT_COLLISIONS = True  # Confirm rect hits against the sprite masks
+COLLISION_WORKERS = 0  # Worker processes of the "parallel" backend, 0 for one per core
+PARALLEL_COLLISION_MIN_ENTITIES = 4000  # Below this many boxes a test stays in the main process
+
+# Projectiles
+BULLET_LIFETIME = 5 * FPS  # Ticks a bullet flies before it is removed
+
+# Gems
+PLAYER_PICKUP_RADIUS = 100  # Distance under which gems are pulled towards the player, in pixels
+GEM_MAGNET_SPEED = 8  # Distance a pulled gem travels per tick
+GEM_CAP = 400  # Gems in the world above which nearby experience gems are merged
+GEM_MERGE_CELL_SIZE = 64  # Side of the cells whose experience gems merge, doubled until the cap holds
+GEM_BUFF_LIFETIME = 30 * FPS  # Ticks before an uncollected buff gem disappears, 0 to keep them
+
+# Targeting
+TARGETING_CELL_SIZE = 2 * TILE_WIDTH  # Side of a cell of the monster index used by the weapons
+
+# Crowds
+SEPARATION_RADIUS = 70  # Distance under which monsters push each other away, in pixels
+SEPARATION_MAX_NEIGHBOURS = 6  # Neighbours considered per monster and tick
+SEPARATION_WEIGHT = 3  # Weight of the separation force against the pull towards the player
+MONSTER_LEASH_DISTANCE = SCREEN_WIDTH  # Distance to the player beyond which a monster is moved back, 0 to never move them
+MONSTER_RELOCATION_MARGIN = TILE_WIDTH  # How far outside the view the moved monsters reappear, in pixels
+
+# Monster budget
+MAX_LIVE_MONSTERS = 600  # Monsters alive at once, past it the spawns are refused or evict other monsters
+MONSTER_EVICTION_POLICY = "farthest"  # "farthest", "weakest", "oldest" or "refuse" to drop the new spawns
+
+# Assets
+ATLAS_PAGE_SIZE = (1024, 1024)  # Size of the texture atlas surfaces the entity and item art is packed into
+ANIMATION_FRAME_TICKS = 8  # Rendered frames each frame of a sprite sheet animation stays on screen
+
 # Colors
 BG_COLOR = (0, 0, 0)  # Black
 GRID_COLOR = (150, 150, 150)  # Grey
@@ -0,0 +1,62 @@
+import unittest
+from unittest.mock import patch
+
+import pygame
+
+from presentation.animation import Animation, AnimationClock
+from presentation.asset_cache import AssetCache
+
+
+def make_sheet(colors, width=4, height=3):
+    sheet = pygame.Surface((width * len(colors), height))
+    for column, color in enumerate(colors):
+        sheet.fill(color, pygame.Rect(column * width, 0, width, height))
+    return sheet
+
+
+class TestAnimation(unittest.TestCase):
+    def setUp(self):
+        AssetCache.clear()
+        self.addCleanup(AssetCache.clear)
+
+    def test_sheet_is_sliced_into_frames(self):
+        """Test that each column of the sheet becomes a frame of the animation."""
+        colors = [(255, 0, 0), (0, 255, 0), (0, 0, 255)]
+
+        animation = Animation.slice(make_sheet(colors), columns=3, frame_ticks=1)
+
+        self.assertEqual([frame.get_size() for frame in animation.frames], [(4, 3)] * 3)
+        self.assertEqual([tuple(frame.get_at((0, 0)))[:3] for frame in animation.frames], colors)
+
+    def test_frames_follow_the_global_clock(self):
+        """Test that every animation shows the frame of the current clock tick."""
+        animation = Animation(["a", "b", "c"], frame_ticks=2)
+
+        with patch.object(AnimationClock, "ticks", side_effect=[0, 1, 2, 5, 6]):
+            shown = [animation.frame() for _ in range(5)]
+
+        self.assertEqual(shown, ["a", "a", "b", "c", "a"])
+
+    def test_animations_are_shared(self):
+        """Test that a sheet is sliced once for all the sprites asking for it."""
+        with patch.object(AssetCache, "image", return_value=make_sheet([(255, 0, 0), (0, 255, 0)])) as image:
+            first = AssetCache.animation("sheet.png", (4.0, 3.0), columns=2)
+            second = AssetCache.animation("sheet.png", (4, 3), columns=2)
+
+        self.assertIs(first, second)
+        image.assert_called_once_with("sheet.png", (8, 3))
+
+    def test_flipped_frames_are_mirrored_once(self):
+        """Test that the mirrored animation is built once from the frames of the sheet."""
+        sheet = make_sheet([(255, 0, 0)])
+        sheet.fill((0, 0, 255), pygame.Rect(0, 0, 1, 3))
+        with patch.object(AssetCache, "image", return_value=sheet):
+            flipped = AssetCache.animation("sheet.png", (4, 3), flipped=True)
+
+            self.assertIs(AssetCache.animation("sheet.png", (4, 3), flipped=True), flipped)
+            self.assertIsNot(AssetCache.animation("sheet.png", (4, 3)), flipped)
+        self.assertEqual(tuple(flipped.frames[0].get_at((3, 0)))[:3], (0, 0, 255))
+
+
+if __name__ == "__main__":
+    unittest.main()
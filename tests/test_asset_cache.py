@@ -0,0 +1,43 @@
+import os
+import unittest
+from unittest.mock import patch
+
+import pygame
+
+from presentation.asset_cache import AssetCache
+
+ASSET = os.path.join(os.path.dirname(__file__), "..", "assets", "items", "gems", "experience_gem.png")
+
+
+class TestAssetCache(unittest.TestCase):
+    def setUp(self):
+        AssetCache.clear()
+        self.addCleanup(AssetCache.clear)
+
+    def test_each_asset_is_loaded_once(self):
+        """Test that every caller shares the surface, and that the file is only read once."""
+        with patch("pygame.image.load", wraps=pygame.image.load) as load:
+            first = AssetCache.image(ASSET, (48, 48), alpha=False)
+            second = AssetCache.image(ASSET, (48.0, 48.0), alpha=False)
+            bigger = AssetCache.image(ASSET, (96, 96), alpha=False)
+
+        self.assertIs(first, second)
+        self.assertEqual(first.get_size(), (48, 48))
+        self.assertEqual(bigger.get_size(), (96, 96))
+        load.assert_called_once()
+
+    def test_tinted_variants_are_shared(self):
+        """Test that a tint is computed once per surface and color, leaving the original intact."""
+        image = pygame.Surface((2, 2))
+        image.fill((200, 100, 50))
+
+        red = AssetCache.tinted(image, (255, 0, 0))
+
+        self.assertIs(AssetCache.tinted(image, (255, 0, 0)), red)
+        self.assertIsNot(AssetCache.tinted(image, (0, 255, 0)), red)
+        self.assertEqual(tuple(red.get_at((0, 0)))[:3], (200, 0, 0))
+        self.assertEqual(tuple(image.get_at((0, 0)))[:3], (200, 100, 50))
+
+
+if __name__ == "__main__":
+    unittest.main()
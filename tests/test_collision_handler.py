@@ -0,0 +1,129 @@
+import unittest
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+import pygame
+
+from business.entities.bullet import Bullet
+from business.entities.monster import Monster
+from business.handlers.collision_handler import CollisionHandler
+from business.handlers.collision_layers import CollisionLayer, CollisionLayers
+from business.handlers.parallel_collision import ParallelCollisionKernel
+from presentation.sprite import Sprite
+
+
+class FakePlayer:
+    def __init__(self, pos_x, pos_y):
+        image = pygame.Surface((40, 40))
+        self.sprite = Sprite(image, None, image.get_rect(center=(pos_x, pos_y)))
+        self.damage_taken = []
+
+    def take_damage(self, amount):
+        self.damage_taken.append(amount)
+
+
+class FakeMonsterProjectile(FakePlayer):
+    damage_amount = 1
+
+    def __init__(self, pos_x, pos_y):
+        super().__init__(pos_x, pos_y)
+        self.pos_x = self.previous_pos_x = pos_x
+        self.pos_y = self.previous_pos_y = pos_y
+
+
+class InertBullet(Bullet):
+    pass
+
+
+CollisionLayers.register(InertBullet, CollisionLayer.PLAYER_PROJECTILE, CollisionLayer.NONE)
+CollisionLayers.register(FakePlayer, CollisionLayer.PLAYER, CollisionLayer.MONSTER | CollisionLayer.MONSTER_PROJECTILE)
+CollisionLayers.register(FakeMonsterProjectile, CollisionLayer.MONSTER_PROJECTILE, CollisionLayer.PLAYER)
+
+
+def make_monster(pos_x, pos_y, health=10):
+    image = pygame.Surface((30, 30))
+    return Monster(pos_x, pos_y, Sprite(image, None, image.get_rect(center=(pos_x, pos_y))),
+                   health, health, 1, 50, "zombie")
+
+
+def make_bullet(pos_x, pos_y, previous_x=None, previous_y=None, bullet_type=Bullet):
+    bullet = bullet_type(pos_x, pos_y, pos_x + 1, pos_y, 5)
+    bullet.store.column("previous_pos_x")[bullet.row] = pos_x if previous_x is None else previous_x
+    bullet.store.column("previous_pos_y")[bullet.row] = pos_y if previous_y is None else previous_y
+    bullet.store.column("final_damage")[bullet.row] = 2
+    return bullet
+
+
+def make_world(player, monsters=(), bullets=(), pending=()):
+    world = MagicMock()
+    world.player, world.monsters, world.bullets = player, list(monsters), list(bullets)
+    world.is_pending_removal = lambda entity: entity in pending
+    return world
+
+
+def make_scene(seed):
+    """A crowd of monsters around the player, crossed by bullets that moved this tick"""
+    rng = np.random.default_rng(seed)
+    player = FakePlayer(500, 500)
+    monsters = [make_monster(x, y) for x, y in rng.uniform(300, 700, (80, 2)).round()]
+    bullets = [make_bullet(x, y, x - dx, y - dy)
+               for (x, y), (dx, dy) in zip(rng.uniform(300, 700, (200, 2)), rng.uniform(-40, 40, (200, 2)))]
+    return make_world(player, monsters, bullets)
+
+
+@patch("settings.COLLISION_BACKEND", "grid")
+class TestCollisionHandler(unittest.TestCase):
+    def test_layers_outside_the_masks_are_never_tested(self):
+        """Test that overlapping entities whose masks exclude each other take no hits."""
+        player = FakePlayer(900, 900)
+        monsters = [make_monster(100, 100), make_monster(100, 100)]
+        # The monster projectile and a bullet masking out the monsters sit on the monsters,
+        # and a player bullet sits on the player
+        player_bullet, inert_bullet = make_bullet(900, 900), make_bullet(100, 100, bullet_type=InertBullet)
+        world = make_world(player, monsters, [player_bullet, inert_bullet, FakeMonsterProjectile(100, 100)])
+
+        CollisionHandler.handle_collisions(world)
+
+        self.assertEqual([monster.health for monster in monsters], [10, 10])
+        self.assertEqual((player.damage_taken, player_bullet.health, inert_bullet.health), ([], 1, 1))
+
+    def test_pending_removals_take_no_hits(self):
+        """Test that an entity removed earlier in the tick is neither hit nor hits."""
+        player = FakePlayer(900, 900)
+        dead, alive = make_monster(100, 100), make_monster(400, 400)
+        spent = make_bullet(400, 400)
+        world = make_world(player, [dead, alive], [make_bullet(100, 100), spent], pending=[spent])
+
+        CollisionHandler.handle_collisions(world)
+
+        self.assertEqual(dead.health, 8)
+        self.assertEqual((alive.health, spent.health), (10, 1))
+
+        dead_world = make_world(player, [dead], [make_bullet(100, 100)], pending=[dead])
+        CollisionHandler.handle_collisions(dead_world)
+        self.assertEqual(dead.health, 8)
+
+    @patch("settings.COLLISION_WORKERS", 2)
+    @patch("settings.PARALLEL_COLLISION_MIN_ENTITIES", 0)
+    def test_backends_apply_the_same_responses(self):
+        """Test that the grid, numpy and parallel backends leave the same world behind."""
+        self.addCleanup(ParallelCollisionKernel.shutdown)
+        outcomes = []
+        for backend in ("grid", "numpy", "parallel"):
+            world = make_scene(seed=11)
+            with patch("settings.COLLISION_BACKEND", backend):
+                CollisionHandler.handle_collisions(world)
+            outcomes.append((
+                [monster.health for monster in world.monsters],
+                [bullet.health for bullet in world.bullets],
+                sorted(world.player.damage_taken),
+            ))
+
+        self.assertLess(sum(outcomes[0][1]), 200)
+        self.assertGreater(len(outcomes[0][2]), 0)
+        self.assertEqual(outcomes[1], outcomes[0])
+        self.assertEqual(outcomes[2], outcomes[0])
+
+
+if __name__ == "__main__":
+    unittest.main()
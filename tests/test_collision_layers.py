@@ -0,0 +1,34 @@
+import unittest
+
+from business.handlers.collision_layers import CollisionLayer, CollisionLayers
+
+
+class Projectile:
+    pass
+
+
+class PiercingProjectile(Projectile):
+    pass
+
+
+class TestCollisionLayers(unittest.TestCase):
+    def setUp(self):
+        CollisionLayers.register(Projectile, CollisionLayer.MONSTER_PROJECTILE, CollisionLayer.PLAYER)
+
+    def test_registered_type(self):
+        """Test that a registered type reports its layer and mask."""
+        self.assertEqual(CollisionLayers.layer_of(Projectile()), CollisionLayer.MONSTER_PROJECTILE)
+        self.assertEqual(CollisionLayers.mask_of(Projectile()), CollisionLayer.PLAYER)
+
+    def test_subclass_inherits_registration(self):
+        """Test that subclasses use the layer and mask of their registered base class."""
+        self.assertEqual(CollisionLayers.layer_of(PiercingProjectile()), CollisionLayer.MONSTER_PROJECTILE)
+
+    def test_unregistered_type_never_collides(self):
+        """Test that entities of unknown types live in no layer."""
+        self.assertEqual(CollisionLayers.layer_of(object()), CollisionLayer.NONE)
+        self.assertEqual(CollisionLayers.mask_of(object()), CollisionLayer.NONE)
+
+
+if __name__ == '__main__':
+    unittest.main()
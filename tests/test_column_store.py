@@ -0,0 +1,70 @@
+import unittest
+
+import numpy as np
+
+from business.entities.bullet import Bullet
+from business.entities.experience_gem import ExperienceGem
+from business.entities.monster import Monster
+from business.world.column_store import VIEW_SLOTS, ColumnStore, ColumnView
+
+
+class PointStore(ColumnStore):
+    COLUMNS = {"pos_x": np.float64, "pos_y": np.float64}
+
+
+class Point(ColumnView):
+    __slots__ = VIEW_SLOTS
+
+    def __init__(self, pos_x):
+        PointStore(1).add(self, {"pos_x": pos_x, "pos_y": 0})
+
+
+class TestColumnStore(unittest.TestCase):
+    def setUp(self):
+        self.store = PointStore(capacity=2)
+        self.points = [Point(i) for i in range(4)]
+        for point in self.points:
+            self.store.add(point)
+
+    def test_handles_survive_swap_remove(self):
+        """Test that the entities keep their handle when rows move or leave the store."""
+        handles = [point.handle for point in self.points]
+
+        self.store.remove(self.points[0])
+
+        self.assertEqual([point.handle for point in self.points], handles)
+        self.assertEqual(len(set(handles)), 4)
+        self.assertIs(self.store.find(handles[3]), self.points[3])
+        self.assertEqual(self.points[3].row, 0)
+        self.assertIsNone(self.store.find(handles[0]))
+
+    def test_remove_twice_raises(self):
+        """Test that removing an entity that is not in the store leaves the store untouched."""
+        self.store.remove(self.points[1])
+
+        with self.assertRaises(ValueError):
+            self.store.remove(self.points[1])
+        self.assertEqual(self.store.column("pos_x").tolist(), [0, 3, 2])
+
+    def test_views_are_live_and_survive_removal_while_iterating(self):
+        """Test that the views are not copied and visit every entity when the visited one is removed."""
+        views = self.store.views
+        visited = []
+        for point in views:
+            visited.append(point)
+            if point in (self.points[0], self.points[2]):
+                self.store.remove(point)
+
+        self.assertIs(self.store.views, views)
+        self.assertEqual(sorted(visited, key=lambda point: point.handle), self.points)
+        self.assertEqual(list(views), [self.points[3], self.points[1]])
+
+    def test_entity_views_keep_no_state_of_their_own(self):
+        """Test that the views proxy the position and speed instead of holding slots for them."""
+        for view_type in (Monster, Bullet, ExperienceGem):
+            slots = {slot for cls in view_type.__mro__ for slot in getattr(cls, "__slots__", ())}
+            self.assertFalse(slots & {"_pos_x", "_pos_y", "_speed"}, view_type)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,65 @@
+import unittest
+from unittest.mock import MagicMock
+
+import numpy as np
+
+from business.world.crowd import CrowdSeparation
+
+
+def make_monster(pos_x, pos_y):
+    monster = MagicMock()
+    monster.pos_x = pos_x
+    monster.pos_y = pos_y
+    return monster
+
+
+class TestCrowdSeparation(unittest.TestCase):
+    def setUp(self):
+        self.crowd = CrowdSeparation(radius=50, max_neighbours=4)
+
+    def test_lonely_monster_is_not_pushed(self):
+        """Test that a monster without neighbours in the radius gets no force."""
+        monster = make_monster(0, 0)
+        self.crowd.update([monster, make_monster(200, 0)])
+
+        self.assertEqual(self.crowd.separation_force(monster), (0.0, 0.0))
+
+    def test_neighbours_push_away(self):
+        """Test that a close neighbour pushes the monster in the opposite direction."""
+        monster = make_monster(0, 0)
+        self.crowd.update([monster, make_monster(10, 0)])
+
+        force_x, force_y = self.crowd.separation_force(monster)
+        self.assertLess(force_x, 0)
+        self.assertAlmostEqual(force_y, 0)
+
+    def test_stacked_monsters_split_apart(self):
+        """Test that two monsters on the same spot are pushed in opposite directions."""
+        a_monster, another_monster = make_monster(5, 5), make_monster(5, 5)
+        self.crowd.update([a_monster, another_monster])
+
+        a_force = self.crowd.separation_force(a_monster)
+        another_force = self.crowd.separation_force(another_monster)
+        self.assertNotEqual(a_force, (0.0, 0.0))
+        self.assertAlmostEqual(a_force[0], -another_force[0])
+        self.assertAlmostEqual(a_force[1], -another_force[1])
+
+    def test_vectorized_forces_match_in_dense_crowds(self):
+        """Test that the neighbour caps give the same forces on both paths in a dense crowd."""
+        rng = np.random.default_rng(4)
+        # Distinct points of a 3 pixel lattice, so no monsters are stacked
+        lattice = np.array([(x, y) for x in range(0, 150, 3) for y in range(0, 150, 3)], dtype=float)
+        pos_x, pos_y = lattice[rng.permutation(len(lattice))[:400]].T
+        monsters = [make_monster(x, y) for x, y in zip(pos_x, pos_y)]
+        self.crowd.update(monsters)
+
+        force_x, force_y = self.crowd.separation_forces(pos_x, pos_y)
+
+        for monster, expected_x, expected_y in zip(monsters, force_x, force_y):
+            actual_x, actual_y = self.crowd.separation_force(monster)
+            self.assertAlmostEqual(actual_x, expected_x)
+            self.assertAlmostEqual(actual_y, expected_y)
+
+
+if __name__ == "__main__":
+    unittest.main()
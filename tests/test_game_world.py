@@ -0,0 +1,148 @@
+import unittest
+from unittest.mock import MagicMock, patch
+
+from business.entities.monster import Monster
+from business.entities.monster_factory import MonsterFactory
+from business.world.game_world import GameWorld
+from business.world.monster_array import MonsterArray
+
+
+def make_monster(pos_x, pos_y):
+    return Monster(pos_x, pos_y, MagicMock(), 10, 10, 1, 50, "zombie")
+
+
+def make_spawner(factory=None):
+    """A spawner whose recycle moves the monsters to the free lists of a factory"""
+    spawner = MagicMock()
+    spawner.recycle.side_effect = (factory or MonsterFactory()).recycle
+    return spawner
+
+
+class TestGameWorldPendingChanges(unittest.TestCase):
+    def setUp(self):
+        # No gem drops, the gems load their sprites
+        patcher = patch("business.world.game_world.random.uniform", return_value=0)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self.factory = MonsterFactory()
+        self.world = GameWorld(make_spawner(self.factory), MagicMock(), MagicMock())
+        self.monster = make_monster(10, 10)
+        self.world.add_monster(self.monster)
+        self.world.apply_pending_changes()
+
+    def test_changes_wait_for_the_end_of_the_tick(self):
+        """Test that additions and removals are only visible once applied."""
+        newcomer = make_monster(20, 20)
+        self.world.add_monster(newcomer)
+        self.world.remove_monster(self.monster)
+
+        self.assertEqual(list(self.world.monsters), [self.monster])
+        self.assertTrue(self.world.is_pending_removal(self.monster))
+
+        self.world.apply_pending_changes()
+
+        self.assertEqual(list(self.world.monsters), [newcomer])
+        self.assertFalse(self.world.is_pending_removal(self.monster))
+
+    @patch("business.world.game_world.random.uniform", return_value=50)
+    @patch("business.world.game_world.ExperienceGem")
+    @patch.object(GameWorld, "add_experience_gem")
+    def test_double_removal_is_applied_once(self, add_experience_gem, *_):
+        """Test that removing a monster twice in a tick removes it and drops its gem once."""
+        self.world.remove_monster(self.monster)
+        self.world.remove_monster(self.monster)
+        self.world.apply_pending_changes()
+
+        self.assertEqual(len(self.world.monsters), 0)
+        add_experience_gem.assert_called_once()
+
+    def test_recycling_builds_no_store(self):
+        """Test that dead monsters go straight to the free list and come back without new stores."""
+        monsters = [self.monster] + [make_monster(i, 0) for i in range(4)]
+        for monster in monsters[1:]:
+            self.world.add_monster(monster)
+        self.world.apply_pending_changes()
+
+        with patch.object(MonsterArray, "__init__", autospec=True, side_effect=MonsterArray.__init__) as init:
+            for _ in range(3):
+                for monster in monsters:
+                    self.world.remove_monster(monster)
+                self.world.apply_pending_changes()
+                for _ in monsters:
+                    self.world.add_monster(self.factory.spawn_monster(0, 0, "zombie"))
+                self.world.apply_pending_changes()
+
+        # Only the free list of the type is created, on the first death
+        self.assertEqual(init.call_count, 1)
+        self.assertEqual(len(self.world.monsters), 5)
+
+    def test_clear_recycles_the_monsters(self):
+        """Test that clearing the world hands back the live monsters and the pending spawns."""
+        self.world.remove_monster(self.monster)
+        self.world.apply_pending_changes()
+        self.world.add_monster(make_monster(20, 20))
+        self.world.add_monster(self.factory.spawn_monster(0, 0, "zombie"))
+
+        self.world.clear_all_entities()
+
+        self.assertEqual(self.factory.pooled("zombie"), 2)
+        self.assertEqual(len(self.world.monsters), 0)
+
+
+class TestGameWorldMonsterBudget(unittest.TestCase):
+    def setUp(self):
+        self.spawner = make_spawner()
+        self.world = GameWorld(self.spawner, MagicMock(), MagicMock())
+        self.world.player.pos_x, self.world.player.pos_y = 0, 0
+
+    @patch("settings.MAX_LIVE_MONSTERS", 2)
+    @patch("settings.MONSTER_EVICTION_POLICY", "farthest")
+    def test_farthest_monsters_are_evicted(self):
+        """Test that the monsters past the budget are evicted, farthest first, and recycled."""
+        monsters = [make_monster(distance, 0) for distance in (300, 100, 900, 200)]
+        for monster in monsters:
+            self.world.add_monster(monster)
+        self.world.apply_pending_changes()
+
+        self.assertEqual(sorted(monster.pos_x for monster in self.world.monsters), [100, 200])
+        self.assertEqual(self.world.monster_budget, {'refused': 0, 'evicted': 2})
+        self.assertEqual(self.spawner.recycle.call_count, 2)
+
+    @patch("settings.MAX_LIVE_MONSTERS", 2)
+    @patch("settings.MONSTER_EVICTION_POLICY", "refuse")
+    def test_spawns_past_the_budget_are_refused(self):
+        """Test that the refuse policy drops the new spawns, even before they are applied."""
+        monsters = [make_monster(i, 0) for i in range(3)]
+        for monster in monsters:
+            self.world.add_monster(monster)
+        self.world.apply_pending_changes()
+
+        self.assertEqual(list(self.world.monsters), monsters[:2])
+        self.assertEqual(self.world.monster_budget, {'refused': 1, 'evicted': 0})
+        self.spawner.recycle.assert_called_once_with(monsters[2])
+
+    @patch("settings.MONSTER_EVICTION_POLICY", "refuse")
+    def test_lowered_budget_keeps_the_live_monsters_under_refuse(self):
+        """Test that lowering the budget under the refuse policy evicts nothing and refuses new spawns."""
+        monsters = [make_monster(i, 0) for i in range(3)]
+        for monster in monsters:
+            self.world.add_monster(monster)
+        self.world.apply_pending_changes()
+
+        with patch("settings.MAX_LIVE_MONSTERS", 1):
+            self.world.apply_pending_changes()
+            self.world.add_monster(make_monster(5, 0))
+
+        self.assertEqual(list(self.world.monsters), monsters)
+        self.assertEqual(self.world.monster_budget, {'refused': 1, 'evicted': 0})
+
+    @patch("settings.MONSTER_EVICTION_POLICY", "newest")
+    def test_unknown_policy_is_rejected_at_startup(self):
+        """Test that the world refuses an unknown eviction policy when it is created."""
+        with self.assertRaises(ValueError):
+            GameWorld(self.spawner, MagicMock(), MagicMock())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,106 @@
+import unittest
+from unittest.mock import MagicMock, patch
+
+import pygame
+
+import settings
+from business.entities.experience_gem import Gem
+from business.world.gem_array import GemArray
+
+
+class PlainGem(Gem):
+    def __str__(self):
+        return f"PlainGem(pos=({self.pos_x}, {self.pos_y}))"
+
+
+def make_gem(pos_x, pos_y, amount=1, mergeable=True, lifetime=0):
+    sprite = MagicMock()
+    sprite.rect = pygame.Rect(0, 0, 10, 10)
+    return PlainGem(pos_x, pos_y, sprite, amount, mergeable, lifetime)
+
+
+def make_player(pos_x, pos_y, pickup_radius=100):
+    player = MagicMock()
+    player.pos_x, player.pos_y = pos_x, pos_y
+    player.pickup_radius = pickup_radius
+    player.sprite.rect = pygame.Rect(0, 0, 20, 20)
+    player.sprite.rect.center = (pos_x, pos_y)
+    return player
+
+
+class TestGemArray(unittest.TestCase):
+    def setUp(self):
+        self.store = GemArray(capacity=2)
+
+    def test_gems_in_radius_are_pulled(self):
+        """Test that a gem inside the pickup radius moves towards the player."""
+        gem = make_gem(100, 60)
+        self.store.add(gem)
+
+        self.store.step(make_player(100, 0))
+
+        self.assertEqual((gem.pos_x, gem.pos_y), (100, 60 - settings.GEM_MAGNET_SPEED))
+
+    def test_gems_out_of_radius_stay(self):
+        """Test that a gem outside the pickup radius does not move."""
+        gem = make_gem(500, 500)
+        self.store.add(gem)
+
+        self.assertEqual(self.store.step(make_player(0, 0)), [])
+        self.assertEqual((gem.pos_x, gem.pos_y), (500, 500))
+
+    def test_touching_gems_are_collected(self):
+        """Test that the gems overlapping the player are returned, like colliderect would."""
+        touching, edge, far = make_gem(114, 100), make_gem(115, 100), make_gem(900, 900)
+        for gem in (touching, edge, far):
+            self.store.add(gem)
+        player = make_player(100, 100, pickup_radius=0)
+
+        collected = self.store.step(player)
+
+        # The player rect ends at x=110: the gem at 115 spans [110, 120) and only touches the edge
+        self.assertEqual(collected, [touching])
+
+    def test_merge_keeps_the_experience(self):
+        """Test that merged gems fold into one gem per cell with the sum of their amounts."""
+        left = [make_gem(10, 10, 1), make_gem(20, 20, 2), make_gem(30, 10, 3)]
+        right = [make_gem(500, 500, 4), make_gem(510, 500, 5)]
+        buff = make_gem(15, 15, 7, mergeable=False)
+        for gem in left + right + [buff]:
+            self.store.add(gem)
+
+        folded = self.store.merge(cap=3, cell_size=64)
+
+        self.assertEqual(folded, left[1:] + right[1:])
+        self.assertEqual((left[0].amount, right[0].amount, buff.amount), (6, 9, 7))
+
+    def test_merge_grows_the_cells_until_the_cap_holds(self):
+        """Test that gems too far apart for the first cells are merged in a later pass."""
+        gems = [make_gem(i * 100, 0, 1) for i in range(8)]
+        for gem in gems:
+            self.store.add(gem)
+
+        folded = self.store.merge(cap=2, cell_size=64)
+
+        kept = [gem for gem in gems if gem not in folded]
+        self.assertLessEqual(len(kept), 2)
+        self.assertEqual(sum(gem.amount for gem in kept), 8)
+
+    def test_expired_gems(self):
+        """Test that only the gems with a lifetime expire, once the world ticked that long."""
+        lasting, fading = make_gem(0, 0), make_gem(0, 0, mergeable=False, lifetime=2)
+        self.store.add(lasting)
+        self.store.add(fading)
+        player = make_player(900, 900)
+
+        # No tick passes while the game is paused, however long the pause
+        with patch("pygame.time.get_ticks", return_value=10 ** 9):
+            self.assertEqual(self.store.expired(), [])
+        self.store.step(player)
+        self.assertEqual(self.store.expired(), [])
+        self.store.step(player)
+        self.assertEqual(self.store.expired(), [fading])
+
+
+if __name__ == "__main__":
+    unittest.main()
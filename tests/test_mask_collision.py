@@ -0,0 +1,63 @@
+import unittest
+from unittest.mock import MagicMock
+
+import pygame
+
+from business.handlers.mask_collision import MaskCollision
+from presentation.sprite import BulletSprite, Sprite
+
+
+def make_target(left, top):
+    """A 40x40 target whose left half is transparent."""
+    image = pygame.Surface((40, 40), pygame.SRCALPHA)
+    image.fill((255, 255, 255, 255), pygame.Rect(20, 0, 20, 40))
+    target = MagicMock()
+    target.sprite = Sprite(image, f"test-target-{left}-{top}", image.get_rect(topleft=(left, top)))
+    return target
+
+
+def make_bullet(previous_x, previous_y, pos_x, pos_y):
+    bullet = MagicMock()
+    bullet.previous_pos_x, bullet.previous_pos_y = previous_x, previous_y
+    bullet.pos_x, bullet.pos_y = pos_x, pos_y
+    bullet.sprite = BulletSprite(pos_x, pos_y)
+    return bullet
+
+
+class TestMaskCollision(unittest.TestCase):
+    def test_transparent_area_does_not_hit(self):
+        """Test that a bullet resting on the transparent half of a target misses it."""
+        target = make_target(100, 100)
+        bullet = make_bullet(105, 120, 105, 120)
+
+        self.assertTrue(bullet.sprite.rect.colliderect(target.sprite.rect))
+        self.assertFalse(MaskCollision.bullet_hits(bullet, target))
+
+    def test_opaque_area_hits(self):
+        """Test that a bullet resting on the opaque half of a target hits it."""
+        target = make_target(100, 100)
+        bullet = make_bullet(130, 120, 130, 120)
+
+        self.assertTrue(MaskCollision.bullet_hits(bullet, target))
+
+    def test_tunnelling_bullet_hits_opaque_pixels(self):
+        """Test that a bullet crossing the whole target in one move still hits it."""
+        target = make_target(100, 100)
+        bullet = make_bullet(50, 120, 200, 120)
+
+        self.assertTrue(MaskCollision.bullet_hits(bullet, target))
+
+    def test_masks_overlap(self):
+        """Test the mask overlap of two entities at their current positions."""
+        target = make_target(100, 100)
+
+        self.assertFalse(MaskCollision.masks_overlap(target, make_bullet(105, 120, 105, 120)))
+        self.assertTrue(MaskCollision.masks_overlap(target, make_bullet(125, 120, 125, 120)))
+
+    def test_masks_are_shared_per_asset(self):
+        """Test that sprites of the same asset share a single mask."""
+        self.assertIs(BulletSprite(0, 0).mask, BulletSprite(50, 50).mask)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,148 @@
+import unittest
+from unittest.mock import MagicMock
+
+import numpy as np
+import pygame
+
+import settings
+
+from business.entities.monster import Monster
+from business.world.crowd import CrowdSeparation
+from business.world.monster_array import MonsterArray
+
+
+def make_monster(pos_x, pos_y, health=10, attack_range=50):
+    return Monster(pos_x, pos_y, MagicMock(), health, health, 1, attack_range, "zombie")
+
+
+def make_world(player_x, player_y):
+    world = MagicMock()
+    world.player.pos_x = player_x
+    world.player.pos_y = player_y
+    world.crowd = CrowdSeparation(radius=50, max_neighbours=4)
+    return world
+
+
+class TestMonsterArray(unittest.TestCase):
+    def setUp(self):
+        self.store = MonsterArray(capacity=2)
+
+    def test_views_read_and_write_their_row(self):
+        """Test that a monster added to the store keeps its state and writes through to the columns."""
+        monster = make_monster(10, 20, health=7)
+        self.store.add(monster)
+
+        monster.take_damage(3)
+
+        self.assertEqual((monster.pos_x, monster.pos_y, monster.health), (10, 20, 4))
+        self.assertEqual(self.store.column("health").tolist(), [4])
+
+    def test_remove_keeps_other_views_bound(self):
+        """Test that removing a monster moves the last row without breaking its view."""
+        monsters = [make_monster(i * 100, 0, health=i + 1) for i in range(5)]
+        for monster in monsters:
+            self.store.add(monster)
+
+        self.store.remove(monsters[1])
+
+        self.assertEqual(len(self.store), 4)
+        self.assertEqual([monster.health for monster in self.store.views], [1, 5, 3, 4])
+        self.assertEqual(monsters[4].health, 5)
+        # The removed monster keeps its state in a store of its own
+        self.assertEqual((monsters[1].pos_x, monsters[1].health), (100, 2))
+
+    def test_step_moves_towards_the_player(self):
+        """Test that a lonely monster moves like Monster.move would move it."""
+        monster = make_monster(0, 0)
+        self.store.add(monster)
+
+        self.store.step(make_world(100, 100))
+
+        self.assertAlmostEqual(monster.pos_x, 2 / 2 ** 0.5)
+        self.assertAlmostEqual(monster.pos_y, 2 / 2 ** 0.5)
+
+    def test_step_turns_monsters_towards_the_player(self):
+        """Test that the monsters face the player and hand the facing to their sprite."""
+        left, right, above = make_monster(-100, 0), make_monster(100, 0), make_monster(0, -100)
+        for monster in (left, right, above):
+            self.store.add(monster)
+
+        self.store.step(make_world(0, 0))
+
+        self.assertEqual(self.store.column("facing").tolist(), [1, -1, 1])
+        right.sprite.face.assert_called_with(-1)
+
+    def test_step_removes_dead_monsters(self):
+        """Test that monsters without health are removed from the world."""
+        alive, dead = make_monster(0, 0), make_monster(500, 500, health=0)
+        self.store.add(alive)
+        self.store.add(dead)
+        world = make_world(1000, 1000)
+
+        self.store.step(world)
+
+        world.remove_monster.assert_called_once_with(dead)
+
+    def test_step_attacks_players_in_range(self):
+        """Test that only monsters in range whose cooldown elapsed attack the player."""
+        close, far = make_monster(10, 0), make_monster(900, 0)
+        self.store.add(close)
+        self.store.add(far)
+        self.store.column("attack_ready_at")[:] = 0
+        world = make_world(0, 0)
+
+        self.store.step(world)
+        self.store.step(world)
+
+        world.player.take_damage.assert_called_once_with(1)
+
+    def test_step_relocates_far_monsters(self):
+        """Test that a monster beyond the leash reappears on the ring around the player."""
+        near, far = make_monster(1800, 1700), make_monster(0, 0)
+        self.store.add(near)
+        self.store.add(far)
+
+        self.store.step(make_world(1750, 1750))
+
+        distance = ((far.pos_x - 1750) ** 2 + (far.pos_y - 1750) ** 2) ** 0.5
+        self.assertAlmostEqual(distance, MonsterArray.relocation_radius())
+        self.assertLess(abs(near.pos_x - 1800), 3)
+        self.assertEqual(list(self.store.views), [near, far])
+
+    def test_relocated_monsters_stay_out_of_the_view_near_a_corner(self):
+        """Test that with the camera stopped at a corner, the monsters reappear outside the view."""
+        store = MonsterArray()
+        monsters = [make_monster(3400, 3400) for _ in range(200)]
+        for monster in monsters:
+            store.add(monster)
+
+        store.step(make_world(100, 100))
+
+        view = pygame.Rect(0, 0, settings.SCREEN_WIDTH, settings.SCREEN_HEIGHT)
+        relocated = [monster for monster in monsters if monster.pos_x < 3000]
+        self.assertGreater(len(relocated), 190)
+        for monster in monsters:
+            self.assertFalse(view.collidepoint(monster.pos_x, monster.pos_y))
+            self.assertTrue(0 <= monster.pos_x <= settings.WORLD_WIDTH)
+            self.assertTrue(0 <= monster.pos_y <= settings.WORLD_HEIGHT)
+
+
+class TestVectorizedSeparation(unittest.TestCase):
+    def test_matches_scalar_separation(self):
+        """Test that the vectorized forces match the per monster ones in a sparse crowd."""
+        rng = np.random.default_rng(7)
+        pos_x, pos_y = rng.uniform(0, 1000, 60), rng.uniform(0, 1000, 60)
+        monsters = [make_monster(x, y) for x, y in zip(pos_x, pos_y)]
+        crowd = CrowdSeparation(radius=50, max_neighbours=100)
+        crowd.update(monsters)
+
+        force_x, force_y = crowd.separation_forces(pos_x, pos_y)
+
+        for monster, expected_x, expected_y in zip(monsters, force_x, force_y):
+            actual_x, actual_y = crowd.separation_force(monster)
+            self.assertAlmostEqual(actual_x, expected_x)
+            self.assertAlmostEqual(actual_y, expected_y)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,42 @@
+import unittest
+from unittest.mock import MagicMock
+
+from business.entities.monster import Monster
+from business.entities.monster_factory import MonsterFactory
+from business.world.monster_array import MonsterArray
+
+
+class TestMonsterFactory(unittest.TestCase):
+    def setUp(self):
+        self.factory = MonsterFactory()
+        self.world_monsters = MonsterArray()
+
+    def test_dead_monsters_are_spawned_again(self):
+        """Test that a recycled monster is reused for its type, with the stats of a new one."""
+        orc = self.factory.create_monster(10, 10, MagicMock(), "orc")
+        self.world_monsters.add(orc)
+        orc.take_damage(20)
+        self.factory.recycle(orc)
+        self.assertEqual(self.factory.pooled("orc"), 1)
+        self.assertEqual(len(self.world_monsters), 0)
+
+        spawned = self.factory.spawn_monster(300, 400, "orc")
+        self.world_monsters.add(spawned)
+
+        self.assertIs(spawned, orc)
+        self.assertEqual(self.factory.pooled("orc"), 0)
+        self.assertEqual((orc.pos_x, orc.pos_y, orc.health, orc.damage_amount), (300, 400, 20, 2))
+        orc.sprite.reset.assert_called_once()
+        self.assertEqual(list(self.world_monsters.views), [orc])
+
+    def test_free_lists_are_per_type(self):
+        """Test that a dead monster is not reused for another type."""
+        zombie = Monster(0, 0, MagicMock(), 10, 10, 1, 50, "zombie")
+        self.factory.recycle(zombie)
+
+        self.assertEqual(self.factory.pooled("zombie"), 1)
+        self.assertEqual(self.factory.pooled("orc"), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
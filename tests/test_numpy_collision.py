@@ -0,0 +1,89 @@
+import random
+import unittest
+from unittest.mock import MagicMock
+
+import numpy as np
+import pygame
+
+from business.handlers.numpy_collision import NumpyCollisionKernel
+from business.handlers.swept_collision import SweptCollision
+
+
+def make_entity(rect):
+    entity = MagicMock()
+    entity.sprite.rect = rect
+    return entity
+
+
+class TestNumpyCollisionKernel(unittest.TestCase):
+    def test_pack_rects(self):
+        """Test that rects are packed as (left, top, right, bottom) rows."""
+        boxes = NumpyCollisionKernel.pack_rects([make_entity(pygame.Rect(1, 2, 3, 4))])
+
+        np.testing.assert_array_equal(boxes, [[1, 2, 4, 6]])
+
+    def test_pack_rects_empty(self):
+        """Test that an empty entity list packs into an empty (0, 4) array."""
+        self.assertEqual(NumpyCollisionKernel.pack_rects([]).shape, (0, 4))
+
+    def test_touching_edges_do_not_overlap(self):
+        """Test that boxes sharing only an edge are not reported, like colliderect."""
+        a_boxes = np.array([[0, 0, 10, 10]], dtype=float)
+        b_boxes = np.array([[10, 0, 20, 10], [9, 9, 20, 20]], dtype=float)
+
+        a_indices, b_indices = NumpyCollisionKernel.overlapping_pairs(a_boxes, b_boxes)
+
+        self.assertEqual(list(zip(a_indices, b_indices)), [(0, 1)])
+
+    def test_matches_colliderect(self):
+        """Test that the kernel finds exactly the pairs colliderect finds, in the same order."""
+        rng = random.Random(7)
+        a_rects = [pygame.Rect(rng.randint(0, 300), rng.randint(0, 300),
+                               rng.randint(0, 40), rng.randint(0, 40)) for _ in range(60)]
+        b_rects = [pygame.Rect(rng.randint(0, 300), rng.randint(0, 300),
+                               rng.randint(0, 110), rng.randint(0, 100)) for _ in range(80)]
+
+        a_boxes = NumpyCollisionKernel.pack_rects([make_entity(rect) for rect in a_rects])
+        b_boxes = NumpyCollisionKernel.pack_rects([make_entity(rect) for rect in b_rects])
+        a_indices, b_indices = NumpyCollisionKernel.overlapping_pairs(a_boxes, b_boxes)
+
+        expected = [(i, j) for i, a in enumerate(a_rects) for j, b in enumerate(b_rects) if a.colliderect(b)]
+        self.assertEqual(list(zip(a_indices.tolist(), b_indices.tolist())), expected)
+
+    def test_swept_pairs_catch_tunnelling_bullet(self):
+        """Test that a bullet jumping over a thin box in one tick still hits it."""
+        bullet_boxes = np.array([[98, 8, 103, 13]], dtype=float)
+        segments = np.array([[0.5, 10.5, 100.5, 10.5]])
+        b_boxes = np.array([[40, 0, 45, 20], [40, 50, 45, 70]], dtype=float)
+
+        a_indices, b_indices = NumpyCollisionKernel.swept_pairs(bullet_boxes, segments, b_boxes)
+
+        self.assertEqual(list(zip(a_indices.tolist(), b_indices.tolist())), [(0, 0)])
+
+    def test_swept_pairs_match_scalar_test(self):
+        """Test that the vectorized swept test agrees with SweptCollision.bullet_hits."""
+        rng = random.Random(3)
+        bullets, targets = [], []
+        for _ in range(40):
+            bullet = MagicMock()
+            bullet.previous_pos_x, bullet.previous_pos_y = rng.uniform(0, 300), rng.uniform(0, 300)
+            bullet.pos_x = bullet.previous_pos_x + rng.uniform(-60, 60)
+            bullet.pos_y = bullet.previous_pos_y + rng.choice([0, rng.uniform(-60, 60)])
+            bullet.sprite.rect = pygame.Rect(0, 0, 5, 5)
+            bullet.sprite.rect.center = (int(bullet.pos_x), int(bullet.pos_y))
+            bullets.append(bullet)
+        for _ in range(40):
+            targets.append(make_entity(pygame.Rect(rng.randint(0, 300), rng.randint(0, 300),
+                                                   rng.randint(1, 30), rng.randint(1, 100))))
+
+        a_indices, b_indices = NumpyCollisionKernel.swept_pairs(
+            NumpyCollisionKernel.pack_rects(bullets), NumpyCollisionKernel.pack_segments(bullets),
+            NumpyCollisionKernel.pack_rects(targets))
+
+        expected = [(i, j) for i, bullet in enumerate(bullets) for j, target in enumerate(targets)
+                    if SweptCollision.bullet_hits(bullet, target)]
+        self.assertEqual(list(zip(a_indices.tolist(), b_indices.tolist())), expected)
+
+
+if __name__ == '__main__':
+    unittest.main()
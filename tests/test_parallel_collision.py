@@ -0,0 +1,59 @@
+import unittest
+from unittest.mock import patch
+
+import numpy as np
+
+from business.handlers.numpy_collision import NumpyCollisionKernel
+from business.handlers.parallel_collision import ParallelCollisionKernel
+
+
+def random_boxes(rng, count, max_size):
+    corners = rng.uniform(0, 3000, (count, 2))
+    sizes = rng.uniform(1, max_size, (count, 2))
+    return np.column_stack((corners, corners + sizes))
+
+
+@patch("settings.COLLISION_WORKERS", 3)
+@patch("settings.PARALLEL_COLLISION_MIN_ENTITIES", 0)
+class TestParallelCollisionKernel(unittest.TestCase):
+    @classmethod
+    def tearDownClass(cls):
+        ParallelCollisionKernel.shutdown()
+
+    def test_overlapping_pairs_match_numpy_kernel(self):
+        """Test that the stripes find the same pairs, in the same order, as the single process kernel."""
+        rng = np.random.default_rng(3)
+        a_boxes, b_boxes = random_boxes(rng, 500, 60), random_boxes(rng, 800, 60)
+
+        expected = NumpyCollisionKernel.overlapping_pairs(a_boxes, b_boxes)
+        actual = ParallelCollisionKernel.overlapping_pairs(a_boxes, b_boxes)
+
+        self.assertGreater(len(expected[0]), 0)
+        np.testing.assert_array_equal(actual[0], expected[0])
+        np.testing.assert_array_equal(actual[1], expected[1])
+
+    def test_swept_pairs_match_numpy_kernel(self):
+        """Test that bullets crossing stripes during their move are still found."""
+        rng = np.random.default_rng(5)
+        bullet_boxes = random_boxes(rng, 400, 10)
+        starts = bullet_boxes[:, :2] + rng.uniform(-300, 300, (400, 2))
+        segments = np.column_stack((starts, (bullet_boxes[:, :2] + bullet_boxes[:, 2:]) / 2))
+        b_boxes = random_boxes(rng, 600, 60)
+
+        expected = NumpyCollisionKernel.swept_pairs(bullet_boxes, segments, b_boxes)
+        actual = ParallelCollisionKernel.swept_pairs(bullet_boxes, segments, b_boxes)
+
+        self.assertGreater(len(expected[0]), 0)
+        np.testing.assert_array_equal(actual[0], expected[0])
+        np.testing.assert_array_equal(actual[1], expected[1])
+
+    def test_empty_inputs(self):
+        """Test that no pairs are found when a side is empty."""
+        a_indices, b_indices = ParallelCollisionKernel.overlapping_pairs(np.empty((0, 4)), np.ones((3, 4)))
+
+        self.assertEqual(len(a_indices), 0)
+        self.assertEqual(len(b_indices), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
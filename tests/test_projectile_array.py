@@ -0,0 +1,67 @@
+import unittest
+from unittest.mock import MagicMock
+
+import settings
+from business.entities.bullet import Bullet
+from business.world.projectile_array import ProjectileArray
+
+
+class TestProjectileArray(unittest.TestCase):
+    def setUp(self):
+        self.store = ProjectileArray(capacity=2)
+        self.world = MagicMock()
+        self.world.player.damage_amount = 2
+
+    def test_emit_normalizes_each_direction(self):
+        """Test that one bullet is emitted per direction, with unit directions."""
+        self.store.emit(100, 100, [3, 0], [4, -2], speed=5)
+
+        self.assertEqual(len(self.store), 2)
+        self.assertEqual(self.store.column("dir_x").tolist(), [0.6, 0.0])
+        self.assertEqual(self.store.column("dir_y").tolist(), [0.8, -1.0])
+        self.assertTrue(all(isinstance(bullet, Bullet) for bullet in self.store.views))
+
+    def test_step_matches_bullet_update(self):
+        """Test that the vectorized step moves a bullet like Bullet.update does."""
+        self.store.emit(100, 100, 3, 4, speed=5)
+        alone = Bullet(100, 100, 103, 104, 5)
+
+        self.store.step(self.world)
+        alone.update(self.world)
+
+        bullet = self.store.views[0]
+        self.assertEqual((bullet.pos_x, bullet.pos_y), (alone.pos_x, alone.pos_y))
+        self.assertEqual((bullet.previous_pos_x, bullet.previous_pos_y), (100, 100))
+        self.assertEqual(bullet.damage_amount, alone.damage_amount)
+
+    def test_finished_bullets(self):
+        """Test that spent, expired and out of world bullets are reported as finished."""
+        self.store.emit(100, 100, [1, 1, 1, 1], [0, 0, 0, 0], speed=5)
+        spent, expired, outside, flying = self.store.views
+        spent.take_damage(1)
+        self.store.column("lifetime")[expired.row] = 0
+        self.store.column("pos_x")[outside.row] = settings.WORLD_WIDTH + 1
+
+        self.assertEqual(self.store.finished(), [spent, expired, outside])
+        self.assertNotIn(flying, self.store.finished())
+
+    def test_removed_bullets_are_emitted_again(self):
+        """Test that a removed bullet is reused, with a fresh row and a new handle."""
+        self.store.emit(100, 100, 1, 0, speed=5)
+        bullet = self.store.views[0]
+        sprite, handle = bullet.sprite, bullet.handle
+        bullet.take_damage(1)
+        self.store.remove(bullet)
+        self.assertEqual(self.store.pooled, 1)
+
+        self.store.emit(300, 200, 0, 1, speed=7)
+
+        self.assertEqual(list(self.store.views), [bullet])
+        self.assertEqual(self.store.pooled, 0)
+        self.assertIs(bullet.sprite, sprite)
+        self.assertNotEqual(bullet.handle, handle)
+        self.assertEqual((bullet.pos_x, bullet.pos_y, bullet.speed, bullet.health), (300, 200, 7, 1))
+
+
+if __name__ == "__main__":
+    unittest.main()
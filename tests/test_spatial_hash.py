@@ -0,0 +1,57 @@
+import unittest
+from unittest.mock import MagicMock
+
+import pygame
+
+from business.handlers.spatial_hash import SpatialHashGrid
+
+
+class TestSpatialHashGrid(unittest.TestCase):
+    def setUp(self):
+        self.grid = SpatialHashGrid(cell_size=100)
+
+    def test_query_returns_entities_in_overlapped_cells(self):
+        """Test that only entities sharing a cell with the query rect are returned."""
+        near = MagicMock()
+        far = MagicMock()
+        self.grid.insert(near, pygame.Rect(10, 10, 20, 20))
+        self.grid.insert(far, pygame.Rect(510, 510, 20, 20))
+
+        result = self.grid.query(pygame.Rect(50, 50, 10, 10))
+
+        self.assertEqual(result, [near])
+
+    def test_entity_spanning_cells_is_returned_once(self):
+        """Test that an entity stored in several cells is not duplicated."""
+        big = MagicMock()
+        self.grid.insert(big, pygame.Rect(90, 90, 108, 96))
+
+        result = self.grid.query(pygame.Rect(0, 0, 300, 300))
+
+        self.assertEqual(result, [big])
+
+    def test_rect_ending_on_cell_border_stays_in_its_cell(self):
+        """Test that a rect whose right edge lies on a cell border does not leak into the next cell."""
+        entity = MagicMock()
+        self.grid.insert(entity, pygame.Rect(0, 0, 100, 100))
+
+        self.assertEqual(self.grid.query(pygame.Rect(100, 0, 10, 10)), [])
+
+    def test_insert_all_uses_sprite_rects(self):
+        """Test that insert_all buckets entities by their sprite rect."""
+        entity = MagicMock()
+        entity.sprite.rect = pygame.Rect(250, 250, 5, 5)
+        self.grid.insert_all([entity])
+
+        self.assertEqual(self.grid.query(pygame.Rect(240, 240, 20, 20)), [entity])
+
+    def test_clear_removes_every_entity(self):
+        """Test that clear empties the grid."""
+        self.grid.insert(MagicMock(), pygame.Rect(0, 0, 10, 10))
+        self.grid.clear()
+
+        self.assertEqual(self.grid.query(pygame.Rect(0, 0, 10, 10)), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,71 @@
+import random
+import unittest
+from unittest.mock import MagicMock
+
+from business.world.targeting import TargetingService, TargetingStrategy
+
+
+def make_monster(pos_x, pos_y, health=10):
+    monster = MagicMock()
+    monster.pos_x = pos_x
+    monster.pos_y = pos_y
+    monster.health = health
+    return monster
+
+
+class TestTargetingService(unittest.TestCase):
+    def setUp(self):
+        self.service = TargetingService(cell_size=100)
+
+    def test_no_monsters_returns_none(self):
+        """Test that there is no target in an empty world."""
+        self.service.update([])
+
+        self.assertIsNone(self.service.find_target(0, 0))
+
+    def test_nearest_matches_brute_force(self):
+        """Test that the nearest strategy finds the same monster as a linear scan."""
+        rng = random.Random(11)
+        monsters = [make_monster(rng.uniform(0, 3500), rng.uniform(0, 3500)) for _ in range(300)]
+        self.service.update(monsters)
+
+        for _ in range(50):
+            pos_x, pos_y = rng.uniform(0, 3500), rng.uniform(0, 3500)
+            expected = min(monsters, key=lambda m: (m.pos_x - pos_x) ** 2 + (m.pos_y - pos_y) ** 2)
+            self.assertIs(self.service.find_target(pos_x, pos_y), expected)
+
+    def test_nearest_respects_range(self):
+        """Test that a monster beyond the maximum range is not targeted."""
+        self.service.update([make_monster(500, 0)])
+
+        self.assertIsNone(self.service.find_target(0, 0, TargetingStrategy.NEAREST, max_range=300))
+
+    def test_strongest_and_lowest_hp_within_range(self):
+        """Test that health based strategies only consider monsters in range."""
+        weak = make_monster(50, 0, health=2)
+        strong = make_monster(0, 80, health=30)
+        far_strong = make_monster(900, 900, health=100)
+        self.service.update([weak, strong, far_strong])
+
+        self.assertIs(self.service.find_target(0, 0, TargetingStrategy.STRONGEST, max_range=200), strong)
+        self.assertIs(self.service.find_target(0, 0, TargetingStrategy.LOWEST_HP, max_range=200), weak)
+
+    def test_random_within_range(self):
+        """Test that the random strategy picks one of the monsters in range."""
+        near = make_monster(10, 10)
+        self.service.update([near, make_monster(2000, 2000)])
+
+        self.assertIs(self.service.find_target(0, 0, TargetingStrategy.RANDOM, max_range=100), near)
+
+    def test_update_marks_index_stale(self):
+        """Test that the index is rebuilt after the monsters are updated."""
+        self.service.update([make_monster(1000, 1000)])
+        self.service.find_target(0, 0)
+        near = make_monster(5, 5)
+        self.service.update([near])
+
+        self.assertIs(self.service.find_target(0, 0), near)
+
+
+if __name__ == '__main__':
+    unittest.main()
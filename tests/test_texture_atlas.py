@@ -0,0 +1,47 @@
+import unittest
+
+import pygame
+
+from presentation.texture_atlas import TextureAtlas
+
+
+def make_image(width, height, color=(10, 20, 30, 128)):
+    image = pygame.Surface((width, height), pygame.SRCALPHA)  # pylint: disable=E1101
+    image.fill(color)
+    return image
+
+
+class TestTextureAtlas(unittest.TestCase):
+    def setUp(self):
+        self.atlas = TextureAtlas((100, 100))
+
+    def test_images_are_copied_into_shared_pages(self):
+        """Test that the regions hold the exact pixels, translucent ones included, of one page."""
+        first = self.atlas.add("first", make_image(40, 30))
+        second = self.atlas.add("second", make_image(40, 20, (200, 100, 50, 255)))
+
+        self.assertEqual(len(self.atlas.pages), 1)
+        self.assertIs(first.get_parent(), second.get_parent())
+        self.assertEqual(tuple(first.get_at((0, 0))), (10, 20, 30, 128))
+        self.assertEqual(tuple(second.get_at((39, 19))), (200, 100, 50, 255))
+        self.assertIs(self.atlas.region("first"), first)
+        self.assertIs(self.atlas.add("first", make_image(40, 30)), first)
+
+    def test_full_shelves_and_pages_open_new_ones(self):
+        """Test that an image too wide for its shelf goes under it, and to a new page when full."""
+        self.atlas.add("a", make_image(60, 50))
+        below = self.atlas.add("b", make_image(60, 50))
+        next_page = self.atlas.add("c", make_image(60, 50))
+
+        self.assertEqual(below.get_offset(), (0, 50))
+        self.assertEqual(next_page.get_offset(), (0, 0))
+        self.assertEqual(len(self.atlas.pages), 2)
+
+    def test_oversized_images_are_refused(self):
+        """Test that an image bigger than a page raises an error."""
+        with self.assertRaises(ValueError):
+            self.atlas.add("huge", make_image(101, 10))
+
+
+if __name__ == "__main__":
+    unittest.main()